@@ -0,0 +1,46 @@
+import argparse
+import time
+import warnings
+import numpy as np
+import pandas as pd
+from datapack.attributes import Numerical, Categorical
+
+#Discretizes the numerical attribute (att) assigning the interval of each value one row at a time.
+#This is the strategy used by the discretization functions before they were vectorized, kept here as the reference of the benchmark.
+def discretize_row_by_row(att, cut_points):
+    cat_values = att._interval_labels(cut_points)
+    return Categorical([cat_values[np.searchsorted(cut_points,att.data[i])] for i in range(len(att.data))],cat_values)
+
+#Returns the best time (in seconds) of the given number of executions (repeat) of the function (func).
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter()-start)
+    return min(times)
+
+#Prints the number of rows per second discretized before and after the vectorization for each of the given data sizes (rows).
+def main(rows, num_bins, repeat):
+    warnings.simplefilter("ignore")
+    rng = np.random.default_rng(0)
+    print("rows".rjust(10), "method".rjust(10), "before (rows/s)".rjust(18), "after (rows/s)".rjust(18), "speedup".rjust(9))
+    for n in rows:
+        att = Numerical(rng.normal(size=n))
+        cut_points_EW = att.discretizeEW(num_bins)[1]
+        cut_points_EF = att.discretizeEF(num_bins)[1]
+        cases = [("width", lambda: att.discretizeEW(num_bins), cut_points_EW),
+                 ("frequency", lambda: att.discretizeEF(num_bins), cut_points_EF),
+                 ("custom", lambda: att.discretize(cut_points_EF), cut_points_EF)]
+        for name, after, cut_points in cases:
+            t_before = best_time(lambda: discretize_row_by_row(att,cut_points), repeat)
+            t_after = best_time(after, repeat)
+            print(str(n).rjust(10), name.rjust(10), ("%.0f" % (n/t_before)).rjust(18), ("%.0f" % (n/t_after)).rjust(18), ("%.1fx" % (t_before/t_after)).rjust(9))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the discretization functions of the Numerical attribute.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--bins", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.rows, args.bins, args.repeat)
@@ -0,0 +1,43 @@
+import argparse
+import os
+import time
+import warnings
+from generators import make_dataset
+
+#Returns the best time (in seconds) of the given number of executions (repeat) of the operation (operation) on a new data set.
+#The statistics are not cached between executions, since each one works on a new data set.
+def best_time(operation, rows, columns, executor, n_jobs, repeat):
+    times = []
+    for _ in range(repeat):
+        dataset = make_dataset(rows, numerical=columns)
+        dataset.set_executor(executor, n_jobs)
+        start = time.perf_counter()
+        operation(dataset)
+        times.append(time.perf_counter()-start)
+    return min(times)
+
+#Prints the time of each operation applied to every attribute of the data set with each executor and number of jobs, and the speedup with respect to the serial executor.
+def main(rows, columns, jobs, repeat):
+    warnings.simplefilter("ignore")
+    operations = [("summary_att", lambda dataset: dataset.summary_att()),
+                  ("normalize_att", lambda dataset: dataset.normalize_att()),
+                  ("discretize_att", lambda dataset: dataset.discretize_att(5, "frequency")),
+                  ("roc_auc_att", lambda dataset: dataset.roc_auc_att())]
+    print("rows: %d, columns: %d, processors: %d" % (rows, columns, os.cpu_count() or 1))
+    print("operation".rjust(15), "executor".rjust(9), "jobs".rjust(5), "time (s)".rjust(10), "speedup".rjust(9))
+    for name, operation in operations:
+        t_serial = best_time(operation, rows, columns, "serial", None, repeat)
+        print(name.rjust(15), "serial".rjust(9), "1".rjust(5), ("%.3f" % t_serial).rjust(10), "1.0x".rjust(9))
+        for executor in ["thread", "process"]:
+            for n_jobs in jobs:
+                t = best_time(operation, rows, columns, executor, n_jobs, repeat)
+                print(name.rjust(15), executor.rjust(9), str(n_jobs).rjust(5), ("%.3f" % t).rjust(10), ("%.1fx" % (t_serial/t)).rjust(9))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark of the executors used by the operations applied to every attribute of a Dataset.")
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=200)
+    parser.add_argument("--jobs", type=int, nargs="+", default=sorted(set([1, 2, 4, os.cpu_count() or 1])))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    main(args.rows, args.columns, args.jobs, args.repeat)
@@ -0,0 +1,94 @@
+import os
+import numpy as np
+from datapack.dataset import Dataset
+from generators import CLASS_NAME
+from import_time import import_module
+
+### CASE CLASS. Operation measured by the benchmark suite.
+### The setup function (setup) receives the synthetic pd.DataFrame and a temporary directory and returns the state passed to the measured function (run). It is called before every execution and is not measured,
+### so every execution works on a new data set and the statistics cached by previous executions don't hide the cost of the operation.
+class Case():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self, name, group, setup, run):
+        self.name = name
+        self.group = group
+        self.setup = setup
+        self.run = run
+
+#Returns a new data set built from the given pd.DataFrame (frame), with the class attribute set.
+def _dataset(frame, path=None):
+    return Dataset(frame, CLASS_NAME)
+
+#Returns the name of the first numerical attribute of the given data set (dataset).
+def _first_numerical(dataset):
+    return [key for key, value in dataset.attributes.items() if type(value).__name__ == "Numerical"][0]
+
+#Number of numerical attributes kept by the Kendall correlation case, whose cost grows with the square of the number of attributes.
+KENDALL_ATTRIBUTES = 4
+
+#Returns a new data set built from the given pd.DataFrame (frame) where a different tenth of the values of each numerical attribute is missing, so the correlations are computed over the pairwise-complete instances.
+def _missing_dataset(frame, path=None):
+    frame = frame.copy()
+    rng = np.random.default_rng(0)
+    for key in frame.columns:
+        if frame[key].dtype == float:
+            frame.loc[rng.random(len(frame)) < 0.1, key] = np.nan
+    return Dataset(frame, CLASS_NAME)
+
+#Returns a new data set with missing values (see _missing_dataset) built from the class and the first numerical attributes (see KENDALL_ATTRIBUTES) of the given pd.DataFrame (frame).
+def _kendall_dataset(frame, path=None):
+    keys = [key for key in frame.columns if frame[key].dtype == float][:KENDALL_ATTRIBUTES]
+    return _missing_dataset(frame[keys + [CLASS_NAME]])
+
+#Returns the path of a csv file with the given pd.DataFrame (frame) in the given directory (path).
+def _csv(frame, path):
+    file = os.path.join(path, "data.csv")
+    if not os.path.exists(file):
+        frame.to_csv(file, index=False)
+    return file
+
+#Returns the path of a directory with the given pd.DataFrame (frame) written in the binary format of Dataset.to_binary in the given directory (path).
+def _binary(frame, path):
+    directory = os.path.join(path, "data.bin")
+    if not os.path.exists(directory):
+        _dataset(frame).to_binary(directory)
+    return directory
+
+#Operations measured by the benchmark suite, grouped by the part of the library they belong to.
+CASES = [
+    Case("import_dataset", "import", lambda frame, path: "datapack.dataset", import_module),
+    Case("construction", "io", lambda frame, path: frame, lambda frame: Dataset(frame, CLASS_NAME)),
+    Case("from_csv", "io", _csv, lambda file: Dataset().from_csv(file, c=CLASS_NAME)),
+    Case("from_csv_chunks", "io", _csv, lambda file: Dataset().from_csv(file, c=CLASS_NAME, chunksize=50000)),
+    Case("to_csv", "io", lambda frame, path: (_dataset(frame), os.path.join(path, "out.csv")), lambda state: state[0].to_csv(state[1])),
+    Case("to_binary", "io", lambda frame, path: (_dataset(frame), os.path.join(path, "out.bin")), lambda state: state[0].to_binary(state[1])),
+    Case("from_binary", "io", _binary, lambda directory: Dataset().from_binary(directory)),
+    Case("summary_att", "statistics", _dataset, lambda dataset: dataset.summary_att()),
+    Case("mean_att", "statistics", _dataset, lambda dataset: dataset.mean_att()),
+    Case("median_att", "statistics", _dataset, lambda dataset: dataset.median_att()),
+    Case("median_att_approx", "statistics", _dataset, lambda dataset: dataset.median_att(approx=True)),
+    Case("variance_att", "statistics", _dataset, lambda dataset: dataset.variance_att()),
+    Case("mode_att", "statistics", _dataset, lambda dataset: dataset.mode_att()),
+    Case("entropy_att", "statistics", _dataset, lambda dataset: dataset.entropy_att()),
+    Case("null_count_att", "statistics", _dataset, lambda dataset: dataset.null_count_att()),
+    Case("groupby_stats", "statistics", _dataset, lambda dataset: dataset.groupby_stats()),
+    Case("fpr_tpr", "supervised", _dataset, lambda dataset: dataset.fpr_tpr(_first_numerical(dataset))),
+    Case("roc_auc_att", "supervised", _dataset, lambda dataset: dataset.roc_auc_att()),
+    Case("score_att_point_biserial", "supervised", _dataset, lambda dataset: dataset.score_att("point_biserial")),
+    Case("score_att_anova_f", "supervised", _dataset, lambda dataset: dataset.score_att("anova_f")),
+    Case("score_att_info_gain", "supervised", _dataset, lambda dataset: dataset.score_att("info_gain")),
+    Case("correlation_att_pearson", "correlation", _dataset, lambda dataset: dataset.correlation_att("pearson")),
+    Case("correlation_att_spearman", "correlation", _dataset, lambda dataset: dataset.correlation_att("spearman")),
+    Case("correlation_att_kendall", "correlation", _kendall_dataset, lambda dataset: dataset.correlation_att("kendall")),
+    Case("correlation_att_pearson_missing", "correlation", _missing_dataset, lambda dataset: dataset.correlation_att("pearson")),
+    Case("norm_mutual_info_att", "correlation", _dataset, lambda dataset: dataset.norm_mutual_info_att()),
+    Case("discretize_att_width", "transformation", _dataset, lambda dataset: dataset.discretize_att(5, "width")),
+    Case("discretize_att_frequency", "transformation", _dataset, lambda dataset: dataset.discretize_att(5, "frequency")),
+    Case("normalize_att", "transformation", _dataset, lambda dataset: dataset.normalize_att()),
+    Case("standarize_att", "transformation", _dataset, lambda dataset: dataset.standarize_att()),
+    Case("filter_by_variance", "transformation", _dataset, lambda dataset: dataset.filter_by("variance", "gt", 0.5)),
+    Case("filter_by_auc", "transformation", _dataset, lambda dataset: dataset.filter_by("auc", "gt", 0.5)),
+    Case("select_rows", "rows", _dataset, lambda dataset: dataset.select_rows(np.arange(0, dataset.get_number_instances(), 2)).to_dataframe()),
+    Case("append_rows", "rows", lambda frame, path: (_dataset(frame), frame.iloc[:1000]), lambda state: [state[0].append_rows(state[1]) for _ in range(10)]),
+]
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+from datapack.dataset import Dataset
+
+#Name of the boolean class attribute of the synthetic data sets.
+CLASS_NAME = "class"
+
+#Returns a synthetic pd.DataFrame with the given number of rows (rows) and of numerical, string, categorical and boolean attributes (numerical, string, categorical, boolean), plus a boolean class attribute.
+#The string and categorical attributes take the given number of distinct values (cardinality), and the given fraction of the values of every attribute but the class is missing (missing).
+#The numerical attributes are shifted for the instances of the positive class, so that the supervised scores are not trivial. The data only depends on the seed (seed).
+def make_frame(rows, numerical=10, string=0, categorical=0, boolean=0, cardinality=10, missing=0.0, seed=0):
+    rng = np.random.default_rng(seed)
+    labels = rng.random(rows) > 0.5
+    values = np.array(["v" + str(i) for i in range(cardinality)], dtype=object)
+    columns = dict()
+    for i in range(numerical):
+        columns["x" + str(i)] = rng.normal(size=rows)+labels*rng.normal(scale=0.5)
+    for i in range(string):
+        columns["s" + str(i)] = values[rng.integers(0, cardinality, rows)]
+    for i in range(categorical):
+        columns["c" + str(i)] = pd.Categorical.from_codes(rng.integers(0, cardinality, rows), values)
+    for i in range(boolean):
+        columns["b" + str(i)] = rng.random(rows) > 0.5
+    frame = pd.DataFrame(columns)
+    if missing > 0:
+        for key in frame.columns:
+            mask = rng.random(rows) < missing
+            if frame[key].dtype == bool:
+                frame[key] = frame[key].astype("boolean")
+            frame.loc[mask, key] = np.nan if frame[key].dtype == float else None
+    frame[CLASS_NAME] = labels
+    return frame
+
+#Returns a data set built from a synthetic pd.DataFrame (see make_frame) with the class attribute set.
+def make_dataset(rows, numerical=10, string=0, categorical=0, boolean=0, cardinality=10, missing=0.0, seed=0):
+    return Dataset(make_frame(rows, numerical, string, categorical, boolean, cardinality, missing, seed), CLASS_NAME)
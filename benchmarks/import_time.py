@@ -0,0 +1,63 @@
+import argparse
+import os
+import subprocess
+import sys
+import pandas as pd
+
+#Optional libraries that the core modules of the package must not load when they are imported (they are only needed by the plots and by Dataset.print_dataset).
+OPTIONAL = ("matplotlib", "seaborn", "IPython")
+
+#Core modules of the package, which are imported by the batch workers that only compute statistics.
+CORE = ("datapack.dataset", "datapack.lazy")
+
+#Directory that holds the package, added to the path of the new interpreters.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+#Returns the output of a new interpreter that runs the given code (code) with the given options (options), with the package in its path.
+def _python(code, options=()):
+    env = dict(os.environ)
+    env["PYTHONPATH"] = ROOT + os.pathsep + env.get("PYTHONPATH", "")
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, env=env, check=True)
+
+#Imports the given module (module) in a new interpreter. It is used by the benchmark suite to measure the startup of a process that imports the package.
+def import_module(module):
+    _python("import " + module)
+
+#Returns the modules imported by a new interpreter when it imports the given module (module), as measured by python -X importtime.
+#The result is a pd.DataFrame indexed by module, with the time spent importing it alone (self) and including the modules it imports (cumulative), in seconds.
+def import_times(module):
+    rows = []
+    for line in _python("import " + module, ("-X", "importtime")).stderr.splitlines():
+        fields = line.split("|")
+        if line.startswith("import time:") and fields[0].split(":")[1].strip().isdigit():
+            rows.append([fields[2].strip(), int(fields[0].split(":")[1])/1e6, int(fields[1])/1e6])
+    return pd.DataFrame(rows, columns=["module", "self", "cumulative"]).drop_duplicates("module").set_index("module")
+
+#Returns the optional libraries (see OPTIONAL) loaded by a new interpreter when it imports the given module (module).
+def optional_modules(module):
+    code = "import sys, " + module + "; print(' '.join(sorted({name.split('.')[0] for name in sys.modules} & set(" + repr(OPTIONAL) + "))))"
+    return _python(code).stdout.split()
+
+#Prints the minimum cumulative import time of each core module over the given number of new interpreters (repeat), its slowest imports and the optional libraries it loads.
+#The exit code is 1 if a core module loads an optional library and fail=True, so the check can be used to block changes that make the core heavier.
+def main(modules, repeat, top, fail):
+    loaded = False
+    for module in modules:
+        times = [import_times(module) for _ in range(repeat)]
+        best = min(times, key=lambda result: result.loc[module, "cumulative"])
+        optional = optional_modules(module)
+        loaded = loaded or len(optional) > 0
+        print(module.ljust(30), ("%.4f s" % best.loc[module, "cumulative"]).rjust(12), "optional libraries: " + (", ".join(optional) if len(optional) > 0 else "none"))
+        print(best.sort_values("cumulative", ascending=False).iloc[1:top+1].to_string(float_format=lambda value: "%.4f" % value))
+        print()
+    if fail and loaded:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import time of the core modules of the package, measured with python -X importtime in new interpreters.")
+    parser.add_argument("--modules", nargs="+", default=list(CORE))
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest imports shown for each module.")
+    parser.add_argument("--fail-on-optional", action="store_true", help="Exit with code 1 if a module loads matplotlib, seaborn or IPython.")
+    args = parser.parse_args()
+    main(args.modules, args.repeat, args.top, args.fail_on_optional)
@@ -0,0 +1,113 @@
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+import numpy as np
+import pandas as pd
+from generators import make_frame
+from cases import CASES
+
+#Sizes of the synthetic data sets used by each preset of the suite.
+PRESETS = {
+    "quick": [{"rows": 10000, "numerical": 20, "string": 5, "categorical": 5, "boolean": 2, "cardinality": 10, "missing": 0.0}],
+    "full": [{"rows": 100000, "numerical": 50, "string": 10, "categorical": 10, "boolean": 5, "cardinality": 20, "missing": 0.0},
+             {"rows": 100000, "numerical": 50, "string": 10, "categorical": 10, "boolean": 5, "cardinality": 1000, "missing": 0.05},
+             {"rows": 1000000, "numerical": 10, "string": 2, "categorical": 2, "boolean": 1, "cardinality": 20, "missing": 0.0}],
+}
+
+#Ratio between the current and the baseline time above which a case is reported as a regression (and below whose inverse it is reported as an improvement).
+THRESHOLD = 1.2
+
+#Returns the key that identifies the given case (name) and size of the data set (params) in the results.
+def case_key(name, params):
+    return name + "[" + ",".join(key + "=" + str(value) for key, value in params.items()) + "]"
+
+#Returns the description of the environment where the suite runs: versions of Python and of the libraries, machine and current commit.
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"python": platform.python_version(), "numpy": np.__version__, "pandas": pd.__version__, "machine": platform.machine(),
+            "processor": platform.processor(), "cpus": os.cpu_count(), "commit": commit, "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+#Returns the times (in seconds) of the given number of executions (repeat) of the case (case) on the given pd.DataFrame (frame).
+#Each execution runs on a new state returned by the setup function of the case, which is not measured.
+def measure(case, frame, path, repeat):
+    times = []
+    for _ in range(repeat):
+        state = case.setup(frame, path)
+        start = time.perf_counter()
+        case.run(state)
+        times.append(time.perf_counter()-start)
+    return times
+
+#Runs the cases whose name matches any of the given patterns (patterns) on the data sets of the given sizes (sizes) and returns the results.
+#The minimum time of the executions is used to compare results, since it is the least affected by the noise of the machine.
+def run(sizes, patterns, repeat, verbose=True):
+    warnings.simplefilter("ignore")
+    results = {"environment": environment(), "repeat": repeat, "cases": dict()}
+    cases = [case for case in CASES if any(fnmatch.fnmatch(case.name, pattern) for pattern in patterns)]
+    for params in sizes:
+        frame = make_frame(**params)
+        with tempfile.TemporaryDirectory() as path:
+            for case in cases:
+                times = measure(case, frame, path, repeat)
+                key = case_key(case.name, params)
+                results["cases"][key] = {"name": case.name, "group": case.group, "params": params, "min": min(times), "median": float(np.median(times)), "rows_per_second": params["rows"]/min(times)}
+                if verbose:
+                    print(key.ljust(110), ("%.4f s" % min(times)).rjust(12))
+    return results
+
+#Returns the comparison between the results of a baseline (baseline) and the current results (current) of the cases that appear in both, as a pd.DataFrame.
+#A case is a regression if it is slower than the baseline by more than the given ratio (threshold), and an improvement if it is faster by more than the same ratio.
+def compare(baseline, current, threshold=THRESHOLD):
+    rows = []
+    for key, result in current["cases"].items():
+        if key in baseline["cases"]:
+            ratio = result["min"]/baseline["cases"][key]["min"]
+            status = "regression" if ratio > threshold else "improvement" if ratio < 1/threshold else "unchanged"
+            rows.append([key, baseline["cases"][key]["min"], result["min"], ratio, status])
+    return pd.DataFrame(rows, columns=["case", "baseline (s)", "current (s)", "ratio", "status"]).set_index("case")
+
+#Prints the report of the comparison (report) between a baseline and the current results, with the environments where both were obtained.
+def print_report(report, baseline, current):
+    print()
+    print("baseline:", json.dumps(baseline["environment"]))
+    print("current: ", json.dumps(current["environment"]))
+    print(report.to_string(float_format=lambda value: "%.4f" % value))
+    print()
+    print(", ".join("%d %s" % (count, status) for status, count in report["status"].value_counts().items()))
+
+#Runs the suite, saves the results if a file is given (save) and compares them with a baseline if a file is given (compare_to).
+#The exit code is 1 if a regression is found and fail=True, so the suite can be used to block changes that make the library slower.
+def main(preset, patterns, repeat, save, compare_to, threshold, fail):
+    current = run(PRESETS[preset], patterns, repeat)
+    if save is not None:
+        with open(save, "w") as file:
+            json.dump(current, file, indent=1)
+    if compare_to is not None:
+        with open(compare_to) as file:
+            baseline = json.load(file)
+        report = compare(baseline, current, threshold)
+        print_report(report, baseline, current)
+        if fail and (report["status"] == "regression").any():
+            sys.exit(1)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark suite of the operations of the Dataset and Attribute classes on synthetic data sets.")
+    parser.add_argument("--preset", choices=sorted(PRESETS.keys()), default="quick", help="Sizes of the synthetic data sets.")
+    parser.add_argument("--cases", nargs="+", default=["*"], help="Patterns (fnmatch) of the names of the cases to run.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--save", help="File where the results are saved (JSON).")
+    parser.add_argument("--compare", help="File with the results of a baseline (JSON) to compare with.")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--fail-on-regression", action="store_true")
+    args = parser.parse_args()
+    main(args.preset, args.cases, args.repeat, args.save, args.compare, args.threshold, args.fail_on_regression)
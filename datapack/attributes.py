@@ -1,15 +1,114 @@
 import pandas as pd
 import numpy as np
-import math
 import warnings
+from . import metrics
+from . import profiling
+from . import sketches
+from .buffers import ColumnBuffer
+
+#Number of values processed at once by the block-wise functions of memory-mapped numerical attributes.
+BLOCK_SIZE = 2**20
+
+#Summary statistics that can be computed for numerical and for non-numerical attributes.
+NUMERICAL_STATS = ("count","mean","median","variance")
+NOMINAL_STATS = ("count","mode","entropy")
+
+#Returns the requested summary statistics (stats) of a non-numerical attribute given its distinct values (values) and their number of appearances (counts).
+#When several values are tied for the mode, the lowest one is returned. The mode is a missing value (NaN) if every value is missing.
+def _describe_counts(values,counts,stats):
+    summary = dict()
+    if "count" in stats:
+        summary["count"] = int(counts.sum())
+    if "mode" in stats:
+        summary["mode"] = min(values[counts == counts.max()]) if counts.sum() > 0 else np.NaN
+    if "entropy" in stats:
+        summary["entropy"] = metrics.entropy(counts)
+    return summary
+
+#Returns the smallest integer type that holds the codes of a categorical attribute with the given number of possible values (n), following the rule of pd.Categorical.
+def _code_dtype(n):
+    for dtype in (np.int8,np.int16,np.int32):
+        if n < np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+#Returns True if all the values of the given pd.Series (data) that are not missing are strings.
+#The values are checked in a single vectorized pass (pd.api.types.infer_dtype) instead of calling type() on each of them.
+def _is_string(data):
+    return pd.api.types.infer_dtype(data,skipna=True) in ("string","empty")
+
+#Returns True if the given pd.Series (data) has one of the accepted data types: numerical, bool or str.
+def _is_valid(data):
+    return data.dtype == int or data.dtype == float or _is_boolean(data) or _is_string(data)
+
+#Returns True if the given pd.Series (data) has a boolean type, with (pandas "boolean" type) or without (bool) missing values.
+def _is_boolean(data):
+    return data.dtype == bool or isinstance(data.dtype,pd.BooleanDtype)
+
+#Returns the given pd.Series (data) with the pandas "boolean" type if it holds booleans and missing values in an object array (as read from a csv file), or unchanged otherwise.
+def _as_boolean(data):
+    if data.dtype == object and pd.api.types.infer_dtype(data,skipna=True) == "boolean":
+        return data.astype("boolean")
+    return data
+
+#Returns the requested summary statistics (stats) of a non-numerical attribute given the number of appearances of each value (value_counts, a pd.Series indexed by the values).
+#The number of appearances is returned too (as "value_counts"), so that it is cached and can be updated when new values are appended.
+def _describe_value_counts(value_counts,stats):
+    summary = _describe_counts(value_counts.index.to_numpy(),value_counts.to_numpy(dtype=np.int64),stats)
+    summary["value_counts"] = value_counts
+    return summary
+
+#Returns the cached statistics (stats) of a non-numerical attribute updated with the given appended values (values).
+#The count, mode and entropy are computed again from the merged number of appearances of each value, if it was cached. The number of missing values is increased.
+def _merge_value_counts(stats,values):
+    value_counts = values.value_counts().astype(np.int64)
+    merged = dict()
+    if "value_counts" in stats:
+        merged = _describe_value_counts(stats["value_counts"].add(value_counts,fill_value=0).astype(np.int64),[stat for stat in NOMINAL_STATS if stat in stats])
+    if "null_count" in stats:
+        merged["null_count"] = stats["null_count"]+len(values)-int(value_counts.sum())
+    if "sketch" in stats:
+        merged["sketch"] = stats["sketch"].copy().update(values)
+    return merged
+
+#Returns a frequency sketch (see sketches.FrequentItemsSketch) of the values of the given non-numerical attribute (att) that are not missing, with the given number of counters (capacity).
+#If no capacity is given, the sketch with the default number of counters is taken from the cache of the attribute, where it is updated when new values are appended. A copy is returned, so it can be merged without changing the cache.
+def _nominal_sketch(att,capacity):
+    if capacity is None:
+        return att._cached_stats(["sketch"],lambda stats: {"sketch":sketches.FrequentItemsSketch().update(att.data)})["sketch"].copy()
+    return sketches.FrequentItemsSketch(capacity).update(att.data)
+
+#Returns a new attribute of the given class (cls) holding the given data (data), which must have been validated beforehand.
+#The data must not be shared with other objects, since the attribute may modify it in place.
+def _from_validated(cls,data):
+    att = cls()
+    att.data = data
+    att.length = len(data)
+    return att
 
 ### GENERIC ATTRIBUTE CLASS
+### The statistics of the attribute are cached until its data is modified through one of its methods. Each modification increases the version of the attribute.
+### The data given to the attribute is not copied: the attribute shares its buffer with the caller and copies it the first time it is modified in place (copy-on-write).
+### The type of the data is checked once on construction, unless validate=False is given for data that is known to be valid.
+### Missing values (NaN, None or pd.NA) are accepted in any attribute: they are marked by a validity mask and skipped by the statistics.
+### An attribute can also be a view of some rows of another attribute (see _select): its data is only gathered from the other attribute the first time it is used.
+### New values can be appended to the attribute (see append_values). They are stored in growable buffers and the data is only rebuilt from the buffers the first time it is used.
+@profiling.instrument
 class Attribute():
     
     ###################CONSTRUCTOR FUNCTION####################
-    def __init__(self,*args):
+    def __init__(self,*args,validate=True):
+        self._view=None
+        self._buffers=None
+        self._buffers_version=None
+        self._appended=False
         self.data=None
         self.length=0
+        self._version=0
+        self._stats=dict()
+        self._hits=0
+        self._misses=0
+        self._shared=False
         if len(args) == 1:
             if isinstance(args[0],pd.Series):
                 self.data = args[0]
@@ -17,40 +116,101 @@ class Attribute():
                 self.data = pd.Series(args[0])
             else:
                 raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-            if self.data.dtype != int and self.data.dtype != float and self.data.dtype != bool and self.data[self.data.apply(type) != str].count() > 0:
+            if validate and not _is_valid(self.data):
                 self.data=None
                 raise NameError("Accepted data types are: numerical, bool, str. The attribute data can only contain one data type.")
             self.length=len(self.data)
+            self._shared=True
         elif len(args)!=0:
             raise NameError("Too many parameters.")
 
     ####################SETTERS#######################
     
     #Initializes the data of the attribute according to the input array-like parameter (d).
-    def set_data(self,d):
+    #The type of the data is not checked if validate=False.
+    def set_data(self,d,validate=True):
         self.data=None
         self.length=0
+        self._invalidate()
         if isinstance(d,pd.Series):
             self.data = d
         elif isinstance(d,(np.ndarray,list)):
             self.data = pd.Series(d)
         else:
             raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-        if self.data.dtype != int and self.data.dtype != float and self.data.dtype != bool and self.data[self.data.apply(type) != str].count() > 0:
+        if validate and not _is_valid(self.data):
             self.data=None
             raise NameError("Accepted data types are: numerical, bool, str. The attribute data can only contain one data type.")
         self.length=len(self.data)
+        self._shared=True
 
     ###################GETTERS###################
 
+    #Data of the attribute. If the attribute is a view, the selected rows are gathered from the data of the viewed attribute when the data is used for the first time.
+    #If new values have been appended, the data is rebuilt from the buffers that hold them without copying the buffers.
+    @property
+    def data(self):
+        if self._view is not None:
+            base, rows = self._view
+            self._view = None
+            self._data = pd.Series(base.values.take(rows))
+            self._shared = False
+        elif self._appended:
+            self._appended = False
+            self._data = self._from_physical([buffer.get_values() for buffer in self._buffers])
+        return self._data
+
+    @data.setter
+    def data(self,value):
+        self._view = None
+        self._appended = False
+        self._data = value
+
     #Returns the data of the attribute.
     def get_data(self):
         return self.data
 
+    #Returns True if the attribute is a view whose data has not been gathered yet.
+    def is_view(self):
+        return self._view is not None
+
     #Returns the number of values in the attribute.
     def get_number_values(self):
         return self.length
 
+    #Returns the version of the data of the attribute, which increases every time the data is modified.
+    def get_version(self):
+        return self._version
+
+    #Returns the number of hits and misses of the statistics cache of the attribute, the current version and the statistics currently cached.
+    def get_cache_info(self):
+        return {"version":self._version,"hits":self._hits,"misses":self._misses,"cached":list(self._stats.keys())}
+
+    #Returns a boolean array that marks the values of the attribute that are not missing.
+    def get_valid(self):
+        valid = self._mask()
+        return np.ones(self.length,dtype=bool) if valid is None else valid
+
+    #Returns the number of missing values in the attribute.
+    def null_count(self):
+        return self._cached_stats(["null_count"],lambda stats: {"null_count": self._null_count()})["null_count"]
+
+    #Returns the validity mask of the attribute (True for the values that are not missing), or None if no value is missing.
+    #Integer and bool data can't hold missing values, so they are not checked.
+    def _mask(self):
+        if self.data.dtype == int or self.data.dtype == bool:
+            return None
+        elif self.data.dtype == float:
+            valid = ~np.isnan(self.data.to_numpy())
+        else:
+            valid = self.data.notna().to_numpy()
+        return None if valid.all() else valid
+
+    #Computes the number of missing values in the attribute.
+    def _null_count(self):
+        valid = self._mask()
+        return 0 if valid is None else int(self.length-np.count_nonzero(valid))
+
     #Returns the value in the specified index (ind).
     def get_value(self,ind):
         if(type(ind)==int and ind>=0 and ind<self.length):
@@ -63,9 +223,129 @@ class Attribute():
     #Updates the value in the specified index (ind).
     def update_value(self,ind,val):
         if(type(ind)==int and ind>=0 and ind<self.length):
+            self._own()
             self.data[ind]=val
+            self._invalidate()
         else:
             raise NameError("Index must be an integer between 0 and the total number of values.")
+
+    #Updates the values in the given positions (indices) with the given values (values).
+    #The whole batch is checked at once and written with a single assignment. When a position appears more than once, its last value is kept.
+    def update_values(self,indices,values):
+        indices, values = self._check_update(indices,values)
+        self._apply_update(indices,values)
+
+    #Returns the positions (indices) and values (values) of a batch update as arrays without repeated positions, after checking the positions and the type of the values.
+    def _check_update(self,indices,values):
+        indices = np.asarray(indices)
+        values = self._check_values(values)
+        if indices.ndim != 1 or len(indices) != len(values):
+            raise NameError("The positions and the new values must be one-dimensional and have the same length.")
+        if len(indices) > 0 and (not np.issubdtype(indices.dtype,np.integer) or indices.min() < 0 or indices.max() >= self.length):
+            raise NameError("Index must be an integer between 0 and the total number of values.")
+        #The first occurrence of each position in the reversed batch is its last value.
+        unique, first = np.unique(indices[::-1],return_index=True)
+        if len(unique) < len(indices):
+            last = np.sort(len(indices)-1-first)
+            indices, values = (indices[last],values[last])
+        return (indices,values)
+
+    #Returns the given new values (values) as an array, checking that they have one of the accepted data types.
+    def _check_values(self,values):
+        values = pd.Series(values)
+        if not _is_valid(values):
+            raise NameError("Accepted data types are: numerical, bool, str. The attribute data can only contain one data type.")
+        return values.to_numpy()
+
+    #Writes the given values (values) in the given positions (indices), which must have been checked beforehand.
+    def _apply_update(self,indices,values):
+        if len(indices) > 0:
+            self._own()
+            self.data.iloc[indices] = values
+            self._invalidate()
+
+    #Appends the given values (values) at the end of the attribute, checking their type as a whole.
+    #The values are stored in growable buffers whose capacity is doubled when they get full, so appending costs amortized O(1) per value.
+    #The cached statistics that can be updated with the new values alone (count, mean and variance, and the number of appearances of each value) are updated instead of being discarded.
+    def append_values(self,values):
+        self._apply_append(self._check_values(values))
+
+    #Appends the given values (values), which must have been checked beforehand.
+    def _apply_append(self,values):
+        if len(values) == 0:
+            return
+        #The buffers are created again from the data if the data was modified after the last append.
+        if self._buffers is None or self._buffers_version != self._version:
+            self._buffers = []
+            for array in self._physical():
+                buffer = ColumnBuffer(array.dtype,2*(len(array)+len(values)))
+                buffer.append(array)
+                self._buffers.append(buffer)
+        for buffer, array in zip(self._buffers,self._physical_batch(values)):
+            buffer.append(array)
+        stats = self._stats
+        self._invalidate()
+        self._stats = self._merge_stats(stats,values)
+        self._buffers_version = self._version
+        self.length += len(values)
+        self._appended = True
+        self._shared = False
+
+    #Returns the arrays that hold the data of the attribute in the buffers.
+    def _physical(self):
+        return [self.data.to_numpy()]
+
+    #Returns the arrays that hold the given checked values (values) in the buffers.
+    def _physical_batch(self,values):
+        return [np.asarray(values)]
+
+    #Returns the data of the attribute built from the given arrays of the buffers (arrays).
+    def _from_physical(self,arrays):
+        return pd.Series(arrays[0])
+
+    #Returns the cached statistics (stats) updated with the given appended values (values). The statistics that can't be updated are discarded.
+    def _merge_stats(self,stats,values):
+        return dict()
+
+    #Marks the data of the attribute as modified, increasing its version and discarding the cached statistics.
+    #Modifying the data directly (without using the methods of the attribute) does not invalidate the cache.
+    def _invalidate(self):
+        self._version += 1
+        self._stats = dict()
+
+    #Copies the data of the attribute if its buffer is shared with other objects, so that it can be modified in place without changing them.
+    #Memory-mapped data is never copied: it is modified through the map.
+    def _own(self):
+        if self._shared and not isinstance(self.data.values,np.memmap):
+            self.data = self.data.copy()
+        self._shared = False
+
+    #Returns a new attribute of the same class with the values of the attribute in the given positions (rows), which must be a valid integer array.
+    #The new attribute is a view: it keeps the positions and a reference to the data of this attribute, which is marked as shared so that it is copied before being modified in place.
+    #The values are not validated again, and the possible values of categorical attributes are kept.
+    def _select(self,rows):
+        att = type(self)()
+        if self._view is not None:
+            base, base_rows = self._view
+            att._view = (base,base_rows[rows])
+        else:
+            att._view = (self.data,rows)
+            self._share()
+        att.length = len(rows)
+        return att
+
+    #Marks the buffer of the data of the attribute as shared with other objects (for example, a pd.DataFrame returned without copying).
+    def _share(self):
+        self._shared = True
+
+    #Returns the requested statistics (stats), taking the ones that are cached and computing the rest together with the given function (compute).
+    def _cached_stats(self,stats,compute):
+        missing = [stat for stat in stats if stat not in self._stats]
+        self._hits += len(stats)-len(missing)
+        self._misses += len(missing)
+        if len(missing) > 0:
+            self._stats.update(compute(missing))
+        return {stat: self._stats[stat] for stat in stats}
     
     #Prints the data of the attribute.
     def print_data(self):
@@ -73,10 +353,11 @@ class Attribute():
         print(self.data)
 
 ### NUMERICAL ATTRIBUTE CLASS (inherits ATTRIBUTE)
+@profiling.instrument
 class Numerical(Attribute):
     
     ###################CONSTRUCTOR FUNCTION####################
-    def __init__(self,*args):
+    def __init__(self,*args,validate=True):
         if len(args) == 1:
             if isinstance(args[0],pd.Series):
                 data = args[0]
@@ -84,9 +365,9 @@ class Numerical(Attribute):
                 data = pd.Series(args[0])
             else:
                 raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-            if data.dtype != int and data.dtype != float:
+            if validate and data.dtype != int and data.dtype != float:
                 raise NameError("Numerical attribute must be numerical type.")
-            Attribute.__init__(self,data)
+            Attribute.__init__(self,data,validate=False)
         elif len(args) == 0:
             Attribute.__init__(self)
         else:
@@ -95,36 +376,150 @@ class Numerical(Attribute):
     ###################SETTERS####################
     
     #Initializes the data of the numerical attribute according to the input array-like parameter (d).
-    def set_data(self,d):
+    #The type of the data is not checked if validate=False.
+    def set_data(self,d,validate=True):
         if isinstance(d,pd.Series):
             data = d
         elif isinstance(d,(np.ndarray,list)):
             data = pd.Series(d)
         else:
             raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-        if data.dtype != int and data.dtype != float:
+        if validate and data.dtype != int and data.dtype != float:
                 raise NameError("Numerical attribute must be numerical type.")
-        Attribute.set_data(self,data)
+        Attribute.set_data(self,data,validate=False)
 
     ##############################################
 
     #Updates the value in the specified index (ind).
+    #The cached mean and variance are adjusted to the new value instead of being discarded.
     def update_value(self,ind,val):
         if(isinstance(val,int) or isinstance(val,float)):
+            old = self.get_value(ind)
+            stats = self._stats
             Attribute.update_value(self,ind,val)
+            #The moments can only be adjusted when neither value is missing, so that the number of values doesn't change.
+            if not np.isnan(old) and not np.isnan(val):
+                if "mean" in stats and "variance" in stats:
+                    count = stats["count"] if "count" in stats else self.length-(stats["null_count"] if "null_count" in stats else self._null_count())
+                    self._stats["mean"], self._stats["variance"] = metrics.replace_moments(stats["mean"],stats["variance"],count,old,val)
+                for stat in ("count","null_count"):
+                    if stat in stats:
+                        self._stats[stat] = stats[stat]
         else:
             raise NameError("New value must be numerical type.")
+
+    #Returns the given new values (values) as an array, checking that they are numerical.
+    def _check_values(self,values):
+        values = np.asarray(values)
+        if len(values) > 0 and (values.dtype == bool or not np.issubdtype(values.dtype,np.number)):
+            raise NameError("New value must be numerical type.")
+        return values
+
+    #Writes the given values (values) in the given positions (indices), which must have been checked beforehand.
+    #The cached mean and variance are adjusted to the whole batch at once instead of being discarded.
+    def _apply_update(self,indices,values):
+        old = self.data.to_numpy()[indices].astype(float)
+        stats = self._stats
+        Attribute._apply_update(self,indices,values)
+        #The moments can only be adjusted when no value is missing, so that the number of values doesn't change.
+        if len(indices) > 0 and not np.isnan(old).any() and not np.isnan(values).any():
+            if "mean" in stats and "variance" in stats:
+                count = stats["count"] if "count" in stats else self.length-(stats["null_count"] if "null_count" in stats else self._null_count())
+                self._stats["mean"], self._stats["variance"] = metrics.replace_moments_batch(stats["mean"],stats["variance"],count,old,values.astype(float))
+            for stat in ("count","null_count"):
+                if stat in stats:
+                    self._stats[stat] = stats[stat]
     
+    #Returns the cached statistics (stats) updated with the given appended values (values): the count and the number of missing values are increased, and the mean and the variance are merged with the ones of the new values.
+    #The median can't be updated without the rest of the data, so it is discarded.
+    def _merge_stats(self,stats,values):
+        values = np.asarray(values,dtype=float)
+        valid = values[~np.isnan(values)]
+        merged = dict()
+        if "sketch" in stats:
+            merged["sketch"] = stats["sketch"].copy().update(valid)
+        if "null_count" in stats:
+            merged["null_count"] = stats["null_count"]+len(values)-len(valid)
+        if "count" in stats:
+            merged["count"] = stats["count"]+len(valid)
+            if "mean" in stats and "variance" in stats and stats["count"] > 1:
+                mean = valid.mean() if len(valid) > 0 else 0.0
+                count, mean, m2 = metrics.merge_moments(stats["count"],stats["mean"],stats["variance"]*(stats["count"]-1),len(valid),mean,np.sum((valid-mean)**2))
+                merged["mean"], merged["variance"] = (mean,m2/(count-1))
+        return merged
+
+    #Returns the memory map that holds the data of the numerical attribute, or None if the data is held in memory.
+    #Numerical attributes created from a np.memmap (for example, with Dataset.from_binary(mmap=True)) keep the map as their data.
+    def _memmap(self):
+        if self.data is not None and isinstance(self.data.values,np.memmap):
+            return self.data.values
+        return None
+
+    #Returns an iterator over consecutive blocks of the data of the numerical attribute, which are views of its data array.
+    def _blocks(self):
+        values = self.data.values
+        return (values[i:i+BLOCK_SIZE] for i in range(0,len(values),BLOCK_SIZE))
+
+    #Returns the minimum and the maximum of the data of the numerical attribute.
+    def _min_max(self):
+        if self._memmap() is not None:
+            return metrics.block_min_max(self._blocks())
+        return (self.data.min(),self.data.max())
+
+    #Applies the given affine transformation ((x - shift) / scale) to the memory-mapped data block by block, writing the result back through the map.
+    def _transform_memmap(self,shift,scale):
+        if self.data.dtype != float:
+            raise NameError("In-place transformations of memory-mapped attributes require float data.")
+        for block in self._blocks():
+            block -= shift
+            block /= scale
+        self._memmap().flush()
+
     #Normalizes the data of the numerical attribute between 0 and 1.
     def normalize(self):
-        self.data -= self.data.min()
-        self.data /= self.data.max()
+        if self._memmap() is not None:
+            low, high = self._min_max()
+            self._transform_memmap(low,high-low)
+        else:
+            self._own()
+            self.data -= self.data.min()
+            self.data /= self.data.max()
+        self._invalidate()
     
     #Standarizes the data of the numerical attribute so that it has mean = 0 and variance = 1.
     def standarize(self):
-        self.data -= self.data.mean()
-        self.data /= self.data.std(ddof=1)
+        if self._memmap() is not None:
+            count, mean, m2 = metrics.block_moments(self._blocks())
+            self._transform_memmap(mean,np.sqrt(m2/(count-1)))
+        else:
+            self._own()
+            self.data -= self.data.mean()
+            self.data /= self.data.std(ddof=1)
+        self._invalidate()
     
+    #Returns the labels of the intervals defined by the given sorted cut points (cut_points).
+    def _interval_labels(self, cut_points):
+        num_bins = len(cut_points)+1
+        return ["(" + str(cut_points[i-1]) + ", " + str(cut_points[i]) + "]" if i!=0 and i!=num_bins-1 else "(-infinity, " + str(cut_points[i]) + "]" if i==0 else "(" + str(cut_points[i-1]) + ", infinity)" for i in range(num_bins)]
+
+    #Returns a new categorical attribute that assigns each value of the numerical attribute to the interval defined by the given sorted cut points (cut_points).
+    #The interval of every value is found with a single search over the whole data array (or over each block, for memory-mapped data).
+    def _discretize_by(self, cut_points):
+        cat_values = self._interval_labels(cut_points)
+        #Empty intervals between repeated cut points produce repeated labels, which are merged.
+        label_codes, labels = pd.factorize(np.array(cat_values,dtype=object))
+        if self._memmap() is not None:
+            codes = np.empty(self.length,dtype=label_codes.dtype)
+            for start, block in zip(range(0,self.length,BLOCK_SIZE),self._blocks()):
+                codes[start:start+len(block)] = np.where(np.isnan(block),-1,label_codes[np.searchsorted(cut_points,block)])
+        else:
+            codes = label_codes[np.searchsorted(cut_points,self.data.to_numpy())]
+            #Missing values are kept as missing values (code -1).
+            valid = self._mask()
+            if valid is not None:
+                codes[~valid] = -1
+        return Categorical(pd.Series(pd.Categorical.from_codes(codes,labels),index=self.data.index),labels)
+
     #Returns a new categorical attribute created from the discretization of the numerical attribute.
     #It uses the equal width discretization strategy with the given number of intervals (num_bins).
     def discretizeEW(self, num_bins):
@@ -132,28 +527,45 @@ class Numerical(Attribute):
             raise NameError("Number of intervals must be an integer.")
         if num_bins < 2:
             raise NameError("Number of intervals must be equal to or higher than 2.")
-        min_val = self.data.min()
-        size_cut = (self.data.max()-min_val)/num_bins
+        min_val, max_val = self._min_max()
+        size_cut = (max_val-min_val)/num_bins
         cut_points = [min_val+(size_cut*i) for i in range(1,num_bins)]
-        cat_values = ["(" + str(cut_points[i-1]) + ", " + str(cut_points[i]) + "]" if i!=0 and i!=num_bins-1 else "(-infinity, " + str(cut_points[i]) + "]" if i==0 else "(" + str(cut_points[i-1]) + ", infinity)" for i in range(num_bins)]
-        discretized = Categorical([cat_values[np.searchsorted(cut_points,self.data[i])] for i in range(len(self.data))],cat_values)
-        return(discretized, cut_points)
+        return(self._discretize_by(cut_points), cut_points)
     
     #Returns a new categorical attribute created from the discretization of the numerical attribute.
     #It uses the equal frequency discretization strategy with the given number of intervals (num_bins).
-    def discretizeEF(self, num_bins):
+    #The cut points are selected with a partial sort of the data instead of sorting it completely. Missing values are not taken into account.
+    #If approx=True, the cut points are taken from the quantile sketch of the attribute (see sketch), and the bound of their rank error is returned after them.
+    def discretizeEF(self, num_bins, approx=False):
         if type(num_bins) != int:
             raise NameError("Number of intervals must be an integer.")
         if num_bins < 2:
             raise NameError("Number of intervals must be equal to or higher than 2.")
-        num_bins = min(num_bins,len(self.data))
-        cut_size = int(len(self.data)/num_bins)
-        cut_mod = len(self.data)%num_bins
-        sorted_list = sorted(list(self.data))
-        cut_points = [sorted_list[((cut_size+1)*(i))-1] if i<cut_mod else sorted_list[(cut_size*(i))+(cut_mod-1)] for i in range(1,num_bins)]
-        cat_values = ["(" + str(cut_points[i-1]) + ", " + str(cut_points[i]) + "]" if i!=0 and i!=num_bins-1 else "(-infinity, " + str(cut_points[i]) + "]" if i==0 else "(" + str(cut_points[i-1]) + ", infinity)" for i in range(num_bins)]
-        discretized = Categorical([cat_values[np.searchsorted(cut_points,self.data[i])] for i in range(len(self.data))],cat_values)
-        return(discretized, cut_points)
+        if approx:
+            sketch = self.sketch()
+            length = sketch.get_count()
+        elif self._memmap() is not None:
+            length = metrics.block_moments(self._blocks())[0]
+        else:
+            values = self.data.to_numpy()
+            valid = self._mask()
+            if valid is not None:
+                values = values[valid]
+            length = len(values)
+        num_bins = min(num_bins,length)
+        cut_size = int(length/num_bins)
+        cut_mod = length%num_bins
+        bins = np.arange(1,num_bins)
+        positions = np.where(bins<cut_mod,((cut_size+1)*bins)-1,(cut_size*bins)+(cut_mod-1))
+        if approx:
+            cut_points, error = sketch.quantiles((positions+1)/length)
+            cut_points = cut_points.tolist()
+            return(self._discretize_by(cut_points), cut_points, error)
+        if self._memmap() is not None:
+            cut_points = np.array(metrics.block_select(self._blocks,positions)).tolist()
+        else:
+            cut_points = np.partition(values,positions)[positions].tolist()
+        return(self._discretize_by(cut_points), cut_points)
     
     #Returns a new categorical attribute created from the discretization of the numerical attribute.
     #The discretization is performed according to the given cut points (cut_points).
@@ -163,21 +575,83 @@ class Numerical(Attribute):
         if len(cut_points) < 1:
             raise NameError("Cut point list must contain at least one cut point.")
         cut_points = sorted(cut_points)
-        cat_values = ["(" + str(cut_points[i-1]) + ", " + str(cut_points[i]) + "]" if i!=0 and i!=len(cut_points) else "(-infinity, " + str(cut_points[i]) + "]" if i==0 else "(" + str(cut_points[i-1]) + ", infinity)" for i in range(len(cut_points)+1)]
-        discretized = Categorical([cat_values[np.searchsorted(cut_points,self.data[i])] for i in range(len(self.data))],cat_values)
-        return(discretized, cut_points)
+        return(self._discretize_by(cut_points), cut_points)
+
+    #Returns the requested summary statistics (stats = count, mean, median, variance) of the numerical attribute as a dictionary.
+    #The statistics that are not cached are computed together from a single copy of the data: the variance reuses the mean and the median is obtained by partial sorting.
+    def describe(self,stats=None):
+        if stats is None:
+            stats = NUMERICAL_STATS
+        return self._cached_stats([stat for stat in stats if stat in NUMERICAL_STATS],self._describe)
+
+    #Computes the requested summary statistics (stats) of the numerical attribute.
+    #Memory-mapped data is processed block by block: the moments of the blocks are merged and the median is found by successive histogram passes.
+    #Missing values are skipped: the count is the number of values that are not missing, and the rest of the statistics are NaN if every value is missing.
+    def _describe(self,stats):
+        if self._memmap() is not None:
+            summary = dict()
+            count, mean, m2 = metrics.block_moments(self._blocks())
+            if "count" in stats:
+                summary["count"] = count
+            if "mean" in stats:
+                summary["mean"] = mean if count > 0 else np.NaN
+            if "variance" in stats:
+                summary["variance"] = m2/(count-1) if count > 1 else np.NaN
+            if "median" in stats:
+                low, high = metrics.block_select(self._blocks,[(count-1)//2,count//2]) if count > 0 else (np.NaN,np.NaN)
+                summary["median"] = (low+high)/2
+            return summary
+        values = self.data.to_numpy(dtype=float)
+        valid = self._mask()
+        if valid is not None:
+            values = values[valid]
+        if len(values) == 0:
+            return {stat: 0 if stat == "count" else np.NaN for stat in stats}
+        summary = dict()
+        if "count" in stats:
+            summary["count"] = len(values)
+        if "mean" in stats or "variance" in stats:
+            mean = np.mean(values)
+            if "mean" in stats:
+                summary["mean"] = mean
+            if "variance" in stats:
+                deviations = values-mean
+                summary["variance"] = np.sum(deviations*deviations)/(len(values)-1)
+        if "median" in stats:
+            summary["median"] = np.median(values)
+        return summary
 
     #Returns the mean of the data of the numerical attribute.
     def mean(self):
-        return np.mean(self.data)
+        return self.describe(["mean"])["mean"]
 
     #Returns the median of the data of the numerical attribute.
-    def median(self):
-        return np.median(self.data)
+    #If approx=True, the approximate median is taken from the quantile sketch of the attribute (see sketch) and returned together with the bound of its rank error.
+    def median(self,approx=False):
+        if approx:
+            return self.sketch().quantile(0.5)
+        return self.describe(["median"])["median"]
+
+    #Returns a quantile sketch (see sketches.KLLSketch) of the values of the numerical attribute that are not missing, with the given size (k). Memory-mapped data is added to the sketch block by block.
+    #If no size is given, the sketch with the default size is taken from the cache of the attribute, where it is updated when new values are appended. A copy is returned, so it can be merged without changing the cache.
+    def sketch(self,k=None):
+        if k is None:
+            return self._cached_stats(["sketch"],lambda stats: {"sketch":self._sketch(sketches.KLL_K)})["sketch"].copy()
+        return self._sketch(k)
+
+    #Returns a new quantile sketch of the given size (k) with the values of the numerical attribute.
+    def _sketch(self,k):
+        sketch = sketches.KLLSketch(k)
+        if self._memmap() is not None:
+            for block in self._blocks():
+                sketch.update(block)
+        else:
+            sketch.update(self.data.to_numpy(dtype=float))
+        return sketch
     
     #Returns the variance of the data of the numerical attribute.
     def variance(self):
-        return np.var(self.data,ddof=1)
+        return self.describe(["variance"])["variance"]
 
     #Prints the data of the numerical attribute.
     def print_data(self):
@@ -185,10 +659,11 @@ class Numerical(Attribute):
         Attribute.print_data(self)
 
 ### BOOLEAN ATTRIBUTE CLASS (inherits ATTRIBUTE)
+@profiling.instrument
 class Boolean(Attribute):
     
     ###################CONSTRUCTOR FUNCTION####################
-    def __init__(self,*args):
+    def __init__(self,*args,validate=True):
         if len(args) == 1:
             if isinstance(args[0],pd.Series):
                 data = args[0]
@@ -196,9 +671,10 @@ class Boolean(Attribute):
                 data = pd.Series(args[0])
             else:
                 raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-            if data.dtype != bool:
+            data = _as_boolean(data)
+            if validate and not _is_boolean(data):
                 raise NameError("Boolean attribute must be boolean type.")
-            Attribute.__init__(self,data)
+            Attribute.__init__(self,data,validate=False)
         elif len(args) == 0:
             Attribute.__init__(self)
         else:
@@ -207,16 +683,18 @@ class Boolean(Attribute):
     ###################SETTERS####################
     
     #Initializes the data of the boolean attribute according to the input array-like parameter (d).
-    def set_data(self,d):
+    #The type of the data is not checked if validate=False.
+    def set_data(self,d,validate=True):
         if isinstance(d,pd.Series):
             data = d
         elif isinstance(d,(np.ndarray,list)):
             data = pd.Series(d)
         else:
             raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-        if data.dtype != bool:
+        data = _as_boolean(data)
+        if validate and not _is_boolean(data):
                 raise NameError("Boolean attribute must be boolean type.")
-        Attribute.set_data(self,data)
+        Attribute.set_data(self,data,validate=False)
 
     #############################################
 
@@ -226,22 +704,79 @@ class Boolean(Attribute):
             Attribute.update_value(self,ind,val)
         else:
             raise NameError("New value must be boolean type.")
+
+    #Returns the given new values (values) as an array, checking that they are booleans or missing values.
+    def _check_values(self,values):
+        values = _as_boolean(pd.Series(values))
+        #A batch made only of missing values has no type of its own, so it is taken as missing booleans.
+        if len(values) > 0 and values.isna().all():
+            values = pd.Series(pd.array([pd.NA]*len(values),dtype="boolean"))
+        if len(values) > 0 and not _is_boolean(values):
+            raise NameError("New value must be boolean type.")
+        return values.array if isinstance(values.dtype,pd.BooleanDtype) else values.to_numpy()
+
+    #Writes the given values (values) in the given positions (indices), which must have been checked beforehand.
+    #Boolean data without missing values changes to the pandas "boolean" type if any of the new values is missing.
+    def _apply_update(self,indices,values):
+        if self.data.dtype == bool and isinstance(values.dtype,pd.BooleanDtype) and values.isna().any():
+            self.data = self.data.astype("boolean")
+        Attribute._apply_update(self,indices,values)
     
     #Returns the categorical version of the boolean attribute.
     def to_categorical(self,values=None):
         warnings.warn("Boolean data converted to string when creating the categorical attribute.")
-        data_str = self.data.astype(str)
+        data_str = self.data.map({True:"True",False:"False"})
         return Categorical(data_str,["True","False"])
 
+    #Returns the requested summary statistics (stats = count, mode, entropy) of the boolean attribute as a dictionary.
+    #The statistics that are not cached are computed from a single count of the appearances of each value.
+    def describe(self,stats=None):
+        if stats is None:
+            stats = NOMINAL_STATS
+        return self._cached_stats([stat for stat in stats if stat in NOMINAL_STATS],self._describe)
+
+    #Computes the requested summary statistics (stats) of the boolean attribute.
+    def _describe(self,stats):
+        return _describe_value_counts(self.data.value_counts().astype(np.int64),stats)
+
+    #Returns the arrays that hold the data of the boolean attribute in the buffers: the values (False where missing) and the validity mask.
+    def _physical(self):
+        return [self.data.to_numpy(dtype=bool,na_value=False),self.get_valid()]
+
+    #Returns the arrays that hold the given checked values (values) in the buffers.
+    def _physical_batch(self,values):
+        values = pd.Series(values)
+        return [values.to_numpy(dtype=bool,na_value=False),values.notna().to_numpy()]
+
+    #Returns the data of the boolean attribute built from the given arrays of the buffers (arrays), with the pandas "boolean" type if any value is missing.
+    def _from_physical(self,arrays):
+        values, valid = arrays
+        if valid.all():
+            return pd.Series(values)
+        return pd.Series(pd.arrays.BooleanArray(values,~valid))
+
+    #Returns the cached statistics (stats) updated with the given appended values (values), merging the number of appearances of each value.
+    def _merge_stats(self,stats,values):
+        return _merge_value_counts(stats,pd.Series(values))
+
     #Returns the mode of the data of the boolean attribute.
-    def mode(self):
-        return self.data.mode()[0]
+    #If approx=True, the approximate mode is taken from the frequency sketch of the attribute (see sketch) and returned together with the maximum error of its count.
+    def mode(self,approx=False):
+        if approx:
+            return self.sketch().mode()
+        return self.describe(["mode"])["mode"]
     
     #Returns the entropy of the data of the boolean attribute.
-    def entropy(self):
-        total = len(self.data)
-        p = np.array(self.data.value_counts())/total
-        return sum([-i*math.log2(i) for i in p])
+    #If approx=True, the approximate entropy is computed from the frequency sketch of the attribute (see sketch) and returned together with a bound of its error.
+    def entropy(self,approx=False):
+        if approx:
+            return self.sketch().entropy()
+        return self.describe(["entropy"])["entropy"]
+
+    #Returns a frequency sketch (see sketches.FrequentItemsSketch) of the values of the boolean attribute that are not missing, with the given number of counters (capacity).
+    #If no capacity is given, the sketch with the default number of counters is cached and updated when new values are appended.
+    def sketch(self,capacity=None):
+        return _nominal_sketch(self,capacity)
 
     #Prints the data of the boolean attribute.
     def print_data(self):
@@ -249,10 +784,11 @@ class Boolean(Attribute):
         Attribute.print_data(self)
 
 ### STRING ATTRIBUTE CLASS (inherits ATTRIBUTE)
+@profiling.instrument
 class String(Attribute):
     
     ###################CONSTRUCTOR FUNCTION####################
-    def __init__(self,*args):
+    def __init__(self,*args,validate=True):
         if len(args) == 1:
             if isinstance(args[0],pd.Series):
                 data = args[0]
@@ -260,9 +796,9 @@ class String(Attribute):
                 data = pd.Series(args[0])
             else:
                 raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-            if data[data.apply(type) != str].count() > 0:
+            if validate and not _is_string(data):
                 raise NameError("String attribute must be string type.")
-            Attribute.__init__(self,data)
+            Attribute.__init__(self,data,validate=False)
         elif len(args) == 0:
             Attribute.__init__(self)
         else:
@@ -271,16 +807,17 @@ class String(Attribute):
     ###################SETTERS####################
             
     #Initializes the data of the string attribute according to the input array-like parameter (d).
-    def set_data(self,d):
+    #The type of the data is not checked if validate=False.
+    def set_data(self,d,validate=True):
         if isinstance(d,pd.Series):
             data = d
         elif isinstance(d,(np.ndarray,list)):
             data = pd.Series(d)
         else:
             raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-        if data[data.apply(type) != str].count() > 0:
+        if validate and not _is_string(data):
                 raise NameError("String attribute must be string type.")
-        Attribute.set_data(self,data)
+        Attribute.set_data(self,data,validate=False)
 
     ##############################################
 
@@ -290,24 +827,55 @@ class String(Attribute):
             Attribute.update_value(self,ind,val)
         else:
             raise NameError("New value must be string type.")
+
+    #Returns the given new values (values) as an array, checking that they are strings or missing values.
+    def _check_values(self,values):
+        values = pd.Series(values,dtype=object)
+        if not _is_string(values):
+            raise NameError("New value must be string type.")
+        return values.to_numpy()
     
     #Returns the categorical version of the string attribute.
     #The possible values of the categorical attribute can be specified through a parameter (values).
     def to_categorical(self,values=None):
-        if values == None:
+        if values is None:
             return Categorical(self.data)
         else:
             return Categorical(self.data,values)
 
+    #Returns the requested summary statistics (stats = count, mode, entropy) of the string attribute as a dictionary.
+    #The statistics that are not cached are computed from a single count of the appearances of each value.
+    def describe(self,stats=None):
+        if stats is None:
+            stats = NOMINAL_STATS
+        return self._cached_stats([stat for stat in stats if stat in NOMINAL_STATS],self._describe)
+
+    #Computes the requested summary statistics (stats) of the string attribute.
+    def _describe(self,stats):
+        return _describe_value_counts(self.data.value_counts(),stats)
+
+    #Returns the cached statistics (stats) updated with the given appended values (values), merging the number of appearances of each value.
+    def _merge_stats(self,stats,values):
+        return _merge_value_counts(stats,pd.Series(values,dtype=object))
+
     #Returns the mode of the data of the string attribute.
-    def mode(self):
-        return self.data.mode()[0]
+    #If approx=True, the approximate mode is taken from the frequency sketch of the attribute (see sketch) and returned together with the maximum error of its count.
+    def mode(self,approx=False):
+        if approx:
+            return self.sketch().mode()
+        return self.describe(["mode"])["mode"]
     
     #Returns the entropy of the data of the string attribute.
-    def entropy(self):
-        total = len(self.data)
-        p = np.array(self.data.value_counts())/total
-        return sum([-i*math.log2(i) for i in p])
+    #If approx=True, the approximate entropy is computed from the frequency sketch of the attribute (see sketch) and returned together with a bound of its error.
+    def entropy(self,approx=False):
+        if approx:
+            return self.sketch().entropy()
+        return self.describe(["entropy"])["entropy"]
+
+    #Returns a frequency sketch (see sketches.FrequentItemsSketch) of the values of the string attribute that are not missing, with the given number of counters (capacity).
+    #If no capacity is given, the sketch with the default number of counters is cached and updated when new values are appended.
+    def sketch(self,capacity=None):
+        return _nominal_sketch(self,capacity)
 
     #Prints the data of the string attribute.
     def print_data(self):
@@ -315,11 +883,12 @@ class String(Attribute):
         Attribute.print_data(self)
 
 ### CATEGORICAL ATTRIBUTE CLASS (inherits STRING). This class contains a collection of possible values in addition to the attribute data.
+### The data is stored as a pd.Categorical: an ordered table with the possible values and an array of integer codes (int8, int16 or int32 depending on the number of possible values).
+@profiling.instrument
 class Categorical(String):
     
     ###################CONSTRUCTOR FUNCTION####################
-    def __init__(self,*args):
-        self.values = None
+    def __init__(self,*args,validate=True):
         if len(args) == 2 or len(args) == 1:
             if isinstance(args[0],pd.Series):
                 data = args[0]
@@ -327,20 +896,11 @@ class Categorical(String):
                 data = pd.Series(args[0])
             else:
                 raise NameError("The attribute data must be a pd.Series, a np.array or a list.")
+            String.__init__(self)
             if len(args) == 2:
-                if isinstance(args[1],set):
-                    self.values = args[1]
-                elif isinstance(args[1],(pd.Series,np.ndarray,list)):
-                    self.values = set(args[1])
-                else:
-                    raise NameError("The categorical value collection must be a pd.Series, a np.ndarray, a list or a set.")
-                if not all([i in self.values for i in data]):
-                    self.values = None
-                    raise NameError("Some of the values in the attribute data are not valid.")
+                self._set_categorical(data,args[1],validate)
             else:
-                warnings.warn("The categorical value collection has not been specified, only the values that appear in the attribute data will be considered.")
-                self.values = set(data)
-            String.__init__(self,data)
+                self._set_categorical(data,None,validate)
         elif len(args) == 0:
             String.__init__(self)
         else:
@@ -350,38 +910,142 @@ class Categorical(String):
     
     #Initializes the data of the categorical attribute according to the input array-like parameter (d).
     #It also initializes the collection of possible values of the categorical attribute according to the input parameter (v).
-    def set_data(self,d,v=None):
-        self.values = None
+    #The possible values and the data are not checked if validate=False.
+    def set_data(self,d,v=None,validate=True):
         if isinstance(d,pd.Series):
             data = d
         elif isinstance(d,(np.ndarray,list)):
             data = pd.Series(d)
         else:
             raise NameError("The attribute data must be a pd.Series, a np.ndarray or a list.")
-        if v == None:
+        self._set_categorical(data,v,validate)
+
+    #Encodes the given data (data) with the given collection of possible values (values) and stores the result as the data of the attribute.
+    #The possible values keep the given order, except for sets and unspecified collections, which are sorted.
+    #If validate=False, the possible values are not checked to be strings and the values of the data that are not possible values become missing values.
+    def _set_categorical(self,data,values,validate=True):
+        self.data = None
+        self.length = 0
+        self._invalidate()
+        if values is None:
             warnings.warn("The categorical value collection has not been specified, only the values that appear in the attribute data will be considered.")
-            self.values = set(data)
-        elif isinstance(v,set):
-            self.values = v
-        elif isinstance(v,(pd.Series,np.ndarray,list)):
-            self.values = set(v)
+            if isinstance(data.dtype,pd.CategoricalDtype):
+                categories = data.cat.categories[np.bincount(data.cat.codes[data.cat.codes>=0],minlength=len(data.cat.categories))>0]
+            else:
+                categories = pd.Index(pd.unique(data.to_numpy())).dropna().sort_values()
+        elif isinstance(values,set):
+            categories = pd.Index(sorted(values))
+        elif isinstance(values,(pd.Series,np.ndarray,list,pd.Index)):
+            categories = pd.Index(pd.unique(np.asarray(values,dtype=object)))
         else:
             raise NameError("The categorical value collection must be a pd.Series, a np.ndarray, a list or a set.")
-        if not all([i in self.values for i in data]):
-            self.values = None
+        if validate and len(categories) > 0 and pd.api.types.infer_dtype(categories,skipna=False) != "string":
+            raise NameError("String attribute must be string type.")
+        encoded = pd.Categorical(data,categories=categories)
+        #Missing values are encoded as -1, like the values that are not possible values.
+        if validate and (encoded.codes < 0).any() and (data.notna().to_numpy() & (encoded.codes < 0)).any():
             raise NameError("Some of the values in the attribute data are not valid.")
-        String.set_data(self,data)
+        self.data = pd.Series(encoded,index=data.index,name=data.name)
+        self.length = len(self.data)
+
+    ###################GETTERS####################
+
+    #Returns the collection of possible values of the categorical attribute.
+    @property
+    def values(self):
+        if self.data is None:
+            return None
+        return set(self.data.cat.categories)
+
+    #Returns the ordered array with the possible values of the categorical attribute.
+    def get_categories(self):
+        return self.data.cat.categories.to_numpy()
+
+    #Returns the integer codes of the data of the categorical attribute (positions in the array of possible values, or -1 for the missing values).
+    def get_codes(self):
+        return self.data.cat.codes.to_numpy()
+
+    #Returns the validity mask of the categorical attribute from its codes, or None if no value is missing.
+    def _mask(self):
+        valid = self.get_codes() >= 0
+        return None if valid.all() else valid
 
     ##############################################
 
     #Updates the value in the specified index (ind).
     def update_value(self,ind,val):
-        if val not in self.values:
+        if val not in self.data.cat.categories:
             raise NameError("Invalid new value. Allowed values are: "+str(self.values))
         String.update_value(self,ind,val)
 
+    #Returns the given new values (values) as an array, checking that they are possible values of the categorical attribute or missing values.
+    #If extend=True, they only need to be strings or missing values.
+    def _check_values(self,values,extend=False):
+        values = String._check_values(self,values)
+        if not extend and ((self._categories().get_indexer(values) < 0) & pd.notna(values)).any():
+            raise NameError("Invalid new value. Allowed values are: "+str(self.values))
+        return values
+
+    #Returns the number of appearances of each possible value of the categorical attribute.
+    def _value_counts(self):
+        codes = self.get_codes()
+        return np.bincount(codes[codes >= 0],minlength=len(self.data.cat.categories))
+
+    #Computes the requested summary statistics (stats) of the categorical attribute from a single count of the codes of the data.
+    def _describe(self,stats):
+        return _describe_value_counts(pd.Series(self._value_counts(),index=self.data.cat.categories),stats)
+
+    #Appends the given values (values) at the end of the categorical attribute (see Attribute.append_values).
+    #The values must be possible values of the attribute, unless extend=True is given: then the new values are added at the end of the possible values.
+    def append_values(self,values,extend=False):
+        values = self._check_values(values,extend)
+        if extend:
+            self._add_categories(values)
+        self._apply_append(values)
+
+    #Adds the values of the given array (values) that are not possible values yet at the end of the possible values of the categorical attribute, in order of appearance.
+    #The codes of the data don't change, so the data is not modified.
+    def _add_categories(self,values):
+        categories = self._categories()
+        new = pd.unique(values[pd.notna(values) & (categories.get_indexer(values) < 0)])
+        if len(new) > 0:
+            if pd.api.types.infer_dtype(new,skipna=False) != "string":
+                raise NameError("String attribute must be string type.")
+            if self._buffers is not None and self._buffers_version == self._version:
+                self._buffer_categories = categories.append(pd.Index(new))
+                self._appended = True
+            else:
+                self.data = self.data.cat.add_categories(new)
+            if "value_counts" in self._stats:
+                self._stats["value_counts"] = pd.concat([self._stats["value_counts"],pd.Series(0,index=new,dtype=np.int64)])
+
+    #Returns the possible values of the categorical attribute, without rebuilding the data from the buffers.
+    def _categories(self):
+        if self._appended:
+            return self._buffer_categories
+        return self.data.cat.categories
+
+    #Returns the arrays that hold the data of the categorical attribute in the buffers: its codes. The possible values are kept apart.
+    def _physical(self):
+        self._buffer_categories = self.data.cat.categories
+        return [self.get_codes()]
+
+    #Returns the arrays that hold the given checked values (values) in the buffers: their codes.
+    #The type of the codes is widened when new possible values need it, so the buffers are widened too (see ColumnBuffer.append).
+    def _physical_batch(self,values):
+        dtype = np.result_type(self._buffers[0].get_values().dtype,_code_dtype(len(self._buffer_categories)))
+        return [self._buffer_categories.get_indexer(values).astype(dtype)]
+
+    #Returns the data of the categorical attribute built from the codes in the buffers (arrays).
+    def _from_physical(self,arrays):
+        return pd.Series(pd.Categorical.from_codes(arrays[0],self._buffer_categories))
+
+    #Returns the cached statistics (stats) updated with the given appended values (values), merging the number of appearances of each possible value.
+    def _merge_stats(self,stats,values):
+        return _merge_value_counts(stats,pd.Series(values,dtype=object))
+
     #Prints the data of the categorical attribute.
     def print_data(self):
         print("Attribute type: Categorical")
-        print("Allowed values: ", self.values)
+        print("Allowed values: ", list(self.get_categories()))
         Attribute.print_data(self)
@@ -0,0 +1,42 @@
+import numpy as np
+
+### COLUMN BUFFER CLASS. Growable typed array used to collect the values of an attribute in consecutive blocks.
+### The capacity of the buffer is doubled every time it gets full, so appending values costs amortized O(1) per value.
+class ColumnBuffer():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,dtype,capacity=1024):
+        self.array = np.empty(max(int(capacity),1),dtype=dtype)
+        self.length = 0
+
+    ###################GETTERS####################
+
+    #Returns a view of the values stored in the buffer.
+    def get_values(self):
+        return self.array[:self.length]
+
+    #Returns the number of values that fit in the buffer without growing it.
+    def get_capacity(self):
+        return len(self.array)
+
+    #############################################
+
+    #Appends the given values (values) at the end of the buffer.
+    #The type of the buffer is widened when the new values need it (for example, integers followed by floats).
+    def append(self,values):
+        values = np.asarray(values)
+        dtype = np.result_type(self.array.dtype,values.dtype)
+        if dtype != self.array.dtype:
+            self.array = self.array.astype(dtype)
+        end = self.length+len(values)
+        if end > len(self.array):
+            grown = np.empty(max(end,2*len(self.array)),dtype=self.array.dtype)
+            grown[:self.length] = self.array[:self.length]
+            self.array = grown
+        self.array[self.length:end] = values
+        self.length = end
+
+    #Releases the unused capacity of the buffer.
+    def trim(self):
+        if self.length < len(self.array):
+            self.array = self.array[:self.length].copy()
@@ -1,16 +1,255 @@
 import pandas as pd
 import numpy as np
-from IPython.display import display
-from .attributes import Attribute, Numerical, Boolean, String, Categorical
+import contextlib
+import json
+import operator
+import os
+import time
+import weakref
+from .attributes import Attribute, Numerical, Boolean, String, Categorical, NUMERICAL_STATS, NOMINAL_STATS, _from_validated, _describe_counts, _is_boolean, _as_boolean
+from .buffers import ColumnBuffer
+from . import metrics
+from . import profiling
+from . import executors
+from . import sketches
+
+#Summary statistics that can be computed for the attributes of a data set.
+STATS = ("count","mean","median","variance","mode","entropy")
+
+#Scores that can be computed for the attributes of a data set with respect to the class attribute.
+SCORES = ("info_gain","nmi","auc","point_biserial","anova_f")
+
+#Metrics that can be used to filter the attributes of a data set.
+METRICS = ("entropy",)+SCORES+("variance","mean","median")
+
+#Comparators that can be used to filter the attributes of a data set, with the functions that implement them.
+COMPARATORS = {"lt":operator.lt,"gt":operator.gt,"le":operator.le,"ge":operator.ge,"eq":operator.eq,"neq":operator.ne}
+
+#Returns the function that implements the given comparator (comparator = lt, gt, le, ge, eq, neq).
+def _comparator(comparator):
+    if comparator not in COMPARATORS:
+        raise NameError("Invalid comparator. Accepted comparators: lt, gt, le, ge, eq, neq.")
+    return COMPARATORS[comparator]
+
+#Returns the pieces that are needed to rebuild the given attribute (att) in another thread or process: its class, its data array (the integer codes, for categorical attributes) and its possible values.
+def _pack_attribute(att):
+    if isinstance(att,Categorical):
+        return (Categorical,att.get_codes(),att.get_categories())
+    #Memory-mapped data is packed as its map, so that the processes of a ProcessExecutor map the file instead of receiving its data.
+    if isinstance(att,Numerical) and att._memmap() is not None:
+        return (Numerical,att._memmap(),None)
+    return (type(att),att.data.to_numpy(),None)
+
+#Returns the attribute rebuilt from the given pieces (packed), with the given index (index).
+def _unpack_attribute(packed,index=None):
+    cls, values, categories = packed
+    if cls is Categorical:
+        return _from_validated(Categorical,pd.Series(pd.Categorical.from_codes(values,categories),index=index))
+    elif cls is Boolean:
+        return _from_validated(Boolean,_as_boolean(pd.Series(values,index=index)))
+    return _from_validated(cls,pd.Series(values,index=index))
+
+#Returns the requested summary statistics of a packed attribute. The item (item) holds the packed attribute and the statistics.
+def _describe_task(item):
+    packed, stats = item
+    return _unpack_attribute(packed)._describe(stats)
+
+#Returns the packed categorical attribute obtained by discretizing the packed numerical attribute (packed) with the given method (method = frequency, width) and number of intervals (num_bins).
+def _discretize_task(packed,method,num_bins):
+    att = _unpack_attribute(packed)
+    if method == "frequency":
+        return _pack_attribute(att.discretizeEF(num_bins)[0])
+    return _pack_attribute(att.discretizeEW(num_bins)[0])
+
+#Returns the data array of the packed numerical attribute (packed) after applying the given transformation (method = normalize, standarize).
+#The data is copied before being transformed, since it belongs to the data set.
+def _transform_task(packed,method):
+    att = _unpack_attribute(packed)
+    att._share()
+    getattr(att,method)()
+    return att.data.to_numpy()
+
+#Returns the sketch with the default size of a packed attribute (packed): a quantile sketch for numerical attributes, or a frequency sketch for the rest.
+def _sketch_task(packed):
+    return _unpack_attribute(packed).sketch()
+
+#Returns the statistics of each group of a packed attribute (packed): count, mean and variance for numerical attributes, or count, mode and entropy for the rest.
+#The group of each instance is given by its code (groups, in [0,n_groups), or -1 for no group).
+def _groupby_task(packed,groups,n_groups):
+    att = _unpack_attribute(packed)
+    if isinstance(att,Numerical):
+        count, mean, variance = metrics.group_moments(groups,n_groups,att.data.to_numpy())
+        return {"count":count,"mean":mean,"variance":variance}
+    if isinstance(att,Categorical):
+        codes, values = (packed[1],np.asarray(packed[2],dtype=object))
+    else:
+        codes, values = pd.factorize(att.data)
+        values = np.asarray(values,dtype=object)
+    table = metrics.group_counts(groups,n_groups,codes,len(values))
+    count = table.sum(axis=1)
+    #The values are sorted so that the first maximum of each row is the smallest mode, as in the summary statistics.
+    order = np.argsort(values,kind="stable")
+    mode = values[order][table[:,order].argmax(axis=1)] if len(values) > 0 else np.full(n_groups,np.NaN,dtype=object)
+    mode[count == 0] = np.NaN
+    return {"count":count,"mode":mode,"entropy":metrics.entropy_rows(table)}
+
+#Returns the attribute object that corresponds to the data type of the given pd.Series (value).
+#Object columns that hold booleans and missing values are boolean attributes. The values of string and categorical columns are not checked if validate=False.
+def _infer_attribute(value,validate=True):
+    if value.dtype == int or value.dtype == float:
+        return Numerical(value,validate=False)
+    elif _is_boolean(value):
+        return Boolean(value,validate=False)
+    elif isinstance(value.dtype,pd.CategoricalDtype):
+        return Categorical(value,value.cat.categories,validate=validate)
+    kind = pd.api.types.infer_dtype(value,skipna=True)
+    if kind == "boolean":
+        return Boolean(value.astype("boolean"),validate=False)
+    elif validate and kind != "string" and kind != "empty":
+        raise NameError("String attribute must be string type.")
+    return String(value,validate=False)
+
+#Reads the given csv file (file) in chunks of the given number of rows (chunksize) and yields them as pd.DataFrame objects.
+#After each chunk, the callback function (callback) is called with the number of rows read so far and the number of rows read per second.
+def _read_csv_chunks(file,header,sep,chunksize,usecols,dtype,callback):
+    if type(chunksize) != int or chunksize < 1:
+        raise NameError("The chunk size must be a positive integer.")
+    try:
+        if header:
+            reader = pd.read_csv(file,header=0,sep=sep,chunksize=chunksize,usecols=usecols,dtype=dtype)
+        else:
+            reader = pd.read_csv(file,header=None,sep=sep,chunksize=chunksize,usecols=usecols,dtype=dtype)
+    except:
+        raise NameError("Csv file can't be read with the given parameters. Format: input file (string), header (boolean), separator (string), class attribute name.")
+    rows = 0
+    start = time.perf_counter()
+    with reader:
+        while True:
+            try:
+                chunk = next(reader)
+            except StopIteration:
+                break
+            except:
+                raise NameError("Csv file can't be read with the given parameters. Format: input file (string), header (boolean), separator (string), class attribute name.")
+            rows += len(chunk)
+            if callback is not None:
+                elapsed = time.perf_counter()-start
+                callback(rows,rows/elapsed if elapsed > 0 else float("inf"))
+            yield chunk
+
+#Returns the type of attribute and the values of a column (value) of a csv chunk.
+#If a type of attribute is given (cls), the values of the column must match it.
+def _chunk_values(key,value,cls=None):
+    try:
+        att = _infer_attribute(value)
+    except:
+        raise NameError("Attribute values must be numerical, bool, str. Each attribute can only contain one data type.")
+    if cls is not None and type(att) != cls:
+        raise NameError("The values of the attribute " + key + " don't match the type inferred from the first chunk. The type of the attribute can be specified through the dtype parameter.")
+    return (type(att),att.data.to_numpy())
+
+#Returns a pd.DataFrame with the type and the summary statistics (count, mean, variance, mode, entropy) of every attribute in the given csv file (file).
+#The file is read in chunks of the given number of rows (chunksize) that are discarded once processed: the mean and variance are obtained by merging the moments of the chunks, and the mode and entropy from the merged value counts.
+#The median is not included, since it can't be computed without keeping the data. The rest of the parameters are the same as in Dataset.from_csv.
+#If approx=True, every column is also added to a sketch (see the sketches module) that uses a fixed amount of memory: the approximate median is included, the mode and entropy are estimated from a frequency sketch instead of the full value counts,
+#and the bounds of their errors are included as median_error (rank error, as a fraction of the count), mode_error (maximum error of the count of the mode) and entropy_error (in bits).
+def describe_csv(file,header=True,sep=",",chunksize=100000,usecols=None,dtype=None,callback=None,approx=False):
+    types = dict()
+    moments = dict()
+    counts = dict()
+    summaries = dict()
+    for chunk in _read_csv_chunks(file,header,sep,chunksize,usecols,dtype,callback):
+        for key in chunk.columns:
+            name = str(key)
+            types[name], values = _chunk_values(name,chunk[key],types.get(name))
+            if types[name] == Numerical:
+                values = values.astype(float)
+                values = values[~np.isnan(values)]
+                mean = values.mean() if len(values) > 0 else 0.0
+                moments[name] = metrics.merge_moments(*moments.get(name,(0,0.0,0.0)),len(values),mean,np.sum((values-mean)**2))
+                if approx:
+                    summaries.setdefault(name,sketches.KLLSketch()).update(values)
+            elif approx:
+                summaries.setdefault(name,sketches.FrequentItemsSketch()).update(values)
+            else:
+                value_counts = pd.Series(values,dtype=object).value_counts()
+                counts[name] = value_counts if name not in counts else counts[name].add(value_counts,fill_value=0)
+    rows = []
+    for name, cls in types.items():
+        if cls == Numerical:
+            count, mean, m2 = moments[name]
+            rows.append([cls.__name__,count,mean,m2/(count-1) if count > 1 else np.NaN,np.NaN,np.NaN])
+            if approx:
+                rows[-1] += [*summaries[name].quantile(0.5),np.NaN,np.NaN]
+        elif approx:
+            mode, mode_error = summaries[name].mode()
+            entropy, entropy_error = summaries[name].entropy()
+            rows.append([cls.__name__,summaries[name].get_count(),np.NaN,np.NaN,mode,entropy,np.NaN,np.NaN,mode_error,entropy_error])
+        else:
+            summary = _describe_counts(counts[name].index.to_numpy(),counts[name].to_numpy().astype(np.int64),("count","mode","entropy"))
+            rows.append([cls.__name__,summary["count"],np.NaN,np.NaN,summary["mode"],summary["entropy"]])
+    if approx:
+        return pd.DataFrame(rows,index=list(types.keys()),columns=["type","count","mean","variance","mode","entropy","median","median_error","mode_error","entropy_error"])
+    return pd.DataFrame(rows,index=list(types.keys()),columns=["type","count","mean","variance","mode","entropy"])
+
+#Version of the binary format written by Dataset.to_binary.
+BINARY_FORMAT_VERSION = 1
+
+#Returns the smallest signed integer type that can hold the codes of the given number of distinct values (size).
+def _code_dtype(size):
+    for dtype in (np.int8,np.int16,np.int32):
+        if size < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+#Writes the data of the given attribute (att) into .npy files in the given directory (path), using the given prefix (prefix) for the file names.
+#Numerical and boolean data are written as they are, while string and categorical data are written as integer codes plus the table of their values.
+#The missing values of string and categorical data have code -1, and boolean data with missing values is written with a validity mask.
+def _save_attribute(att,path,prefix):
+    if isinstance(att,Categorical):
+        np.save(os.path.join(path,prefix+".codes.npy"),att.get_codes())
+        np.save(os.path.join(path,prefix+".values.npy"),np.array(att.get_categories(),dtype=str))
+    elif isinstance(att,String):
+        codes, uniques = pd.factorize(att.data)
+        np.save(os.path.join(path,prefix+".codes.npy"),codes.astype(_code_dtype(len(uniques))))
+        np.save(os.path.join(path,prefix+".values.npy"),np.array(uniques,dtype=str))
+    elif isinstance(att.data.dtype,pd.BooleanDtype):
+        np.save(os.path.join(path,prefix+".data.npy"),att.data.to_numpy(dtype=bool,na_value=False))
+        np.save(os.path.join(path,prefix+".valid.npy"),att.get_valid())
+    else:
+        np.save(os.path.join(path,prefix+".data.npy"),att.data.to_numpy())
+
+#Returns the attribute of the given type (kind) stored in the .npy files of the given directory (path) that start with the given prefix (prefix).
+#The data was validated when it was written, so it is not validated again. Numerical data can be memory-mapped (mmap) instead of being read.
+def _load_attribute(kind,path,prefix,mmap=False):
+    if kind == "Numerical" or kind == "Boolean":
+        data = pd.Series(np.load(os.path.join(path,prefix+".data.npy"),allow_pickle=False,mmap_mode="r+" if mmap and kind == "Numerical" else None))
+        if kind == "Boolean" and os.path.exists(os.path.join(path,prefix+".valid.npy")):
+            valid = np.load(os.path.join(path,prefix+".valid.npy"),allow_pickle=False)
+            data = pd.Series(pd.arrays.BooleanArray(data.to_numpy(),~valid))
+        return _from_validated(Numerical if kind == "Numerical" else Boolean,data)
+    codes = np.load(os.path.join(path,prefix+".codes.npy"),allow_pickle=False)
+    values = np.load(os.path.join(path,prefix+".values.npy"),allow_pickle=False).astype(object)
+    if kind == "Categorical":
+        return _from_validated(Categorical,pd.Series(pd.Categorical.from_codes(codes,values)))
+    #Columns where every value is missing have no values, so only the codes of the present values are looked up.
+    data = np.full(len(codes),np.NaN,dtype=object)
+    present = codes >= 0
+    data[present] = values[codes[present]]
+    return _from_validated(String,pd.Series(data,dtype=object))
 
 ### DATASET CLASS. The individual attributes of the data set are collected in a dictionary.
+@profiling.instrument
 class Dataset():
     
     ###################CONSTRUCTOR FUNCTION####################
-    def __init__(self,*args):
+    #The data types of the columns are checked once per attribute. The check can be skipped with validate=False for data that is known to be valid.
+    def __init__(self,*args,validate=True):
         self.attributes = None
         self.att_class = None
         self.length = 0
+        self.executor = executors.SerialExecutor()
+        self._scores = dict()
         if len(args)==1 or len(args)==2:
             if isinstance(args[0],pd.DataFrame):
                 self.attributes = dict()
@@ -20,16 +259,11 @@ class Dataset():
                         self.attributes = None
                         raise NameError("Input pd.DataFrame can't have duplicated column names.")
                     key = str(key)
-                    if value.dtype == int or value.dtype == float:
-                        self.attributes[key] = Numerical(value)
-                    elif value.dtype == bool:
-                        self.attributes[key] = Boolean(value)
-                    else:
-                        try:
-                            self.attributes[key] = String(value)
-                        except:
-                            self.attributes = None
-                            raise NameError("Attribute values must be numerical, bool, str. Each attribute can only contain one data type.")
+                    try:
+                        self.attributes[key] = _infer_attribute(value,validate)
+                    except:
+                        self.attributes = None
+                        raise NameError("Attribute values must be numerical, bool, str. Each attribute can only contain one data type.")
             else:
                 raise NameError("Attributes must be collected in a pd.DataFrame, where each column represents a different attribute.")
             if len(args)==2:
@@ -46,7 +280,8 @@ class Dataset():
     
     #Initializes the data set according to the input pd.DataFrame (att).
     #The name of the class variable can be specified through a parameter (c).
-    def set_data(self,att,c=None):
+    #The data types of the columns are not checked if validate=False.
+    def set_data(self,att,c=None,validate=True):
         self.attributes = None
         self.att_class = None
         self.length = 0
@@ -58,16 +293,11 @@ class Dataset():
                     self.attributes = None
                     raise NameError("Input pd.DataFrame can't have duplicated column names.")
                 key = str(key)
-                if value.dtype == int or value.dtype == float:
-                    self.attributes[key] = Numerical(value)
-                elif value.dtype == bool:
-                    self.attributes[key] = Boolean(value)
-                else:
-                    try:
-                        self.attributes[key] = String(value)
-                    except:
-                        self.attributes = None
-                        raise NameError("Attribute values must be numerical, bool, str. Each attribute can only contain one data type.")
+                try:
+                    self.attributes[key] = _infer_attribute(value,validate)
+                except:
+                    self.attributes = None
+                    raise NameError("Attribute values must be numerical, bool, str. Each attribute can only contain one data type.")
         else:
             raise NameError("Attributes must be collected in a pd.DataFrame, where each column represents a different attribute.")
         if c!=None:
@@ -78,6 +308,18 @@ class Dataset():
                 raise NameError("Class name must match an existing attribute name.")
         self.length = len(att.index)
 
+    #Sets the executor used by the operations that are applied to every attribute of the data set (summary statistics, discretization, standarization, normalization, AUC and mutual information).
+    #The executor can be given by name (executor = serial, thread, process) together with the number of jobs (n_jobs), or as an executor object from the executors module.
+    #The results don't depend on the executor: they are always computed in the same way and returned in the order of the attributes.
+    #A process executor keeps its pool of processes between operations, until its close method is called.
+    def set_executor(self,executor="serial",n_jobs=None):
+        if isinstance(executor,str):
+            self.executor = executors.get_executor(executor,n_jobs)
+        elif hasattr(executor,"map"):
+            self.executor = executor
+        else:
+            raise NameError("The executor must be the name of an executor (serial, thread, process) or an executor object.")
+
     #Initialize only the class name (c).
     def set_class(self,c):
         name = str(c)
@@ -104,6 +346,20 @@ class Dataset():
     def get_number_instances(self):
         return self.length
 
+    #Returns the executor used by the operations that are applied to every attribute of the data set.
+    def get_executor(self):
+        return self.executor
+
+    #Returns the cache information (version, hits, misses and cached statistics) of every attribute in the data set.
+    def cache_info_att(self):
+        return {key: value.get_cache_info() for key, value in self.attributes.items()}
+
+    #Returns a pd.DataFrame with the calls to the methods of the data sets and attributes recorded while the profiler is enabled (see profiling.enable), aggregated by method:
+    #number of calls, wall time (total, spent outside other recorded methods and mean), instances processed, cache hits and misses and, if memory is traced, bytes allocated and peak.
+    #The profiler is global, so the calls of every data set and attribute are included.
+    def profile_report(self):
+        return profiling.report()
+
     #############################################
 
     #Updates the specified attribute (att) of the instance in the specified index (ind).
@@ -114,6 +370,52 @@ class Dataset():
         else:
             raise NameError("Attribute not found.")
 
+    #Updates the specified attribute (att) of the instances in the given positions (indices) with the given values (values).
+    #The whole batch is checked at once (positions, types and possible values of categorical attributes) and written with a single assignment. The cached statistics are updated or discarded once.
+    def update_many(self,att,indices,values):
+        name = str(att)
+        if name in self.attributes.keys():
+            self.attributes[name].update_values(indices,values)
+        else:
+            raise NameError("Attribute not found.")
+
+    #Updates several attributes at once. The updates (updates) are given as a dictionary that maps the name of each attribute to a pair of positions and values, as in update_many.
+    #Every batch is checked before any attribute is modified, so either all the updates are applied or none of them.
+    def update_many_att(self,updates):
+        checked = dict()
+        for att, (indices, values) in updates.items():
+            name = str(att)
+            if name not in self.attributes.keys():
+                raise NameError("Attribute not found.")
+            checked[name] = self.attributes[name]._check_update(indices,values)
+        for name, (indices, values) in checked.items():
+            self.attributes[name]._apply_update(indices,values)
+
+    #Appends the instances of the given pd.DataFrame (df), whose columns must be the attributes of the data set, at the end of the data set.
+    #The new values are stored in growable buffers (see Attribute.append_values), so appending many small batches doesn't copy the whole data set each time, and the cached statistics are updated with the new values.
+    #The values of categorical attributes must be possible values, unless extend_categories=True is given: then the new values are added to the possible values.
+    #Every column is checked before any attribute is modified, so either all the instances are appended or none of them.
+    def append_rows(self,df,extend_categories=False):
+        if self.attributes == None:
+            raise NameError("The dataset is not initialized yet. Used the set_data function.")
+        if not isinstance(df,pd.DataFrame):
+            raise NameError("The new instances must be a pd.DataFrame.")
+        if set(str(key) for key in df.columns) != set(self.attributes.keys()) or len(df.columns) != len(self.attributes):
+            raise NameError("The new instances must have the same attributes as the dataset.")
+        checked = dict()
+        for key, value in df.items():
+            att = self.attributes[str(key)]
+            if isinstance(att,Categorical):
+                checked[str(key)] = att._check_values(value,extend_categories)
+            else:
+                checked[str(key)] = att._check_values(value)
+        for key, values in checked.items():
+            att = self.attributes[key]
+            if isinstance(att,Categorical) and extend_categories:
+                att._add_categories(values)
+            att._apply_append(values)
+        self.length += len(df.index)
+
     #Adds a single attribute (key: att) to an already existing dataset.
     def add_attribute(self,key,att):
         if isinstance(att,(np.ndarray,list)):
@@ -126,15 +428,10 @@ class Dataset():
             raise NameError("The attribute already exists.")
         if self.length != len(att):
             raise NameError("The length of the new attribute must be the same as the number of instances in the dataset.")
-        if att.dtype == int or att.dtype == float:
-            self.attributes[key] = Numerical(att)
-        elif att.dtype == bool:
-            self.attributes[key] = Boolean(att)
-        else:
-            try:
-                self.attributes[key] = String(att)
-            except:
-                raise NameError("Attribute values must be numerical, bool, str. The attribute can only contain one data type.")
+        try:
+            self.attributes[key] = _infer_attribute(att)
+        except:
+            raise NameError("Attribute values must be numerical, bool, str. The attribute can only contain one data type.")
 
     #Removes an attribute (att) from an already existing dataset.
     def remove_attribute(self,att):
@@ -159,34 +456,210 @@ class Dataset():
         else:
             raise NameError("Attribute not found.")
     
+    #Returns a new data set with the instances in the given rows (rows), which can be a boolean mask with one value per instance or an array-like of positions.
+    #The attributes of the new data set are views that share the data of the attributes of this data set: their types and possible values are kept without validating the data again,
+    #and the selected values are only gathered the first time the data of each attribute is used. Later changes to this data set are not seen by the views,
+    #except for the ones written to memory-mapped attributes before the views gather their data.
+    def select_rows(self,rows):
+        if self.attributes == None:
+            raise NameError("The dataset is not initialized yet. Used the set_data function.")
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            if rows.ndim != 1 or len(rows) != self.length:
+                raise NameError("The boolean mask must contain one value per instance.")
+            rows = np.flatnonzero(rows)
+        elif rows.size == 0:
+            rows = np.empty(0,dtype=np.intp)
+        elif rows.ndim != 1 or not np.issubdtype(rows.dtype,np.integer) or rows.min() < 0 or rows.max() >= self.length:
+            raise NameError("Rows must be a boolean mask or integers between 0 and the total number of instances.")
+        result = Dataset()
+        result.attributes = {key: value._select(rows) for key, value in self.attributes.items()}
+        result.att_class = self.att_class
+        result.length = len(rows)
+        result.executor = self.executor
+        return result
+
+    #Returns a new data set with the first instances (n) of the data set, whose attributes are views (see select_rows).
+    def head(self,n=5):
+        if type(n) != int or n < 0:
+            raise NameError("The number of instances must be a non-negative integer.")
+        return self.select_rows(np.arange(min(n,self.length)))
+
+    #Returns a new data set with the instances between the given positions (start, stop) with the given step (step), as in Python slices. Its attributes are views (see select_rows).
+    def slice(self,start=None,stop=None,step=None):
+        return self.select_rows(np.arange(self.length)[start:stop:step])
+
+    #Returns a new data set with a random sample of the given number of instances (n), drawn without replacement and kept in their original order. Its attributes are views (see select_rows).
+    #If an attribute is given (stratify), the sample keeps the proportion of instances of each of its values (missing values are one more group), rounding the largest remainders up.
+    #The random generator can be seeded (random_state) to obtain the same sample.
+    def sample(self,n,stratify=None,random_state=None):
+        if type(n) != int or n < 0 or n > self.length:
+            raise NameError("The number of instances must be an integer between 0 and the total number of instances.")
+        generator = np.random.default_rng(random_state)
+        if stratify is None:
+            return self.select_rows(np.sort(generator.choice(self.length,n,replace=False)))
+        name = str(stratify)
+        if name not in self.attributes:
+            raise NameError("Attribute not found.")
+        codes = self._factorize(name)[0]+1
+        order = np.argsort(codes,kind="stable")
+        sizes = np.bincount(codes)
+        quotas = sizes*n/self.length
+        counts = np.floor(quotas).astype(np.int64)
+        remainders = np.argsort(-(quotas-counts),kind="stable")[:n-counts.sum()]
+        counts[remainders] += 1
+        starts = np.concatenate(([0],np.cumsum(sizes)[:-1]))
+        rows = [generator.choice(order[start:start+size],count,replace=False) for start, size, count in zip(starts,sizes,counts) if count > 0]
+        return self.select_rows(np.sort(np.concatenate(rows)) if len(rows) > 0 else [])
+
     #Reads a csv file and stores the data in the data set.
-    def from_csv(self,file,header=True,sep=",",c=None):
-        try:
-            if header:
-                df = pd.read_csv(file,header=0,sep=sep)
+    #The columns to read (usecols) and their types (dtype) can be specified as in pd.read_csv.
+    #When a chunk size (chunksize) is given, the file is read in chunks of that number of rows: the type of each attribute is inferred from the first chunk, and each chunk is validated and appended to a growable typed buffer per attribute.
+    #In that case, the callback function (callback) is called after each chunk with the number of rows read so far and the number of rows read per second.
+    def from_csv(self,file,header=True,sep=",",c=None,chunksize=None,usecols=None,dtype=None,callback=None):
+        if chunksize is None:
+            try:
+                if header:
+                    df = pd.read_csv(file,header=0,sep=sep,usecols=usecols,dtype=dtype)
+                else:
+                    df = pd.read_csv(file,header=None,sep=sep,usecols=usecols,dtype=dtype)
+            except:
+                raise NameError("Csv file can't be read with the given parameters. Format: input file (string), header (boolean), separator (string), class attribute name.")
+            self.set_data(df,c)
+            return
+        self.attributes = None
+        self.att_class = None
+        self.length = 0
+        types = None
+        buffers = dict()
+        for chunk in _read_csv_chunks(file,header,sep,chunksize,usecols,dtype,callback):
+            if types is None:
+                types = dict()
+                for key in chunk.columns:
+                    name = str(key)
+                    types[name], values = _chunk_values(name,chunk[key])
+                    buffers[name] = ColumnBuffer(values.dtype,2*chunksize)
+                    buffers[name].append(values)
             else:
-                df = pd.read_csv(file,header=None,sep=sep)
-        except:
-            raise NameError("Csv file can't be read with the given parameters. Format: input file (string), header (boolean), separator (string), class attribute name.")
-        self.set_data(df,c)
+                for key in chunk.columns:
+                    name = str(key)
+                    buffers[name].append(_chunk_values(name,chunk[key],types[name])[1])
+        attributes = dict()
+        for name, buffer in buffers.items():
+            buffer.trim()
+            data = pd.Series(buffer.get_values())
+            #The chunks of categorical columns are buffered as their values, so the categories are the union of the values of every chunk.
+            if types[name] == Categorical:
+                data = pd.Series(pd.Categorical(data))
+            attributes[name] = _from_validated(types[name],_as_boolean(data) if types[name] == Boolean else data)
+            self.length = buffer.length
+        self.attributes = attributes
+        if c!=None:
+            self.set_class(c)
     
     #Writes the data set into a csv file.
+    #The file is written from a pd.DataFrame that shares the data of the attributes, so the data is not copied.
     def to_csv(self,file,header=True,sep=","):
-        df = pd.DataFrame(dict(zip([key for key,_ in self.attributes.items()],[value.data for _,value in self.attributes.items()])))
+        df = self._frame(False)
         try:
             df.to_csv(file,index=False,header=header,sep=sep)
         except:
             raise NameError("Csv file can't be written with the given parameters. Format: output file (string), header (boolean), separator (string).")
 
+    #Writes the data set into a directory (path) in a binary columnar format: one .npy file per column and a metadata.json file with the type of each attribute and the class name.
+    #The data of string and categorical attributes is stored as integer codes plus the table of their values, which keeps the possible values of the categorical attributes.
+    def to_binary(self,path):
+        metadata = {"format":"datapack","version":BINARY_FORMAT_VERSION,"class":self.att_class,"length":self.length,"attributes":[]}
+        try:
+            os.makedirs(path,exist_ok=True)
+            for index, (key, value) in enumerate(self.attributes.items()):
+                prefix = "column" + str(index)
+                _save_attribute(value,path,prefix)
+                metadata["attributes"].append({"name":key,"type":type(value).__name__,"prefix":prefix})
+            with open(os.path.join(path,"metadata.json"),"w") as file:
+                json.dump(metadata,file)
+        except:
+            raise NameError("The data set can't be written into the given directory.")
+
+    #Reads a data set written with the to_binary function from the given directory (path).
+    #A subset of attributes (attributes) can be read without reading the files of the rest. The class is kept only if it is one of the attributes read.
+    #With mmap=True the numerical attributes are memory-mapped instead of read: their statistics, normalization, standarization and discretization are computed block by block, and in-place transformations are written back to the files.
+    def from_binary(self,path,attributes=None,mmap=False):
+        try:
+            with open(os.path.join(path,"metadata.json")) as file:
+                metadata = json.load(file)
+        except:
+            raise NameError("The directory doesn't contain a data set written with the to_binary function.")
+        if metadata.get("format") != "datapack" or metadata.get("version") != BINARY_FORMAT_VERSION:
+            raise NameError("Unsupported binary data set format.")
+        stored = [item["name"] for item in metadata["attributes"]]
+        if attributes is None:
+            attributes = stored
+        else:
+            attributes = [str(att) for att in attributes]
+            if any([att not in stored for att in attributes]):
+                raise NameError("Attribute not found.")
+        result = dict()
+        try:
+            for item in metadata["attributes"]:
+                if item["name"] in attributes:
+                    result[item["name"]] = _load_attribute(item["type"],path,item["prefix"],mmap)
+        except:
+            raise NameError("The data set files can't be read from the given directory.")
+        self.attributes = result
+        self.length = metadata["length"] if len(result) > 0 else 0
+        self.att_class = metadata["class"] if metadata["class"] in result else None
+
     #Converts the dataset object into an equivalent dataframe.
-    def to_dataframe(self):
-        return pd.DataFrame({key: list(value.data) for key,value in self.attributes.items()})
+    #With copy=False, the columns of the pd.DataFrame share the data arrays of the attributes. The attributes copy their data before modifying it in place, so later changes to the data set do not reach the pd.DataFrame.
+    #Changes made to the pd.DataFrame, however, do reach the data set (without invalidating the cached statistics of its attributes).
+    def to_dataframe(self,copy=True):
+        df = self._frame(copy)
+        if not copy:
+            for value in self.attributes.values():
+                value._share()
+        return df
+
+    #Returns a pd.DataFrame with the data of the attributes (with a default index), copying the data arrays only if required (copy).
+    def _frame(self,copy):
+        return pd.DataFrame({key: value.data.values for key,value in self.attributes.items()},copy=copy)
     
     #Prints the data set in a readable format.
+    #IPython is imported the first time the data set is printed, so that importing the package doesn't load it. Without IPython, the pd.DataFrame is printed as text.
     def print_dataset(self):
+        try:
+            from IPython.display import display
+        except ImportError:
+            display = print
         display(self.to_dataframe())
         print("Dataset class: " + str(self.att_class))
 
+    #Returns the requested summary statistics (stats = count, mean, median, variance, mode, entropy) of every attribute in the data set as a nested dictionary.
+    #All the requested statistics that apply to an attribute are computed together in a single pass over its data.
+    #The statistics that are not cached are computed by the executor of the data set, one attribute per task.
+    def summary_att(self,stats=None):
+        if stats is None:
+            stats = STATS
+        elif any([stat not in STATS for stat in stats]):
+            raise NameError("Invalid statistic. Accepted statistics are: count, mean, median, variance, mode, entropy.")
+        requested = {key: [stat for stat in stats if stat in (NUMERICAL_STATS if isinstance(value,Numerical) else NOMINAL_STATS)] for key, value in self.attributes.items()}
+        missing = [(key,[stat for stat in requested[key] if stat not in self.attributes[key]._stats]) for key in self.attributes.keys()]
+        missing = [(key,item) for key, item in missing if len(item) > 0]
+        results = dict(zip([key for key, _ in missing],self.executor.map(_describe_task,[(_pack_attribute(self.attributes[key]),item) for key, item in missing])))
+        return {key: value._cached_stats(requested[key],lambda item, key=key: results[key]) for key, value in self.attributes.items()}
+
+    #Returns a pd.DataFrame with the type and the requested summary statistics (stats = count, mean, median, variance, mode, entropy) of every attribute in the data set.
+    #The statistics that do not apply to the type of an attribute are NaN.
+    def describe(self,stats=None):
+        summary = self.summary_att(stats)
+        columns = [stat for stat in STATS if stats is None or stat in stats]
+        return pd.DataFrame([[type(self.attributes[key]).__name__]+[value[stat] if stat in value else np.NaN for stat in columns] for key, value in summary.items()],index=list(summary.keys()),columns=["type"]+columns)
+
+    #Returns the given statistic (stat) of every attribute in the data set, or NaN for the attributes where it does not apply.
+    def _statistic_att(self,stat):
+        summary = self.summary_att([stat])
+        return dict(zip(list(summary.keys()),[value[stat] if stat in value else np.NaN for value in summary.values()]))
+
     #Returns the mean of the specified attribute (att).
     def mean(self,att):
         name = str(att)
@@ -198,24 +671,55 @@ class Dataset():
         else:
             raise NameError("Attribute not found.")
 
+    #Returns the number of missing values of every attribute in the data set.
+    def null_count_att(self):
+        return {key: value.null_count() for key, value in self.attributes.items()}
+
+    #Returns the statistics of every attribute in each group of instances that share the value of the given non-numerical attribute (by), which is the class attribute by default.
+    #The grouping attribute is factorized once and the statistics of each attribute are computed in a single pass with bincount (count, mean and variance for numerical attributes; count, mode and entropy for the rest).
+    #The attributes are distributed by the executor of the data set. The instances where the grouping attribute is missing are discarded.
+    #The result is a pd.DataFrame with one row per group and one column per attribute and statistic (a pd.MultiIndex).
+    def groupby_stats(self,by=None):
+        if self.attributes == None:
+            raise NameError("The dataset is not initialized yet. Used the set_data function.")
+        name = self.att_class if by is None else str(by)
+        if name is None or name not in self.attributes.keys():
+            raise NameError("Attribute not found.")
+        if not isinstance(self.attributes[name],(Boolean,String,Categorical)):
+            raise NameError("The instances can only be grouped by a boolean, string or categorical attribute.")
+        if isinstance(self.attributes[name],Categorical):
+            groups, labels = (self.attributes[name].get_codes(),self.attributes[name].get_categories())
+        else:
+            groups, labels = pd.factorize(self.attributes[name].data,sort=True)
+        keys = [key for key in self.attributes.keys() if key != name]
+        results = self.executor.map(_groupby_task,[_pack_attribute(self.attributes[key]) for key in keys],groups,len(labels))
+        columns = [(key,stat) for key, result in zip(keys,results) for stat in result.keys()]
+        frame = pd.DataFrame({column: results[keys.index(column[0])][column[1]] for column in columns},index=pd.Index(labels,name=name))
+        frame.columns = pd.MultiIndex.from_tuples(columns,names=["attribute","statistic"])
+        return frame
+
     #Returns the means of all the numerical attributes in the data set.
     def mean_att(self):
-        return dict(zip([key for key, _ in self.attributes.items()],[value.mean() if isinstance(value,Numerical) else np.NaN for _ , value in self.attributes.items()]))
+        return self._statistic_att("mean")
 
     #Returns the median of the specified attribute (att).
-    def median(self,att):
+    #If approx=True, the approximate value is computed from a sketch of the attribute and returned together with the bound of its error.
+    def median(self,att,approx=False):
         name = str(att)
         if name in self.attributes.keys():
             if(isinstance(self.attributes[att],Numerical)):
-                return self.attributes[name].median()
+                return self.attributes[name].median(approx)
             else:
                 raise NameError("Can't compute the median of a non-numerical attribute.")
         else:
             raise NameError("Attribute not found.")
 
     #Returns the medians of all the numerical attributes in the data set.
-    def median_att(self):
-        return dict(zip([key for key, _ in self.attributes.items()],[value.median() if isinstance(value,Numerical) else np.NaN for _ , value in self.attributes.items()]))
+    #If approx=True, the approximate medians are computed from the quantile sketches of the attributes and returned together with the bounds of their rank errors (see sketch_att).
+    def median_att(self,approx=False):
+        if approx:
+            return self._approx_statistic_att("median")
+        return self._statistic_att("median")
 
     #Returns the variance of the specified attribute (att).
     def variance(self,att):
@@ -230,79 +734,149 @@ class Dataset():
 
     #Returns the variances of all the numerical attributes in the data set.
     def variance_att(self):
-        return dict(zip([key for key, _ in self.attributes.items()],[value.variance() if isinstance(value,Numerical) else np.NaN for _ , value in self.attributes.items()]))
+        return self._statistic_att("variance")
 
     #Returns the mode of the specified attribute (att).
-    def mode(self,att):
+    #If approx=True, the approximate value is computed from a sketch of the attribute and returned together with the bound of its error.
+    def mode(self,att,approx=False):
         name = str(att)
         if name in self.attributes.keys():
             if(not isinstance(self.attributes[att],Numerical)):
-                return self.attributes[name].mode()
+                return self.attributes[name].mode(approx)
             else:
                 raise NameError("Can't compute the mode of a numerical attribute.")
         else:
             raise NameError("Attribute not found.")
 
     #Return the modes of all the non-numerical attributes in the data set.
-    def mode_att(self):
-        return dict(zip([key for key, _ in self.attributes.items()],[value.mode() if isinstance(value,(Boolean,String,Categorical)) else np.NaN for _ , value in self.attributes.items()]))
+    #If approx=True, the approximate modes are taken from the frequency sketches of the attributes and returned together with the maximum errors of their counts (see sketch_att).
+    def mode_att(self,approx=False):
+        if approx:
+            return self._approx_statistic_att("mode")
+        return self._statistic_att("mode")
 
     #Returns the entropy of the specified attribute (att).
-    def entropy(self,att):
+    #If approx=True, the approximate value is computed from a sketch of the attribute and returned together with the bound of its error.
+    def entropy(self,att,approx=False):
         name = str(att)
         if name in self.attributes.keys():
             if(not isinstance(self.attributes[att],Numerical)):
-                return self.attributes[name].entropy()
+                return self.attributes[name].entropy(approx)
             else:
                 raise NameError("Can't compute the entropy of a numerical attribute.")
         else:
             raise NameError("Attribute not found.")
     
     #Return the entropies of all the non-numerical attributes in the data set.
-    def entropy_att(self):
-        return dict(zip([key for key, _ in self.attributes.items()],[value.entropy() if isinstance(value,(Boolean,String,Categorical)) else np.NaN for _ , value in self.attributes.items()]))
+    #If approx=True, the approximate entropies are computed from the frequency sketches of the attributes and returned together with bounds of their errors (see sketch_att).
+    def entropy_att(self,approx=False):
+        if approx:
+            return self._approx_statistic_att("entropy")
+        return self._statistic_att("entropy")
+
+    #Returns the sketch with the default size of every attribute in the data set: a quantile sketch (sketches.KLLSketch) for numerical attributes, or a frequency sketch (sketches.FrequentItemsSketch) for the rest.
+    #The sketches that are not cached by the attributes are built by the executor of the data set. They can be merged with the sketches of other data sets with the same attributes.
+    def sketch_att(self):
+        return self._sketches(list(self.attributes.keys()))
+
+    #Returns a dictionary with the sketches with the default size of the given attributes (names), built by the executor of the data set if they are not cached.
+    def _sketches(self,names):
+        missing = [key for key in names if "sketch" not in self.attributes[key]._stats]
+        results = dict(zip(missing,self.executor.map(_sketch_task,[_pack_attribute(self.attributes[key]) for key in missing])))
+        return {key: self.attributes[key]._cached_stats(["sketch"],lambda stats, key=key: {"sketch":results[key]})["sketch"].copy() for key in names}
+
+    #Returns the approximate value of the given statistic (stat = median, mode, entropy) of every attribute in the data set together with the bound of its error, or NaN for the attributes where it does not apply.
+    def _approx_statistic_att(self,stat):
+        numerical = stat == "median"
+        names = [key for key, value in self.attributes.items() if isinstance(value,Numerical) == numerical]
+        result = self._sketches(names)
+        for key, sketch in result.items():
+            result[key] = sketch.quantile(0.5) if numerical else getattr(sketch,stat)()
+        return {key: result[key] if key in result else np.NaN for key in self.attributes.keys()}
     
-    #Returns the list of TPR and FPR values obtained when using the given numerical attribute (att) to predict the value of the boolean class variable.
-    #This function is used to compute the ROC curve.
-    def fpr_tpr(self,att):
+    #Returns a context manager that gives the executor of the data set, or a pool with the given number of processes (n_jobs) if specified, which is closed when the context ends.
+    @contextlib.contextmanager
+    def _executor_for(self,n_jobs):
+        if n_jobs is None:
+            yield self.executor
+            return
+        if type(n_jobs) != int or n_jobs < 1:
+            raise NameError("The number of jobs must be a positive integer.")
+        executor = executors.ProcessExecutor(n_jobs)
+        try:
+            yield executor
+        finally:
+            executor.close()
+
+    #Returns the values of the boolean class attribute as a bool array, where the missing values are False.
+    def _labels(self):
+        return self.attributes[self.att_class].data.to_numpy(dtype=bool,na_value=False)
+
+    #Returns the FPR and TPR arrays obtained when using the given numerical attribute (att) to predict the value of the boolean class variable.
+    def _roc_curve(self,att):
         if self.att_class == None:
             raise NameError("Class attribute not specified.")
-        elif len(set(self.attributes[self.att_class].data)) == 1:
+        elif self.attributes[self.att_class].data.nunique() == 1:
             raise NameError("The ROC curve is not defined when the class attribute contains only one class.")
         if isinstance(self.attributes[self.att_class],Boolean):
             name = str(att)
             if name in self.attributes and isinstance(self.attributes[name],Numerical):
-                df = pd.DataFrame.from_dict({name:self.attributes[name].data,self.att_class:self.attributes[self.att_class].data})
-                df_sorted = df.sort_values(name,ascending=True).reset_index(drop=True)
-                length = len(df_sorted)
-                cut_points = list(df_sorted[name].searchsorted(df_sorted[name].unique()))+[length]
-                TP = [len(df_sorted[(df_sorted.index >= i) & (df_sorted[self.att_class]==True)]) for i in cut_points]
-                TN = [len(df_sorted[(df_sorted.index < i) & (df_sorted[self.att_class]==False)]) for i in cut_points]
-                TPR = [TP[index]/(TP[index]+(i-TN[index])) for index,i in enumerate(cut_points)]
-                FPR = [((length-i)-TP[index])/(((length-i)-TP[index])+TN[index]) for index,i in enumerate(cut_points)]
-                return (FPR,TPR)
+                valid = self.attributes[name].get_valid() & self.attributes[self.att_class].get_valid()
+                return metrics.roc_curve(self.attributes[name].data.to_numpy()[valid],self._labels()[valid])
             else:
                 raise NameError("Only existing numerical attributes can be predictor variables.")
         else:
             raise NameError("Class must be boolean.")
+
+    #Returns the list of TPR and FPR values obtained when using the given numerical attribute (att) to predict the value of the boolean class variable.
+    #This function is used to compute the ROC curve.
+    def fpr_tpr(self,att):
+        FPR, TPR = self._roc_curve(att)
+        return (FPR.tolist(),TPR.tolist())
         
     #Returns the AUC score that is obtained when using the given numerical attribute (att) to predict the value of the boolean class variable.
     def roc_auc(self,att):
         try:
-            results = self.fpr_tpr(att)
+            FPR, TPR = self._roc_curve(att)
         except:
             raise NameError("Error when computing the ROC curve.")
-        FPR = results[0]
-        TPR = results[1]
-        return sum([(FPR[i]-FPR[i+1])*((TPR[i]-TPR[i+1])/2+TPR[i+1]) for i in range(len(TPR)-1)])
+        return metrics.auc(FPR,TPR)
     
     #Returns the AUC scores that are obtained when using each of the numerical attributes in the data set to predict the value of the boolean class variable.
-    def roc_auc_att(self):
+    #The numerical attributes are stacked into 2-D blocks that are scored in a single vectorized pass each. The size of the blocks is limited by the memory budget (max_memory, in bytes).
+    #The blocks are scored by the executor of the data set, or by a pool with the given number of processes (n_jobs) if specified.
+    #The instances where the class is missing are discarded, and the attributes with missing values are scored one by one without them.
+    def roc_auc_att(self,n_jobs=None,max_memory=None):
         if self.att_class == None:
             raise NameError("Class attribute not specified.")
         if not isinstance(self.attributes[self.att_class],Boolean):
             raise NameError("Class must be boolean.")
-        return dict(zip([key for key, _ in self.attributes.items()],[self.roc_auc(key) if isinstance(value,Numerical) else np.NaN for key , value in self.attributes.items()]))
+        with self._executor_for(n_jobs) as executor:
+            scores = self._roc_auc([key for key, value in self.attributes.items() if isinstance(value,Numerical)],executor,max_memory)
+        return dict(zip([key for key, _ in self.attributes.items()],[scores[key] if key in scores else np.NaN for key, _ in self.attributes.items()]))
+
+    #Returns a dictionary with the AUC scores of the given numerical attributes (names), computed as in roc_auc_att with the given executor (executor) and memory budget (max_memory).
+    def _roc_auc(self,names,executor,max_memory=None):
+        scores = dict()
+        if len(names) > 0:
+            rows = self.attributes[self.att_class]._mask()
+            labels = self._labels() if rows is None else self._labels()[rows]
+            if labels.all() or not labels.any():
+                raise NameError("Error when computing the ROC curve.")
+            incomplete = [key for key in names if self.attributes[key]._mask() is not None]
+            for key in incomplete:
+                scores[key] = self.roc_auc(key)
+            names = [key for key in names if key not in incomplete]
+            if max_memory == None:
+                size = len(names)
+            else:
+                size = metrics.auc_chunk_size(self.length,max_memory/executor.n_jobs)
+            chunks = [names[i:i+size] for i in range(0,len(names),size)]
+            blocks = (np.array([self.attributes[key].data.to_numpy() if rows is None else self.attributes[key].data.to_numpy()[rows] for key in chunk],dtype=float).T for chunk in chunks)
+            results = executor.map(metrics.auc_columns,blocks,labels)
+            for chunk, result in zip(chunks,results):
+                scores.update(zip(chunk,result.tolist()))
+        return scores
     
     #Returns the correlation between the given numerical attributes (att_A,att_B) using the specified method (method = pearson, spearman, kendall).
     def correlation(self,att_A,att_B,method="pearson"):
@@ -311,49 +885,157 @@ class Dataset():
         name_A = str(att_A)
         name_B = str(att_B)
         if name_A in self.attributes and name_B in self.attributes and isinstance(self.attributes[name_A],Numerical) and isinstance(self.attributes[name_B],Numerical):
-            return self.attributes[name_A].data.corr(self.attributes[name_B].data,method=method)
+            if name_A == name_B:
+                return metrics.correlation_matrix(self.attributes[name_A].data.to_numpy()[:,None],method=method)[0,0]
+            return metrics.correlation_matrix(np.column_stack([self.attributes[name_A].data.to_numpy(),self.attributes[name_B].data.to_numpy()]),method=method)[0,1]
         else:
             raise NameError("Correlation can only be computed between existing numerical attributes.")
     
     #Returns the correlations between all pairs of numerical attributes in the data set using the specified method (method = pearson, spearman, kendall).
-    def correlation_att(self,method="pearson"):
-        return dict(zip([key for key, _ in self.attributes.items()],[dict(zip([key2 for key2, _ in self.attributes.items()],[self.correlation(key1,key2,method=method) if isinstance(self.attributes[key1], Numerical) and isinstance(self.attributes[key2], Numerical) else np.NaN for key2, _ in self.attributes.items()])) for key1, _ in self.attributes.items()]))
+    #The numerical attributes are gathered into a single array and the whole matrix is computed at once (ranking each attribute only once for spearman).
+    #The result is returned as a nested dictionary, a square np.ndarray or a pd.DataFrame, depending on the requested form (form = dict, array, dataframe).
+    def correlation_att(self,method="pearson",form="dict"):
+        if method!="pearson" and method!="spearman" and method!="kendall":
+            raise NameError("Invalid correlation measure. Allowed measures are: pearson, spearman and kendall.")
+        if form!="dict" and form!="array" and form!="dataframe":
+            raise NameError("Invalid form. Allowed forms are: dict, array and dataframe.")
+        keys = [key for key, _ in self.attributes.items()]
+        positions = [index for index, key in enumerate(keys) if isinstance(self.attributes[key],Numerical)]
+        result = np.full((len(keys),len(keys)),np.NaN)
+        if len(positions) > 0:
+            X = np.column_stack([self.attributes[keys[index]].data.to_numpy() for index in positions])
+            result[np.ix_(positions,positions)] = metrics.correlation_matrix(X,method=method)
+        if form == "array":
+            return result
+        elif form == "dataframe":
+            return pd.DataFrame(result,index=keys,columns=keys)
+        return dict(zip(keys,[dict(zip(keys,row.tolist())) for row in result]))
     
+    #Returns the integer codes and the number of distinct values of the given non-numerical attribute (att).
+    def _factorize(self,att):
+        if isinstance(self.attributes[att],Categorical):
+            return (self.attributes[att].get_codes(),len(self.attributes[att].get_categories()))
+        codes, uniques = pd.factorize(self.attributes[att].data)
+        return (codes,len(uniques))
+
     #Returns the normalized mutual information between the given non-numerical attributes (att_A,att_B).
+    #It is computed from the contingency table of both attributes, which is built with a single pass over their integer codes. The instances where either attribute is missing are discarded.
     def norm_mutual_info(self,att_A,att_B):
         name_A = str(att_A)
         name_B = str(att_B)
         if name_A in self.attributes and name_B in self.attributes and isinstance(self.attributes[name_A],(Boolean,String,Categorical)) and isinstance(self.attributes[name_B],(Boolean,String,Categorical)):
-            if isinstance(self.attributes[name_A],Categorical):
-                vals = self.attributes[name_A].values
-            else:
-                vals = set(str(ind) for ind in set(self.attributes[name_A].data))
-            H_x = self.attributes[name_A].entropy()
-            H_y = self.attributes[name_B].entropy()
-            H_xy = 0
-            tot = len(self.attributes[name_B].data)
-            col_vals = self.attributes[name_B].data.value_counts()
-            auxiliar_cat = Categorical()
-            for value in set(self.attributes[name_B].data):
-                auxiliar_cat.set_data([str(ind) for ind in self.attributes[name_A].data[self.attributes[name_B].data == value]],vals)
-                H_xy += (col_vals[value]/tot)*auxiliar_cat.entropy()
-            return (2*(H_x - H_xy))/(H_x + H_y)
+            codes_A, n_A = self._factorize(name_A)
+            codes_B, n_B = self._factorize(name_B)
+            return metrics.norm_mutual_info(codes_A,codes_B,n_A,n_B)
         else:
             raise NameError("Mutual information can only be computed between existing boolean, string or categorical attributes.")
     
     #Returns the normalized mutual informations between all pairs of non-numerical attributes in the data set.
-    def norm_mutual_info_att(self):
-        return dict(zip([key for key, _ in self.attributes.items()],[dict(zip([key2 for key2, _ in self.attributes.items()],[self.norm_mutual_info(key1,key2) if isinstance(self.attributes[key1], (Boolean,String,Categorical)) and isinstance(self.attributes[key2], (Boolean,String,Categorical)) else np.NaN for key2, _ in self.attributes.items()])) for key1, _ in self.attributes.items()]))
+    #Each attribute is factorized once and only one of the two symmetric pairs is computed.
+    #The pairs are distributed by the executor of the data set, or by a pool with the given number of processes (n_jobs) if specified.
+    def norm_mutual_info_att(self,n_jobs=None):
+        with self._executor_for(n_jobs) as executor:
+            names = [key for key, value in self.attributes.items() if isinstance(value,(Boolean,String,Categorical))]
+            factorized = [self._factorize(key) for key in names]
+            codes = [item[0] for item in factorized]
+            sizes = [item[1] for item in factorized]
+            #The entropy of the attributes with missing values depends on the pair, so it is computed for each pair.
+            entropies = [metrics.entropy(np.bincount(item)) if item.min(initial=0) >= 0 else None for item in codes]
+            pairs = [(i,j) for i in range(len(names)) for j in range(i+1,len(names))]
+            size = max(1,int(np.ceil(len(pairs)/(4*executor.n_jobs))))
+            blocks = [pairs[i:i+size] for i in range(0,len(pairs),size)]
+            results = executor.map(metrics.norm_mutual_info_pairs,blocks,codes,sizes,entropies)
+        scores = {(names[i],names[i]): 1.0 if metrics.entropy(np.bincount(codes[i][codes[i] >= 0],minlength=sizes[i])) > 0 else np.NaN for i in range(len(names))}
+        for block, result in zip(blocks,results):
+            for (i, j), value in zip(block,result):
+                scores[(names[i],names[j])] = value
+                scores[(names[j],names[i])] = value
+        return dict(zip([key for key, _ in self.attributes.items()],[dict(zip([key2 for key2, _ in self.attributes.items()],[scores[(key1,key2)] if (key1,key2) in scores else np.NaN for key2, _ in self.attributes.items()])) for key1, _ in self.attributes.items()]))
+
+    #Returns the score of every attribute in the data set with respect to the class attribute using the given method (method = info_gain, nmi, auc, point_biserial, anova_f), or NaN for the attributes where it does not apply and for the class.
+    #The information gain (mutual information, in bits) and the normalized mutual information score the non-numerical attributes against a non-numerical class, and both are computed in the same pass.
+    #The AUC and the point-biserial correlation score the numerical attributes against a boolean class, and the one-way ANOVA F statistic scores them against a non-numerical class.
+    #The attributes are scored in blocks (stacked into 2-D arrays, for the numerical ones) by the executor of the data set, or by a pool with the given number of processes (n_jobs) if specified.
+    #The scores are cached with the versions of the attributes and the class, so later calls only score the attributes that were modified or added since. The instances where the class is missing are discarded.
+    #The cache only keeps weak references to the attributes, so the attributes that are replaced or removed are not kept alive by their scores.
+    def score_att(self,method,n_jobs=None):
+        if method not in SCORES:
+            raise NameError("Invalid score. Accepted scores are: info_gain, nmi, auc, point_biserial, anova_f.")
+        if self.att_class == None:
+            raise NameError("Class attribute not specified.")
+        target = self.attributes[self.att_class]
+        if method in ("auc","point_biserial") and not isinstance(target,Boolean):
+            raise NameError("Class must be boolean.")
+        elif isinstance(target,Numerical):
+            raise NameError("Class must be boolean, string or categorical.")
+        numerical = method in ("auc","point_biserial","anova_f")
+        names = [key for key, value in self.attributes.items() if key != self.att_class and isinstance(value,Numerical) == numerical and self._cached_score(method,key) is None]
+        if len(names) > 0:
+            with self._executor_for(n_jobs) as executor:
+                results = self._score(method,names,executor)
+            for name, scores in results.items():
+                cache = {key: entry for key, entry in self._scores.get(name,dict()).items() if key in self.attributes and entry[0]() is self.attributes[key]}
+                cache.update({key: (weakref.ref(self.attributes[key]),self.attributes[key].get_version(),weakref.ref(target),target.get_version(),score) for key, score in scores.items()})
+                self._scores[name] = cache
+        result = dict()
+        for key in self.attributes.keys():
+            score = self._cached_score(method,key)
+            result[key] = np.NaN if score is None else score
+        return result
+
+    #Returns the cached score of the given attribute (key) with the given method (method), or None if it hasn't been computed since the attribute or the class attribute were modified or replaced.
+    def _cached_score(self,method,key):
+        entry = self._scores.get(method,dict()).get(key)
+        if entry is None:
+            return None
+        att, version, target, target_version, score = (entry[0](),entry[1],entry[2](),entry[3],entry[4])
+        if att is not self.attributes[key] or target is None or version != att.get_version() or target is not self.attributes.get(self.att_class) or target_version != target.get_version():
+            return None
+        return score
+
+    #Returns a dictionary that maps each computed method to the scores of the given attributes (names) with respect to the class attribute, computed with the given executor (executor).
+    def _score(self,method,names,executor):
+        if method == "auc":
+            return {"auc":self._roc_auc(names,executor)}
+        size = max(1,int(np.ceil(len(names)/(4*executor.n_jobs))))
+        if method in ("info_gain","nmi"):
+            class_codes, n_class = self._factorize(self.att_class)
+            items = [self._factorize(key) for key in names]
+            results = [pair for chunk in executor.map(metrics.class_mutual_info,[items[i:i+size] for i in range(0,len(items),size)],class_codes,n_class) for pair in chunk]
+            return {"info_gain":dict(zip(names,[info for info, _ in results])),"nmi":dict(zip(names,[nmi for _, nmi in results]))}
+        rows = self.attributes[self.att_class]._mask()
+        if method == "point_biserial":
+            func, target = (metrics.point_biserial_columns,self._labels())
+        else:
+            func, target = (metrics.anova_f_columns,self._factorize(self.att_class)[0])
+        if rows is not None:
+            target = target[rows]
+        chunks = [names[i:i+size] for i in range(0,len(names),size)]
+        blocks = (np.array([self.attributes[key].data.to_numpy() if rows is None else self.attributes[key].data.to_numpy()[rows] for key in chunk],dtype=float).T for chunk in chunks)
+        scores = dict()
+        for chunk, result in zip(chunks,executor.map(func,blocks,target)):
+            scores.update(zip(chunk,result.tolist()))
+        return {method:scores}
+
+    #Returns the names of the given number of attributes (k) with the highest scores with respect to the class attribute using the given method (see score_att), from the highest to the lowest score.
+    #The attributes where the score does not apply or is not defined are left out. The scores are taken from the cache when possible.
+    def top_k(self,k,method,n_jobs=None):
+        if type(k) != int or k < 0:
+            raise NameError("The number of attributes must be a non-negative integer.")
+        scores = self.score_att(method,n_jobs)
+        names = [key for key, value in scores.items() if not np.isnan(value)]
+        return sorted(names,key=lambda key: -scores[key])[:k]
 
     #Discretizes the specified numerical attribute (att) using the specified method (method = frequency, width, custom) and number of intervals (num_bins) or cut points (cut_points).
-    def discretize(self, att, method, num_bins=None, cut_points=None):
+    #If approx=True, the cut points of the equal frequency discretization are taken from the quantile sketch of the attribute.
+    def discretize(self, att, method, num_bins=None, cut_points=None, approx=False):
         name = str(att)
         if(name not in self.attributes.keys()):
             raise NameError("Attribute not found.")
         if(not isinstance(self.attributes[name],Numerical)):
             raise NameError("Can't discretize a non-numerical attribute.")
         if method == "frequency":
-            self.attributes[name] = self.attributes[name].discretizeEF(num_bins)[0]
+            self.attributes[name] = self.attributes[name].discretizeEF(num_bins,approx)[0]
         elif method == "width":
             self.attributes[name] = self.attributes[name].discretizeEW(num_bins)[0]
         elif method == "custom":
@@ -362,16 +1044,15 @@ class Dataset():
             raise NameError("Invalid discretization method. Accepted methods are: frequency, width, custom.")
     
     #Discretizes all the numerical attributes in the data set using the specified method (method = frequency, width) and number of intervals (num_bins).
+    #The attributes are discretized by the executor of the data set, one attribute per task.
     def discretize_att(self, num_bins, method):
         if(type(num_bins)==int):
             if method != "frequency" and method != "width":
                 raise NameError("Invalid discretization method. Accepted methods are: frequency, width.")
-            for key,value in self.attributes.items():
-                if isinstance(value, Numerical):
-                    if method == "frequency":
-                        self.attributes[key] = self.attributes[key].discretizeEF(num_bins)[0]
-                    else:
-                        self.attributes[key] = self.attributes[key].discretizeEW(num_bins)[0]
+            keys = [key for key, value in self.attributes.items() if isinstance(value, Numerical)]
+            results = self.executor.map(_discretize_task,[_pack_attribute(self.attributes[key]) for key in keys],method,num_bins)
+            for key, result in zip(keys,results):
+                self.attributes[key] = _unpack_attribute(result,self.attributes[key].data.index)
         else:
             raise NameError("Number of intervals must be an integer.")
 
@@ -386,9 +1067,7 @@ class Dataset():
     
     #Standarizes all the numerical attributes in the data set so that they have mean = 0 and variance = 1.
     def standarize_att(self):
-        for key,value in self.attributes.items():
-            if isinstance(value, Numerical):
-                self.attributes[key].standarize()
+        self._transform_att("standarize")
 
     #Normalizes the specified numerical attribute (att) between 0 and 1.
     def normalize(self, att):
@@ -401,48 +1080,50 @@ class Dataset():
          
     #Normalizes all the numerical attributes in the data set between 0 and 1.
     def normalize_att(self):
-        for key,value in self.attributes.items():
-            if isinstance(value, Numerical):
-                self.attributes[key].normalize()
+        self._transform_att("normalize")
+
+    #Applies the given transformation (method = normalize, standarize) to all the numerical attributes in the data set.
+    #The attributes are transformed by the executor of the data set, one attribute per task. Memory-mapped attributes are transformed in place by the calling process instead, so that the changes are written to their files.
+    def _transform_att(self, method):
+        keys = [key for key, value in self.attributes.items() if isinstance(value, Numerical) and value._memmap() is None]
+        results = self.executor.map(_transform_task,[_pack_attribute(self.attributes[key]) for key in keys],method)
+        for key, result in zip(keys,results):
+            self.attributes[key].set_data(pd.Series(result,index=self.attributes[key].data.index),validate=False)
+        for key, value in self.attributes.items():
+            if isinstance(value, Numerical) and value._memmap() is not None:
+                getattr(value,method)()
 
-    #Filters the attributes in the data set according to a given metric (metric = variance, mean, median, entropy, auc).
+    #Returns a lazy version of the data set (see lazy.LazyDataset): its transformations are recorded in a plan, which is optimized and executed by its collect method, returning a new data set.
+    def lazy(self):
+        from .lazy import LazyDataset
+        return LazyDataset(self)
+
+    #Filters the attributes in the data set according to a given metric (metric = variance, mean, median, entropy, or one of the scores with respect to the class: auc, info_gain, nmi, point_biserial, anova_f).
+    #The scores are taken from the cache of score_att, so filtering again with other thresholds doesn't compute them again.
     #The value of the metric for each attribute is compared to a given value (threshold) using the specified comparator (comparator = lt, gt, le, ge, eq, neq).
     #If the comparison returns False, the attribute is removed from the data set.
     def filter_by(self,metric,comparator,threshold):
-        def _lt(a, b): return a < b
-        def _gt(a, b): return a > b
-        def _le(a, b): return a <= b
-        def _ge(a, b): return a >= b
-        def _eq(a, b): return a == b
-        def _neq(a, b): return a != b
         if type(threshold) != int and type(threshold) != float:
             raise NameError("The threshold value must be integer or float.")
+        values = self._metric_att(metric)
+        self._filter_values(values,_comparator(comparator),threshold)
+
+    #Returns the given metric (metric = variance, mean, median, entropy, or one of the scores) of every attribute in the data set, as used by filter_by.
+    def _metric_att(self,metric):
         if metric == "entropy":
-            values = self.entropy_att()
-        elif metric == "auc":
-            values = self.roc_auc_att()
+            return self.entropy_att()
+        elif metric in SCORES:
+            return self.score_att(metric)
         elif metric == "variance":
-            values = self.variance_att()
+            return self.variance_att()
         elif metric == "mean":
-            values = self.mean_att()
+            return self.mean_att()
         elif metric == "median":
-            values = self.median_att()
-        else:
-            raise NameError("Invalid metric. Accepted metrics are: entropy, auc, variance, mean, median.")
-        if comparator == "lt":
-            func = _lt
-        elif comparator == "gt":
-            func = _gt
-        elif comparator == "le":
-            func = _le
-        elif comparator == "ge":
-            func = _ge
-        elif comparator == "eq":
-            func = _eq
-        elif comparator == "neq":
-            func = _neq
-        else:
-            raise NameError("Invalid comparator. Accepted comparators: lt, gt, le, ge, eq, neq.")
+            return self.median_att()
+        raise NameError("Invalid metric. Accepted metrics are: entropy, auc, info_gain, nmi, point_biserial, anova_f, variance, mean, median.")
+
+    #Removes the attributes whose value of a metric (values) is not NaN and returns False when compared to a given value (threshold) with the given function (func). The class attribute is never removed.
+    def _filter_values(self,values,func,threshold):
         for key, value in values.items():
             if not np.isnan(value) and not func(value, threshold):
                 if key != self.att_class:
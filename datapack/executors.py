@@ -0,0 +1,222 @@
+import os
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+#Identifier of the call to map whose shared arguments are held by a worker of the process pool, the arguments and the shared memory blocks that they use.
+_shared_call = None
+_shared_args = ()
+_shared_blocks = []
+
+#Shared memory blocks attached by a worker of the process pool that are still used by the results of the worker. They are kept open until the worker finishes.
+_attached = []
+
+#Closes the given shared memory blocks (blocks) attached by a worker of the process pool, unless the results of the worker still use them.
+def _close(blocks):
+    for block in blocks:
+        try:
+            block.close()
+        except BufferError:
+            _attached.append(block)
+
+#Attaches the arguments (args) shared by all the items of the given call to map (call), unless the worker already holds them. The blocks of the arguments of the previous call are closed.
+def _attach_args(call,args):
+    global _shared_call, _shared_args, _shared_blocks
+    if call != _shared_call:
+        _shared_args = ()
+        _close(_shared_blocks)
+        _shared_blocks = []
+        _shared_args = _from_shared(args,_shared_blocks)
+        _shared_call = call
+
+#Applies the function (func) to the given item (item) with the arguments shared by the items of the given call to map (call, args), attaching first the arrays that were placed in shared memory or in memory-mapped files.
+#The shared memory blocks of the item are closed afterwards, unless the result still uses them.
+def _apply_shared(func,item,call,args):
+    _attach_args(call,args)
+    blocks = []
+    item = _from_shared(item,blocks)
+    result = func(item,*_shared_args)
+    del item
+    _close(blocks)
+    return result
+
+#Returns the file and the position in the file (in bytes) of the data of the given memory-mapped array (array), or None if its data is not a contiguous region of a file.
+#The offset kept by np.memmap is the one of the map, so the position of a view is found from the address of its data in the map.
+def _file_region(array):
+    if getattr(array,"filename",None) is None or getattr(array,"_mmap",None) is None or not array.flags.c_contiguous:
+        return None
+    import mmap
+    start = array.offset-array.offset%mmap.ALLOCATIONGRANULARITY
+    base = np.frombuffer(array._mmap,dtype=np.uint8).__array_interface__["data"][0]
+    return (array.filename,start+array.__array_interface__["data"][0]-base)
+
+#Returns a copy of the given item (item) where each numerical np.ndarray (also inside tuples and lists) is replaced by a reference to a new shared memory block holding its values.
+#Memory-mapped arrays are replaced by a reference to their region of the file instead, so their data is not read by the calling process. The created blocks are appended to the given list (blocks).
+def _to_shared(item,blocks):
+    if isinstance(item,np.memmap) and item.size > 0 and _file_region(item) is not None:
+        filename, offset = _file_region(item)
+        return MappedArray(filename,offset,item.shape,item.dtype.str)
+    elif isinstance(item,np.ndarray) and item.dtype != object and item.size > 0:
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(create=True,size=item.nbytes)
+        blocks.append(block)
+        np.ndarray(item.shape,dtype=item.dtype,buffer=block.buf)[...] = item
+        return SharedArray(block.name,item.shape,item.dtype.str)
+    elif isinstance(item,(tuple,list)):
+        return type(item)(_to_shared(value,blocks) for value in item)
+    return item
+
+#Returns a copy of the given item (item) where each reference to a shared memory block is replaced by an np.ndarray that uses the block as its buffer, and each reference to a region of a file by a memory map of the region.
+#The attached blocks are appended to the given list (blocks).
+def _from_shared(item,blocks):
+    if isinstance(item,(SharedArray,MappedArray)):
+        return item.attach(blocks)
+    elif isinstance(item,(tuple,list)):
+        return type(item)(_from_shared(value,blocks) for value in item)
+    return item
+
+#Returns the result of the given pending task (future) and removes its shared memory blocks (blocks).
+def _collect(task):
+    future, blocks = task
+    try:
+        return future.result()
+    finally:
+        _release(blocks)
+
+#Closes and removes the given shared memory blocks (blocks).
+def _release(blocks):
+    for block in blocks:
+        block.close()
+        block.unlink()
+    blocks.clear()
+
+### SHARED ARRAY CLASS. Reference to an np.ndarray placed in a shared memory block, which is sent to the processes instead of the values of the array.
+class SharedArray():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,name,shape,dtype):
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+    #############################################
+
+    #Returns the np.ndarray stored in the shared memory block, without copying it. The attached block is appended to the given list (blocks).
+    def attach(self,blocks):
+        from multiprocessing import shared_memory
+        block = shared_memory.SharedMemory(name=self.name)
+        blocks.append(block)
+        return np.ndarray(self.shape,dtype=np.dtype(self.dtype),buffer=block.buf)
+
+### MAPPED ARRAY CLASS. Reference to the region of a file that holds a memory-mapped np.ndarray, which is sent to the processes instead of the values of the array.
+class MappedArray():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,filename,offset,shape,dtype):
+        self.filename = filename
+        self.offset = offset
+        self.shape = shape
+        self.dtype = dtype
+
+    #############################################
+
+    #Returns a read-only memory map of the region of the file, so the process reads the data from the file as it is used. No block is appended to the given list (blocks).
+    def attach(self,blocks):
+        return np.memmap(self.filename,dtype=np.dtype(self.dtype),mode="r",offset=self.offset,shape=self.shape)
+
+### SERIAL EXECUTOR CLASS. Applies the functions to the items one after another in the calling thread.
+class SerialExecutor():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self):
+        self.n_jobs = 1
+
+    #############################################
+
+    #Applies the function (func) to each of the given items (items) with the extra arguments (args) and returns the list of results in the same order.
+    def map(self,func,items,*args):
+        return [func(item,*args) for item in items]
+
+### THREAD EXECUTOR CLASS. Applies the functions to the items in a pool with the given number of threads (n_jobs).
+### The threads share the data, so nothing is copied, but only the functions that release the GIL (most of the NumPy ones) run in parallel.
+class ThreadExecutor():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,n_jobs):
+        if type(n_jobs) != int or n_jobs < 1:
+            raise NameError("The number of jobs must be a positive integer.")
+        self.n_jobs = n_jobs
+
+    #############################################
+
+    #Applies the function (func) to each of the given items (items) with the extra arguments (args) and returns the list of results in the same order.
+    def map(self,func,items,*args):
+        if self.n_jobs == 1:
+            return [func(item,*args) for item in items]
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            return list(executor.map(lambda item: func(item,*args),items))
+
+### PROCESS EXECUTOR CLASS. Applies the functions to the items in a pool with the given number of processes (n_jobs).
+### The numerical arrays of the items are placed in shared memory blocks, so the processes read them without receiving a copy, and the memory-mapped arrays are mapped again by the processes from their files.
+### The extra arguments are placed in shared memory once per call to map and attached once by each process.
+### The functions must be defined at the top level of a module, and their results are sent back to the calling process.
+### The pool is started by the first call to map and kept alive for the next ones, until close is called.
+### The process pool and the shared memory blocks are only imported when they are first used, since loading them slows down the import of the package.
+class ProcessExecutor():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,n_jobs):
+        if type(n_jobs) != int or n_jobs < 1:
+            raise NameError("The number of jobs must be a positive integer.")
+        self.n_jobs = n_jobs
+        self._pool = None
+        self._calls = 0
+
+    #############################################
+
+    #Stops the processes of the pool. A later call to map starts a new pool.
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    #Applies the function (func) to each of the given items (items) with the extra arguments (args) and returns the list of results in the same order.
+    #At most n_jobs items are held in shared memory at the same time.
+    def map(self,func,items,*args):
+        if self.n_jobs == 1:
+            return [func(item,*args) for item in items]
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.n_jobs)
+        self._calls += 1
+        results = []
+        pending = deque()
+        arg_blocks = []
+        try:
+            args = _to_shared(args,arg_blocks)
+            for item in items:
+                if len(pending) >= self.n_jobs:
+                    results.append(_collect(pending.popleft()))
+                blocks = []
+                pending.append((self._pool.submit(_apply_shared,func,_to_shared(item,blocks),self._calls,args),blocks))
+            while len(pending) > 0:
+                results.append(_collect(pending.popleft()))
+        finally:
+            for future, blocks in pending:
+                future.cancel()
+                _release(blocks)
+            _release(arg_blocks)
+        return results
+
+#Returns the executor that corresponds to the given name (executor = serial, thread, process) and number of jobs (n_jobs).
+#If no number of jobs is given, the number of processors of the machine is used.
+def get_executor(executor="serial",n_jobs=None):
+    if executor == "serial":
+        return SerialExecutor()
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    if executor == "thread":
+        return ThreadExecutor(n_jobs)
+    elif executor == "process":
+        return ProcessExecutor(n_jobs)
+    raise NameError("Invalid executor. Accepted executors are: serial, thread, process.")
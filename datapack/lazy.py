@@ -0,0 +1,362 @@
+import numpy as np
+import pandas as pd
+from .attributes import Numerical, Categorical, _from_validated
+from .dataset import Dataset, METRICS, _comparator, _pack_attribute, _unpack_attribute, _discretize_task as _discretize_packed
+from . import profiling
+
+#Returns the data array of the packed numerical attribute (packed) after applying the affine transformation ((x - shift) / scale), in a single pass that writes a new array.
+def _affine(packed,shift,scale):
+    values = packed[1]
+    result = np.empty(len(values),dtype=float)
+    with np.errstate(invalid="ignore",divide="ignore"):
+        np.subtract(values,shift,out=result)
+        result /= scale
+    return result
+
+#Returns the data array of a packed numerical attribute after applying an affine transformation. The item (item) holds the packed attribute and the shift and scale of the transformation.
+def _affine_task(item):
+    packed, shift, scale = item
+    return _affine(packed,shift,scale)
+
+#Returns the packed categorical attribute obtained by discretizing a packed numerical attribute after applying an affine transformation (see _affine_task) with the given method (method = frequency, width) and number of intervals (num_bins).
+#The transformed data only lives inside the task. No transformation is applied if the shift and the scale are None.
+def _discretize_task(item,method,num_bins):
+    packed, shift, scale = item
+    if shift is not None:
+        packed = (Numerical,_affine(packed,shift,scale),None)
+    return _discretize_packed(packed,method,num_bins)
+
+#Returns a new attribute of the same class as the given one (att) that shares its data and copies its cached statistics. Both attributes copy the data before modifying it in place.
+def _shared_copy(att):
+    result = _from_validated(type(att),att.data)
+    result._stats = dict(att._stats)
+    result._share()
+    att._share()
+    return result
+
+### LAZY COLUMN CLASS. State of an attribute of a lazy data set while its plan is executed.
+### The normalizations and standarizations of a numerical attribute are not applied when they are found: they are composed into a single affine transformation ((x - shift) / scale) of the data of the source attribute.
+### The parameters of each transformation are derived from the statistics of the source attribute (mean, variance, minimum and maximum), which are computed once, so the data is only read for the statistics and written once, when it is needed.
+### A pruned column is not computed at all: only its type is tracked, so that the plan raises the same errors as the eager data set.
+class _LazyColumn():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,att):
+        self.att = att
+        self.kind = type(att)
+        self.pending = []
+        self.shift = None
+        self.scale = None
+        self.min_max = None
+        self.pruned = False
+
+    #############################################
+
+    #Returns True if the column holds a transformation of the data of its attribute that hasn't been applied yet.
+    def is_transformed(self):
+        return len(self.pending) > 0 or self.shift is not None
+
+    #Composes the pending transformations into the affine transformation of the column. The statistics of the source attribute must be available (see LazyDataset._prepare).
+    def resolve(self):
+        if len(self.pending) == 0:
+            return
+        shift, scale = (np.float64(0.0),np.float64(1.0)) if self.shift is None else (self.shift,self.scale)
+        #Constant or empty source attributes give a zero or NaN scale, as the eager transformations do.
+        with np.errstate(invalid="ignore",divide="ignore"):
+            for method in self.pending:
+                #The transformed data is (x - shift) / scale, so its statistics are derived from the ones of the source data (x).
+                if method == "standarize":
+                    stats = self.att._stats
+                    low, size = ((stats["mean"]-shift)/scale,np.sqrt(stats["variance"])/scale)
+                else:
+                    low, size = ((self.min_max[0]-shift)/scale,(self.min_max[1]-self.min_max[0])/scale)
+                shift, scale = (shift+low*scale,scale*size)
+        self.shift, self.scale = (shift,scale)
+        self.pending = []
+
+    #Returns the statistics of the transformed data that can be derived from the cached statistics of the source attribute (count, mean, median, variance).
+    #Nothing is derived if the scale isn't a positive number (constant or empty source attributes), since the transformed values are not finite.
+    def derived_stats(self):
+        if not 0 < self.scale < np.inf:
+            return dict()
+        stats = self.att._stats
+        derived = {key: (stats[key]-self.shift)/self.scale for key in ("mean","median") if key in stats}
+        if "variance" in stats:
+            derived["variance"] = stats["variance"]/self.scale**2
+        if "count" in stats:
+            derived["count"] = stats["count"]
+        return derived
+
+    #Returns the packed source attribute with the parameters of its affine transformation, or with None if it isn't transformed (see _discretize_task).
+    def item(self):
+        return (_pack_attribute(self.att),self.shift,self.scale)
+
+    #Replaces the attribute of the column by a new numerical attribute with the transformed data (values), whose statistics are derived from the ones of the source attribute.
+    def materialize(self,values):
+        att = _from_validated(Numerical,pd.Series(values,index=self.att.data.index))
+        att._stats = self.derived_stats()
+        self.set_attribute(att)
+
+    #Replaces the attribute of the column by the given one (att), which holds the data with every transformation applied.
+    def set_attribute(self,att):
+        self.att = att
+        self.kind = type(att)
+        self.shift, self.scale, self.min_max = (None,None,None)
+
+### LAZY DATASET CLASS. Records the transformations of a data set in a plan, which is optimized and executed on collect, returning a new data set. The source data set is not modified.
+### The methods have the same parameters and raise the same errors as the ones of the Dataset class, and they return the lazy data set so that they can be chained.
+### The transformed numerical attributes of the new data set are held in memory, even if the source attributes are memory-mapped.
+### The plan is optimized in three ways:
+### - The normalizations and standarizations of each numerical attribute are fused into one affine transformation, which is applied in a single pass when the attribute is discretized or collected.
+### - The attributes removed by remove_attribute are pruned: the steps between the last filter that precedes the removal and the removal itself are not computed for them.
+### - The statistics are shared between the steps: the parameters of the transformations and the mean, median and variance used by filter_by are derived from the statistics of the source attributes,
+###   and the scores are computed on the source data, since they don't change with a positive affine transformation. The statistics computed while executing the plan stay cached in the attributes of the new data set.
+@profiling.instrument
+class LazyDataset():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,dataset):
+        if dataset.attributes == None:
+            raise NameError("The dataset is not initialized yet. Used the set_data function.")
+        self.dataset = dataset
+        self.plan = []
+
+    ###################GETTERS####################
+
+    #Returns the steps of the plan, as tuples with the name of the method and its parameters.
+    def get_plan(self):
+        return list(self.plan)
+
+    #############################################
+
+    #Adds a step with the given method (method) and parameters (args) to the plan and returns the lazy data set.
+    def _add(self,method,*args):
+        self.plan.append((method,)+args)
+        return self
+
+    #Standarizes the specified numerical attribute (att) so that it has mean = 0 and variance = 1.
+    def standarize(self,att):
+        return self._add("standarize",str(att))
+
+    #Standarizes all the numerical attributes in the data set so that they have mean = 0 and variance = 1.
+    def standarize_att(self):
+        return self._add("standarize_att")
+
+    #Normalizes the specified numerical attribute (att) between 0 and 1.
+    def normalize(self,att):
+        return self._add("normalize",str(att))
+
+    #Normalizes all the numerical attributes in the data set between 0 and 1.
+    def normalize_att(self):
+        return self._add("normalize_att")
+
+    #Discretizes the specified numerical attribute (att) using the specified method (method = frequency, width, custom) and number of intervals (num_bins) or cut points (cut_points).
+    def discretize(self,att,method,num_bins=None,cut_points=None):
+        if method == "frequency" or method == "width":
+            _check_bins(num_bins)
+        elif method == "custom":
+            if not all([type(item)==int or type(item)==float for item in cut_points]):
+                raise NameError("Cut points must be a numerical list.")
+            if len(cut_points) < 1:
+                raise NameError("Cut point list must contain at least one cut point.")
+        else:
+            raise NameError("Invalid discretization method. Accepted methods are: frequency, width, custom.")
+        return self._add("discretize",str(att),method,num_bins,cut_points)
+
+    #Discretizes all the numerical attributes in the data set using the specified method (method = frequency, width) and number of intervals (num_bins).
+    def discretize_att(self,num_bins,method):
+        if type(num_bins) != int:
+            raise NameError("Number of intervals must be an integer.")
+        if method != "frequency" and method != "width":
+            raise NameError("Invalid discretization method. Accepted methods are: frequency, width.")
+        if num_bins < 2:
+            raise NameError("Number of intervals must be equal to or higher than 2.")
+        return self._add("discretize_att",num_bins,method)
+
+    #Converts an attribute (att) to categorical. The possible values of the categorical attribute can be specified through a parameter (values).
+    def to_categorical_attribute(self,att,values=None):
+        return self._add("to_categorical_attribute",str(att),values)
+
+    #Filters the attributes in the data set according to a given metric (metric), comparator (comparator) and value (threshold), as Dataset.filter_by.
+    def filter_by(self,metric,comparator,threshold):
+        if type(threshold) != int and type(threshold) != float:
+            raise NameError("The threshold value must be integer or float.")
+        if metric not in METRICS:
+            raise NameError("Invalid metric. Accepted metrics are: entropy, auc, info_gain, nmi, point_biserial, anova_f, variance, mean, median.")
+        _comparator(comparator)
+        return self._add("filter_by",metric,comparator,threshold)
+
+    #Removes the specified attribute (att) from the data set.
+    def remove_attribute(self,att):
+        return self._add("remove_attribute",str(att))
+
+    #Returns the optimized plan: the steps of the plan with a prune step before the first one that doesn't need to compute each removed attribute.
+    def optimize(self):
+        plan = list(self.plan)
+        prunes = dict()
+        for i, step in enumerate(plan):
+            if step[0] == "remove_attribute":
+                filters = [j for j in range(i) if plan[j][0] == "filter_by"]
+                position = filters[-1]+1 if len(filters) > 0 else 0
+                prunes.setdefault(position,[]).append(step[1])
+        optimized = []
+        for i, step in enumerate(plan):
+            optimized.extend(("prune",name) for name in prunes.get(i,[]))
+            optimized.append(step)
+        return optimized
+
+    #Returns a readable description of the optimized plan (see optimize), with one step per line.
+    def explain(self):
+        return "\n".join(step[0] + "(" + ", ".join(repr(arg) for arg in step[1:]) + ")" for step in self.optimize())
+
+    #Executes the optimized plan and returns the resulting data set. The source data set is not modified.
+    def collect(self):
+        self.columns = {key: _LazyColumn(value) for key, value in self.dataset.attributes.items()}
+        self.att_class = self.dataset.att_class
+        try:
+            for step in self.optimize():
+                getattr(self,"_run_" + step[0])(*step[1:])
+            self._materialize([column for column in self.columns.values() if column.is_transformed()])
+            result = Dataset()
+            result.attributes = {key: column.att if column.att is not self.dataset.attributes.get(key) else _shared_copy(column.att) for key, column in self.columns.items()}
+            result.att_class = self.att_class
+            result.length = self.dataset.length if len(result.attributes) > 0 else 0
+            result.executor = self.dataset.executor
+            return result
+        finally:
+            del self.columns, self.att_class
+
+    #Returns the column of the specified attribute (name) while the plan is executed, checking that it exists and, if a verb (verb) is given, that it is numerical.
+    def _column(self,name,verb=None):
+        if name not in self.columns:
+            raise NameError("Attribute not found.")
+        if verb is not None and not issubclass(self.columns[name].kind,Numerical):
+            raise NameError("Can't " + verb + " a non-numerical attribute.")
+        return self.columns[name]
+
+    #Computes together the statistics of the source attributes that are needed to resolve the pending transformations of the given columns (columns), and resolves them.
+    #The means and variances are computed by the executor of the source data set and cached by the source attributes.
+    def _prepare(self,columns):
+        columns = [column for column in columns if len(column.pending) > 0]
+        moments = [column for column in columns if "standarize" in column.pending]
+        if len(moments) > 0:
+            probe = Dataset()
+            probe.attributes = {str(i): column.att for i, column in enumerate(moments)}
+            probe.executor = self.dataset.executor
+            probe.summary_att(["count","mean","variance"])
+        for column in columns:
+            if "normalize" in column.pending and column.min_max is None:
+                column.min_max = column.att._min_max()
+            column.resolve()
+
+    #Applies the transformations of the given columns (columns) with the executor of the source data set, one column per task.
+    def _materialize(self,columns):
+        self._prepare(columns)
+        results = self.dataset.executor.map(_affine_task,[column.item() for column in columns])
+        for column, values in zip(columns,results):
+            column.materialize(values)
+
+    #Marks the specified attribute (name) as pruned, if it still exists.
+    def _run_prune(self,name):
+        if name in self.columns:
+            self.columns[name].pruned = True
+
+    #Adds a transformation (method = normalize, standarize) to the pending transformations of the specified numerical attribute (name).
+    def _run_elementwise(self,method,name):
+        column = self._column(name,method)
+        if not column.pruned:
+            column.pending.append(method)
+
+    #Adds the standarization to the pending transformations of the specified numerical attribute (name).
+    def _run_standarize(self,name):
+        self._run_elementwise("standarize",name)
+
+    #Adds the normalization to the pending transformations of the specified numerical attribute (name).
+    def _run_normalize(self,name):
+        self._run_elementwise("normalize",name)
+
+    #Adds the standarization to the pending transformations of every numerical attribute.
+    def _run_standarize_att(self):
+        for column in self.columns.values():
+            if issubclass(column.kind,Numerical) and not column.pruned:
+                column.pending.append("standarize")
+
+    #Adds the normalization to the pending transformations of every numerical attribute.
+    def _run_normalize_att(self):
+        for column in self.columns.values():
+            if issubclass(column.kind,Numerical) and not column.pruned:
+                column.pending.append("normalize")
+
+    #Discretizes the specified numerical attribute (name), applying its pending transformations first.
+    def _run_discretize(self,name,method,num_bins,cut_points):
+        column = self._column(name,"discretize")
+        if column.pruned:
+            column.kind = Categorical
+            return
+        if column.is_transformed():
+            self._materialize([column])
+        if method == "frequency":
+            column.set_attribute(column.att.discretizeEF(num_bins)[0])
+        elif method == "width":
+            column.set_attribute(column.att.discretizeEW(num_bins)[0])
+        else:
+            column.set_attribute(column.att.discretize(cut_points)[0])
+
+    #Discretizes all the numerical attributes with the executor of the source data set, one attribute per task. The pending transformations of each attribute are applied inside its task.
+    def _run_discretize_att(self,num_bins,method):
+        columns = [column for column in self.columns.values() if issubclass(column.kind,Numerical)]
+        for column in columns:
+            if column.pruned:
+                column.kind = Categorical
+        columns = [column for column in columns if not column.pruned]
+        self._prepare(columns)
+        results = self.dataset.executor.map(_discretize_task,[column.item() for column in columns],method,num_bins)
+        for column, result in zip(columns,results):
+            column.set_attribute(_unpack_attribute(result,column.att.data.index))
+
+    #Converts the specified attribute (name) to categorical.
+    def _run_to_categorical_attribute(self,name,values):
+        column = self._column(name)
+        if issubclass(column.kind,Numerical):
+            raise NameError("Numerical attributes can't be converted to categorical.")
+        if column.pruned:
+            column.kind = Categorical
+        else:
+            column.set_attribute(column.att.to_categorical(values=values))
+
+    #Filters the attributes according to the given metric (metric), comparator (comparator) and value (threshold).
+    #The metric is computed on a data set that holds the source attributes of the transformed numerical columns, and the mean, median and variance of those columns are derived from it.
+    #The columns whose transformation isn't increasing (constant or empty source attributes) are transformed first, so their metrics are computed on the transformed data.
+    def _run_filter_by(self,metric,comparator,threshold):
+        columns = {key: column for key, column in self.columns.items() if not column.pruned}
+        transformed = [column for column in columns.values() if column.is_transformed()]
+        self._prepare(transformed)
+        self._materialize([column for column in transformed if not column.scale > 0])
+        probe = Dataset()
+        probe.attributes = {key: column.att for key, column in columns.items()}
+        probe.att_class = self.att_class
+        probe.length = self.dataset.length
+        probe.executor = self.dataset.executor
+        values = probe._metric_att(metric)
+        if metric in ("mean","median","variance"):
+            for key, column in columns.items():
+                if column.is_transformed():
+                    values[key] = column.derived_stats()[metric]
+        probe._filter_values(values,_comparator(comparator),threshold)
+        for key in columns.keys():
+            if key not in probe.attributes:
+                del self.columns[key]
+
+    #Removes the specified attribute (name).
+    def _run_remove_attribute(self,name):
+        self._column(name)
+        del self.columns[name]
+        if name == self.att_class:
+            self.att_class = None
+
+#Checks the number of intervals (num_bins) of an equal width or equal frequency discretization.
+def _check_bins(num_bins):
+    if type(num_bins) != int:
+        raise NameError("Number of intervals must be an integer.")
+    if num_bins < 2:
+        raise NameError("Number of intervals must be equal to or higher than 2.")
@@ -0,0 +1,393 @@
+import numpy as np
+
+#Returns the FPR and TPR arrays of the ROC curve obtained when using the given scores (scores) to predict the boolean labels (labels).
+#The scores are sorted once and the confusion matrix of every cut point is obtained from cumulative sums over the sorted labels.
+def roc_curve(scores,labels):
+    scores = np.asarray(scores)
+    labels = np.asarray(labels,dtype=bool)
+    length = len(scores)
+    order = np.argsort(scores,kind="mergesort")
+    sorted_scores = scores[order]
+    sorted_labels = labels[order]
+    #The cut points are the first positions of each unique score in the sorted array, plus the array length.
+    cut_points = np.append(np.flatnonzero(np.r_[True,sorted_scores[1:]!=sorted_scores[:-1]]),length)
+    pos_below = np.concatenate(([0],np.cumsum(sorted_labels)))[cut_points]
+    P = pos_below[-1]
+    N = length-P
+    TP = P-pos_below
+    FP = (length-cut_points)-TP
+    return (FP/N,TP/P)
+
+#Returns the area under the curve defined by the given FPR and TPR arrays (fpr,tpr) using the trapezoidal rule.
+#The trapezoids are accumulated sequentially, so the result matches the one obtained by adding them one by one.
+def auc(fpr,tpr):
+    fpr = np.asarray(fpr)
+    tpr = np.asarray(tpr)
+    areas = (fpr[:-1]-fpr[1:])*((tpr[:-1]-tpr[1:])/2+tpr[1:])
+    if len(areas) == 0:
+        return 0.0
+    return float(np.cumsum(areas)[-1])
+
+#Approximate number of bytes of working memory needed per value when computing the AUC scores of a 2-D array.
+AUC_BYTES_PER_VALUE = 80
+
+#Returns the sorting order of each row of the 2-D array (X) and the average ranks (starting at 1) of the sorted values of each row.
+def _sorted_ranks(X):
+    length = X.shape[1]
+    order = np.argsort(X,axis=1)
+    sorted_X = np.take_along_axis(X,order,axis=1)
+    positions = np.arange(length)
+    first = np.ones(X.shape,dtype=bool)
+    first[:,1:] = sorted_X[:,1:]!=sorted_X[:,:-1]
+    del sorted_X
+    last = np.ones(X.shape,dtype=bool)
+    last[:,:-1] = first[:,1:]
+    #Each group of tied values spans from the position of its first value to the position of its last value.
+    first_pos = np.maximum.accumulate(np.where(first,positions,0),axis=1)
+    last_pos = np.minimum.accumulate(np.where(last,positions,length-1)[:,::-1],axis=1)[:,::-1]
+    return (order,(first_pos+last_pos)/2+1)
+
+#Returns the AUC score of every column of the 2-D array (X) when used to predict the boolean labels (labels).
+#The AUC is computed as the normalized Mann-Whitney U statistic of each column, giving tied values their average rank.
+#The columns are processed as contiguous rows of X.T, so column-major (Fortran ordered) arrays avoid an extra copy.
+def auc_columns(X,labels):
+    X = np.ascontiguousarray(np.asarray(X,dtype=float).T)
+    labels = np.asarray(labels,dtype=bool)
+    P = int(labels.sum())
+    N = X.shape[1]-P
+    order, ranks = _sorted_ranks(X)
+    rank_sum = (ranks*labels[order]).sum(axis=1)
+    return (rank_sum-P*(P+1)/2)/(P*N)
+
+#Returns the number of columns of a 2-D array with the given number of rows (n_rows) whose AUC scores can be computed within the memory budget (max_memory, in bytes).
+def auc_chunk_size(n_rows,max_memory):
+    return max(1,int(max_memory//(max(n_rows,1)*AUC_BYTES_PER_VALUE)))
+
+#Returns the entropy (in bits) of the distribution defined by the given array of counts (counts).
+def entropy(counts):
+    counts = np.asarray(counts)
+    if counts.sum() == 0:
+        return 0.0
+    p = counts[counts>0]/counts.sum()
+    return float(-np.sum(p*np.log2(p)))
+
+#Returns the counts of the pairs of integer codes (codes_A,codes_B) that appear in the data, where the codes take values in [0,n_A) and [0,n_B).
+#The counts are obtained with a single bincount over the combined codes, unless the full contingency table would be much larger than the data.
+def joint_counts(codes_A,codes_B,n_A,n_B):
+    combined = np.asarray(codes_A,dtype=np.int64)*n_B+np.asarray(codes_B,dtype=np.int64)
+    if n_A*n_B <= 2*len(combined)+1024:
+        return np.bincount(combined,minlength=n_A*n_B)
+    return np.unique(combined,return_counts=True)[1]
+
+#Returns the entropy (in bits) of each row of the given 2-D array of counts (table), or 0.0 for the rows without counts.
+def entropy_rows(table):
+    table = np.asarray(table,dtype=float)
+    totals = table.sum(axis=1,keepdims=True)
+    p = np.divide(table,totals,out=np.zeros_like(table),where=totals>0)
+    logs = np.log2(p,out=np.zeros_like(p),where=p>0)
+    return -np.sum(p*logs,axis=1)+0.0
+
+#Returns the 2-D array with the counts of each integer code (codes, in [0,n_codes)) in each group (groups, in [0,n_groups)), computed with a single bincount.
+#The values without a group or a code (-1) are discarded.
+def group_counts(groups,n_groups,codes,n_codes):
+    groups = np.asarray(groups,dtype=np.int64)
+    codes = np.asarray(codes,dtype=np.int64)
+    valid = (groups >= 0) & (codes >= 0)
+    return np.bincount(groups[valid]*n_codes+codes[valid],minlength=n_groups*n_codes).reshape(n_groups,n_codes)
+
+#Returns the count, the mean and the variance (with one degree of freedom) of the values (values) in each group, given the group of each value (groups, in [0,n_groups), or -1 for no group).
+#Each statistic is computed with a bincount over all the values, taking the deviations from the mean of the group. Missing values (NaN) are discarded.
+#The mean is NaN for the empty groups and the variance is NaN for the groups with less than two values.
+def group_moments(groups,n_groups,values):
+    groups = np.asarray(groups,dtype=np.int64)
+    values = np.asarray(values,dtype=float)
+    valid = (groups >= 0) & ~np.isnan(values)
+    groups, values = (groups[valid],values[valid])
+    count = np.bincount(groups,minlength=n_groups)
+    mean = np.full(n_groups,np.NaN)
+    np.divide(np.bincount(groups,weights=values,minlength=n_groups),count,out=mean,where=count>0)
+    variance = np.full(n_groups,np.NaN)
+    np.divide(np.bincount(groups,weights=(values-mean[groups])**2,minlength=n_groups),count-1,out=variance,where=count>1)
+    return (count,mean,variance)
+
+#Returns the normalized mutual information between two attributes given their integer codes (codes_A,codes_B), number of distinct values (n_A,n_B) and entropies (H_A,H_B).
+#Missing values have code -1. If the entropies are not given (None), the pairs with a missing value are discarded and the entropies are computed from the rest.
+def norm_mutual_info(codes_A,codes_B,n_A,n_B,H_A=None,H_B=None):
+    if H_A is None or H_B is None:
+        valid = (codes_A >= 0) & (codes_B >= 0)
+        codes_A, codes_B = (codes_A[valid],codes_B[valid])
+        H_A, H_B = (entropy(np.bincount(codes_A,minlength=n_A)),entropy(np.bincount(codes_B,minlength=n_B)))
+    if H_A+H_B == 0:
+        return np.NaN
+    H_AB = entropy(joint_counts(codes_A,codes_B,n_A,n_B))
+    return (2*(H_A+H_B-H_AB))/(H_A+H_B)
+
+#Returns the normalized mutual information of each of the given pairs of positions (pairs) in the lists of integer codes (codes), number of distinct values (sizes) and entropies (entropies) of a group of attributes.
+#The entropy of the attributes with missing values must be None, so that it is computed for each pair without the missing values.
+def norm_mutual_info_pairs(pairs,codes,sizes,entropies):
+    return [norm_mutual_info(codes[i],codes[j],sizes[i],sizes[j],entropies[i],entropies[j]) for i, j in pairs]
+
+#Returns the mutual information (in bits) and the normalized mutual information between each of the given attributes and the class attribute.
+#Each item (items) holds the integer codes and the number of distinct values of an attribute, and the class is given by its codes (class_codes) and number of distinct values (n_class).
+#Both measures are obtained from a single contingency table per attribute. The pairs with a missing value (code -1) are discarded.
+def class_mutual_info(items,class_codes,n_class):
+    result = []
+    for codes, n in items:
+        valid = (codes >= 0) & (class_codes >= 0)
+        codes_A, codes_B = (codes[valid],class_codes[valid])
+        H = entropy(np.bincount(codes_A,minlength=n))+entropy(np.bincount(codes_B,minlength=n_class))
+        info = max(H-entropy(joint_counts(codes_A,codes_B,n,n_class)),0.0)
+        result.append((info,2*info/H if H > 0 else np.NaN))
+    return result
+
+#Returns the point-biserial correlation between each column of the 2-D array (X) and the boolean labels (labels), that is, their Pearson correlation taking the labels as 0 and 1.
+#All the columns are scored at once with matrix products over the centered columns. Missing values (NaN) are discarded column by column, and the correlation is NaN when a column or the labels are constant.
+def point_biserial_columns(X,labels):
+    X = np.asarray(X,dtype=float)
+    y = np.asarray(labels,dtype=float)
+    valid = ~np.isnan(X)
+    count = valid.sum(axis=0)
+    with np.errstate(invalid="ignore",divide="ignore"):
+        X = np.where(valid,X,0.0)
+        X = np.where(valid,X-X.sum(axis=0)/count,0.0)
+        positives = valid.T.astype(float)@y
+        var_x = np.sum(X*X,axis=0)
+        var_y = positives-positives*positives/count
+        r = (X.T@y)/np.sqrt(var_x*var_y)
+    return np.where((var_x > 0) & (var_y > 0),r,np.NaN)
+
+#Returns the one-way ANOVA F statistic of each column of the 2-D array (X) given the group of each row (groups, integer codes where -1 means no group).
+#The rows are sorted by group once and the sums of every group and column are obtained with a single reduceat over the centered columns. Missing values (NaN) are discarded column by column.
+#The F statistic is NaN for the columns with less than two groups with values or without degrees of freedom within the groups.
+def anova_f_columns(X,groups):
+    X = np.asarray(X,dtype=float)
+    groups = np.asarray(groups)
+    order = np.argsort(groups,kind="stable")
+    order = order[groups[order] >= 0]
+    if len(order) == 0:
+        return np.full(X.shape[1],np.NaN)
+    X, groups = (X[order],groups[order])
+    starts = np.flatnonzero(np.r_[True,groups[1:] != groups[:-1]])
+    valid = ~np.isnan(X)
+    count = valid.sum(axis=0)
+    with np.errstate(invalid="ignore",divide="ignore"):
+        X = np.where(valid,X,0.0)
+        X = np.where(valid,X-X.sum(axis=0)/count,0.0)
+        n_g = np.add.reduceat(valid.astype(np.int64),starts,axis=0)
+        s_g = np.add.reduceat(X,starts,axis=0)
+        between = np.sum(np.divide(s_g*s_g,n_g,out=np.zeros_like(s_g),where=n_g>0),axis=0)
+        within = np.sum(X*X,axis=0)-between
+        k = np.count_nonzero(n_g,axis=0)
+        F = (between/(k-1))/(np.maximum(within,0.0)/(count-k))
+    return np.where((k > 1) & (count > k),F,np.NaN)
+
+#Returns the average ranks (starting at 1) of the values of each column of the 2-D array (X), giving tied values their average rank.
+def rank_columns(X):
+    X = np.ascontiguousarray(np.asarray(X,dtype=float).T)
+    order, ranks = _sorted_ranks(X)
+    result = np.empty(X.shape)
+    np.put_along_axis(result,order,ranks,axis=1)
+    return result.T
+
+#Returns the dense ranks (consecutive integers starting at 0) of the values of the given array (x).
+def _dense_ranks(x):
+    return np.unique(x,return_inverse=True)[1].astype(np.int64)
+
+#Returns the number of pairs of tied values in the given sorted array (x).
+def _tied_pairs(x):
+    runs = np.diff(np.append(np.flatnonzero(np.r_[True,x[1:]!=x[:-1]]),len(x)))
+    return int(np.sum(runs*(runs-1)//2))
+
+#Returns the number of inversions (pairs i<j such that a[i]>a[j]) in the given array of integers between 0 and its length (a).
+#It is a bottom-up merge sort where each level counts the inversions between all the pairs of adjacent sorted blocks at once.
+def _count_inversions(a):
+    a = np.asarray(a,dtype=np.int64)
+    length = len(a)
+    positions = np.arange(length)
+    inversions = 0
+    width = 1
+    while width < length:
+        block = positions//(2*width)
+        right = (positions//width)%2 == 1
+        keys = block*length+a
+        left_keys = keys[~right]
+        #For each value of a right block, the left block values that are greater than it lie between its search position and the end of the left block.
+        left_ends = np.minimum((block[right]+1)*width,len(left_keys))
+        inversions += int(np.sum(left_ends-np.searchsorted(left_keys,keys[right],side="right")))
+        a = np.sort(keys,kind="stable")-block*length
+        width *= 2
+    return inversions
+
+#Returns the Kendall tau-b correlation between two arrays given their dense ranks (rx,ry) and their number of pairs of tied values (ties_x,ties_y).
+#The pairs are sorted once and the discordant pairs are counted as the inversions of the sorted ranks. Each of the log n levels of the merge count (see _count_inversions) sorts and searches the whole array, so it runs in O(n log² n).
+def _kendall_tau(rx,ry,ties_x,ties_y):
+    length = len(rx)
+    order = np.argsort(rx*length+ry)
+    x = rx[order]
+    y = ry[order]
+    total = length*(length-1)//2
+    ties_xy = _tied_pairs(x*length+y)
+    denominator = np.sqrt(float(total-ties_x)*float(total-ties_y))
+    if denominator == 0:
+        return np.NaN
+    return (total-ties_x-ties_y+ties_xy-2*_count_inversions(y))/denominator
+
+#Returns the Pearson correlation matrix between the columns of the 2-D array (X) with missing values (NaN), where each pair of columns is correlated over the rows where both are present.
+#The counts, sums, sums of squares and cross products of every pair are computed with matrix products of the validity mask and of the columns (centered by their mean and with the missing values set to zero).
+def _pairwise_pearson(X):
+    valid = ~np.isnan(X)
+    V = valid.astype(float)
+    filled = np.where(valid,X,0.0)
+    Xz = np.where(valid,X-filled.sum(axis=0)/np.maximum(valid.sum(axis=0),1),0.0)
+    counts = V.T@V
+    #sums[i,j] is the sum of the column i over the rows where the columns i and j are present.
+    sums = Xz.T@V
+    squares = (Xz*Xz).T@V
+    with np.errstate(divide="ignore",invalid="ignore"):
+        covariances = Xz.T@Xz-sums*sums.T/counts
+        variances = np.maximum(squares-sums*sums/counts,0.0)
+        result = np.clip(covariances/np.sqrt(variances*variances.T),-1.0,1.0)
+    result[(counts < 2) | (variances*variances.T == 0)] = np.NaN
+    result[np.diag_indices(X.shape[1])] = np.where((np.diag(counts) > 1) & (np.diag(variances) > 0),1.0,np.NaN)
+    return result
+
+#Returns the Spearman or Kendall correlation matrix (method = spearman, kendall) between the columns of the 2-D array (X) with missing values (NaN), where each pair of columns is correlated over the rows where both are present.
+#The columns are grouped by the rows where they are present, so the pairs within a group are correlated together. Only the rows and columns of the pair (or of the two groups, for Spearman) are gathered for each correlation.
+def _pairwise_ranked(X,method):
+    valid = ~np.isnan(X)
+    groups = dict()
+    for i in range(X.shape[1]):
+        groups.setdefault(np.packbits(valid[:,i]).tobytes(),[]).append(i)
+    groups = list(groups.values())
+    result = np.full((X.shape[1],X.shape[1]),np.NaN)
+    for a, group_A in enumerate(groups):
+        for group_B in groups[a:]:
+            rows = np.flatnonzero(valid[:,group_A[0]] & valid[:,group_B[0]])
+            if len(rows) < 2:
+                continue
+            if group_A is group_B:
+                result[np.ix_(group_A,group_A)] = correlation_matrix(X[np.ix_(rows,group_A)],method)
+            elif method == "kendall":
+                for i in group_A:
+                    for j in group_B:
+                        result[i,j] = result[j,i] = correlation_matrix(X[np.ix_(rows,[i,j])],method)[0,1]
+            else:
+                block = correlation_matrix(X[np.ix_(rows,group_A+group_B)],method)[:len(group_A),len(group_A):]
+                result[np.ix_(group_A,group_B)] = block
+                result[np.ix_(group_B,group_A)] = block.T
+    return result
+
+#Returns the correlation matrix between the columns of the 2-D array (X) using the specified method (method = pearson, spearman, kendall).
+#Pearson and Spearman correlations are computed with a single matrix product of the standardized (and ranked, for Spearman) columns.
+#Missing values (NaN) are discarded pair by pair (see _pairwise_pearson and _pairwise_ranked). The columns without missing values are still correlated together over all the rows.
+def correlation_matrix(X,method="pearson"):
+    X = np.asarray(X,dtype=float)
+    k = X.shape[1]
+    missing = np.isnan(X).any(axis=0)
+    if missing.any():
+        result = _pairwise_pearson(X) if method == "pearson" else _pairwise_ranked(X,method)
+        complete = np.flatnonzero(~missing)
+        if len(complete) > 0:
+            result[np.ix_(complete,complete)] = correlation_matrix(X[:,complete],method)
+        return result
+    if method == "kendall":
+        ranks = [_dense_ranks(X[:,i]) for i in range(k)]
+        ties = [_tied_pairs(np.sort(r)) for r in ranks]
+        result = np.empty((k,k))
+        for i in range(k):
+            result[i,i] = 1.0 if ties[i] < len(ranks[i])*(len(ranks[i])-1)//2 else np.NaN
+            for j in range(i+1,k):
+                result[i,j] = result[j,i] = _kendall_tau(ranks[i],ranks[j],ties[i],ties[j])
+        return result
+    if method == "spearman":
+        X = rank_columns(X)
+    centered = X-X.mean(axis=0)
+    norms = np.sqrt(np.sum(centered*centered,axis=0))
+    with np.errstate(divide="ignore",invalid="ignore"):
+        Z = centered/norms
+        result = np.clip(Z.T@Z,-1.0,1.0)
+    result[np.diag_indices(k)] = np.where(norms > 0,1.0,np.NaN)
+    return result
+
+#Returns the mean and the variance (with one degree of freedom) of a data array of the given length (length) after replacing one of its values (old) with a new one (new), given its previous mean and variance (mean,variance).
+def replace_moments(mean,variance,length,old,new):
+    difference = new-old
+    new_mean = mean+difference/length
+    m2 = variance*(length-1)+difference*((new-new_mean)+(old-mean))
+    return (new_mean,m2/(length-1))
+
+#Returns the mean and the variance (with one degree of freedom) of a data array of the given length (length) after replacing some of its values (old) with new ones (new), given its previous mean and variance (mean,variance).
+#The replaced values must be in different positions. The squared deviations are taken from the new mean, which keeps the update stable when the mean is large.
+def replace_moments_batch(mean,variance,length,old,new):
+    new_mean = mean+np.sum(new-old)/length
+    m2 = variance*(length-1)+length*(mean-new_mean)**2-np.sum((old-new_mean)**2)+np.sum((new-new_mean)**2)
+    return (new_mean,m2/(length-1))
+
+#Returns the count, the mean and the sum of squared deviations of the union of two groups of values, given the same statistics of each group (count_A,mean_A,m2_A,count_B,mean_B,m2_B).
+def merge_moments(count_A,mean_A,m2_A,count_B,mean_B,m2_B):
+    count = count_A+count_B
+    if count == 0:
+        return (0,0.0,0.0)
+    difference = mean_B-mean_A
+    return (count,mean_A+difference*count_B/count,m2_A+m2_B+difference*difference*count_A*count_B/count)
+
+#Returns the count, the mean and the sum of squared deviations of the values in the given iterable of blocks (blocks), merging the moments of each block and skipping the missing values (NaN).
+def block_moments(blocks):
+    count, mean, m2 = (0,0.0,0.0)
+    for block in blocks:
+        block = np.asarray(block,dtype=float)
+        block = block[~np.isnan(block)]
+        if len(block) > 0:
+            block_mean = block.mean()
+            count, mean, m2 = merge_moments(count,mean,m2,len(block),block_mean,np.sum((block-block_mean)**2))
+    return (count,mean,m2)
+
+#Returns the minimum and the maximum of the values in the given iterable of blocks (blocks), skipping the missing values (NaN).
+def block_min_max(blocks):
+    low, high = (None,None)
+    for block in blocks:
+        block = block[~np.isnan(block)]
+        if len(block) > 0:
+            low = block.min() if low is None else min(low,block.min())
+            high = block.max() if high is None else max(high,block.max())
+    return (low,high)
+
+#Returns the values at the given positions (positions) of the sorted data, whose blocks are yielded by the iterables returned by the given function (blocks), without sorting or loading the whole data.
+#Each pass over the data counts the values of the interval that contains every position with a histogram and narrows the interval to the bin of the position,
+#until the interval holds few enough values (max_gather) to be gathered and sorted. Each interval is closed on the right only if it ends at the maximum value.
+#Missing values (NaN) never fall inside an interval, so the positions refer to the sorted values that are not missing.
+def block_select(blocks,positions,bins=4096,max_gather=2**18):
+    low, high = block_min_max(blocks())
+    results = dict()
+    #Each pending position has its interval (low, high, closed on the right), the number of values below the interval and whether its values must be gathered in the next pass.
+    pending = {position: [low,high,True,0,False] for position in set(positions)}
+    while len(pending) > 0:
+        for position, (low, high, closed, below, gather) in list(pending.items()):
+            if low == high:
+                results[position] = low
+                del pending[position]
+        counts = {position: np.zeros(bins,dtype=np.int64) for position, state in pending.items() if not state[4]}
+        gathered = {position: [] for position, state in pending.items() if state[4]}
+        if len(pending) == 0:
+            break
+        for block in blocks():
+            for position, (low, high, closed, below, gather) in pending.items():
+                inside = block[(block >= low) & ((block <= high) if closed else (block < high))]
+                if gather:
+                    gathered[position].append(inside)
+                else:
+                    counts[position] += np.histogram(inside,bins=bins,range=(low,high))[0]
+        for position, values in gathered.items():
+            below = pending.pop(position)[3]
+            results[position] = np.sort(np.concatenate(values))[position-below]
+        for position, count in counts.items():
+            low, high, closed, below, _ = pending[position]
+            edges = np.linspace(low,high,bins+1)
+            cumulative = below+np.cumsum(count)
+            b = int(np.searchsorted(cumulative,position,side="right"))
+            state = [edges[b],edges[b+1],closed and b == bins-1,int(cumulative[b]-count[b]),count[b] <= max_gather]
+            #When the interval can't be narrowed any further, its values are gathered.
+            if state[0] == low and state[1] == high:
+                state[4] = True
+            pending[position] = state
+    return [results[position] for position in positions]
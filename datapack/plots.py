@@ -1,11 +1,19 @@
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
 from .dataset import Dataset
 
+#Returns the plotting libraries (matplotlib.pyplot, seaborn). They are imported the first time a plot is drawn, so that importing the package doesn't load them.
+def _backends():
+    try:
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+    except ImportError:
+        raise NameError("The plots require matplotlib and seaborn, which can be installed with the plots extra of the package (datapack[plots]).")
+    return (plt, sns)
+
 #Plots the ROC curve for the given dataset (dt) using the given numerical attribute (att) as predictor variable.
 def plot_roc(dt, att):
     if isinstance(dt,Dataset):
+        plt, sns = _backends()
         try:
             results = dt.fpr_tpr(att)
             auc = dt.roc_auc(att)
@@ -28,6 +36,7 @@ def plot_roc(dt, att):
 #Plots the correlation matrix of the given dataset (dt).
 def plot_correlation(dt,method="pearson"):
     if isinstance(dt,Dataset):
+        plt, sns = _backends()
         try:
             result = dt.correlation_att(method=method)
         except:
@@ -45,6 +54,7 @@ def plot_correlation(dt,method="pearson"):
 #Plots the normalized mutual information matrix of the given dataset (dt).
 def plot_norm_mutual_info(dt):
     if isinstance(dt,Dataset):
+        plt, sns = _backends()
         try:
             result = dt.norm_mutual_info_att()
         except:
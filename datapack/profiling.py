@@ -0,0 +1,172 @@
+import contextlib
+import functools
+import threading
+import time
+import tracemalloc
+import warnings
+import pandas as pd
+
+### PROFILER STATE CLASS. Global state of the instrumentation of the public methods of the data sets and attributes.
+### The instrumented methods are only replaced by their recording versions while the profiler is enabled, so the instrumentation costs nothing while it is disabled.
+### Each thread keeps its own stack of running calls, so the calls made by the threads of a ThreadExecutor are recorded separately. The calls made inside the processes of a ProcessExecutor are not recorded.
+class _ProfilerState():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self):
+        self.enabled = False
+        self.memory = False
+        self.started = False
+        self.records = []
+        self.hooks = []
+        self.methods = []
+        self.local = threading.local()
+
+    #Returns the stack of running instrumented calls of the current thread.
+    def stack(self):
+        if not hasattr(self.local,"stack"):
+            self.local.stack = []
+        return self.local.stack
+
+_state = _ProfilerState()
+
+#Starts recording the calls to the instrumented methods. If memory=True, the memory allocated by each call is also traced with tracemalloc, which makes the calls noticeably slower.
+def enable(memory=False):
+    if not _state.enabled:
+        for cls, key, func, wrapper in _state.methods:
+            setattr(cls,key,wrapper)
+    _state.enabled = True
+    _state.memory = memory
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _state.started = True
+
+#Stops recording the calls to the instrumented methods. The recorded calls are kept until reset is called.
+def disable():
+    if _state.started:
+        tracemalloc.stop()
+        _state.started = False
+    if _state.enabled:
+        for cls, key, func, wrapper in _state.methods:
+            setattr(cls,key,func)
+    _state.enabled = False
+    _state.memory = False
+
+#Returns True if the calls to the instrumented methods are being recorded.
+def is_enabled():
+    return _state.enabled
+
+#Discards the recorded calls.
+def reset():
+    _state.records = []
+
+#Registers the given function (hook), which is called with the record (a dictionary) of every call to an instrumented method when it finishes.
+def add_hook(hook):
+    _state.hooks.append(hook)
+
+#Unregisters the given function (hook).
+def remove_hook(hook):
+    if hook in _state.hooks:
+        _state.hooks.remove(hook)
+
+#Returns the list of records of the calls to the instrumented methods, in the order in which they finished.
+#Each record holds the name of the method, its wall time and the part of it spent outside other instrumented methods (self_time), the number of instances of the object (rows),
+#the cache hits and misses of the statistics of its attributes, the nesting depth of the call and, if memory is traced, the bytes allocated (bytes) and the peak of allocated bytes (peak_bytes) during the call.
+#The peak needs tracemalloc.reset_peak (Python 3.9 or later), so it is None on older versions.
+def get_records():
+    return list(_state.records)
+
+#Returns a pd.DataFrame with the recorded calls aggregated by method: number of calls, total, self and mean wall time, rows, cache hits and misses and, if memory was traced, bytes allocated and maximum peak.
+#The methods are sorted from the highest to the lowest self time.
+def report():
+    columns = ["calls","time","self_time","mean_time","rows","hits","misses","bytes","peak_bytes"]
+    if len(_state.records) == 0:
+        return pd.DataFrame(columns=columns).rename_axis("method")
+    records = pd.DataFrame(_state.records)
+    grouped = records.groupby("method")
+    result = pd.DataFrame({"calls":grouped.size(),"time":grouped["time"].sum(),"self_time":grouped["self_time"].sum(),"mean_time":grouped["time"].mean(),
+                           "rows":grouped["rows"].sum(),"hits":grouped["hits"].sum(),"misses":grouped["misses"].sum(),
+                           "bytes":grouped["bytes"].sum(min_count=1),"peak_bytes":grouped["peak_bytes"].max()})
+    return result.sort_values("self_time",ascending=False)
+
+#Returns a context manager that records the calls to the instrumented methods inside a with block (see enable).
+@contextlib.contextmanager
+def profile(memory=False):
+    enable(memory)
+    try:
+        yield
+    finally:
+        disable()
+
+#Whether the peak of the traced memory can be reset (tracemalloc.reset_peak, added in Python 3.9), which is needed to measure the peak of each call.
+_RESET_PEAK = hasattr(tracemalloc,"reset_peak")
+
+#Returns the number of instances and the cache hits and misses of the statistics of the given data set or attribute (obj).
+def _counters(obj):
+    attributes = getattr(obj,"attributes",None)
+    if isinstance(attributes,dict):
+        return (obj.length,sum(att._hits for att in attributes.values()),sum(att._misses for att in attributes.values()))
+    return (getattr(obj,"length",None),getattr(obj,"_hits",0),getattr(obj,"_misses",0))
+
+#Calls the given method (func) with the given arguments (self, args, kwargs) and records the call under the given name (name).
+def _record(name,func,self,args,kwargs):
+    rows, hits, misses = _counters(self)
+    memory = _state.memory and tracemalloc.is_tracing()
+    stack = _state.stack()
+    frame = {"children":0.0,"peak":0}
+    #The peak of the memory is reset for each call, so the peak reached so far is kept by the calling frame.
+    if memory:
+        current, peak = tracemalloc.get_traced_memory()
+        if _RESET_PEAK:
+            if len(stack) > 0:
+                stack[-1]["peak"] = max(stack[-1]["peak"],peak)
+            tracemalloc.reset_peak()
+    stack.append(frame)
+    start = time.perf_counter()
+    try:
+        return func(self,*args,**kwargs)
+    finally:
+        elapsed = time.perf_counter()-start
+        stack.pop()
+        record = {"method":name,"time":elapsed,"self_time":elapsed-frame["children"],"rows":rows,"depth":len(stack)}
+        after_rows, after_hits, after_misses = _counters(self)
+        record["hits"], record["misses"] = (after_hits-hits,after_misses-misses)
+        if rows is None or (after_rows is not None and after_rows > rows):
+            record["rows"] = after_rows
+        if memory:
+            after, peak = tracemalloc.get_traced_memory()
+            if _RESET_PEAK:
+                peak = max(frame["peak"],peak)
+                record["bytes"], record["peak_bytes"] = (after-current,peak-current)
+                tracemalloc.reset_peak()
+            else:
+                record["bytes"], record["peak_bytes"] = (after-current,None)
+        else:
+            record["bytes"], record["peak_bytes"] = (None,None)
+        if len(stack) > 0:
+            stack[-1]["children"] += elapsed
+            if memory and _RESET_PEAK:
+                stack[-1]["peak"] = max(stack[-1]["peak"],peak)
+        _state.records.append(record)
+        #The hooks are called inside the finally clause, so their errors are turned into warnings to keep the result or the exception of the method.
+        for hook in list(_state.hooks):
+            try:
+                hook(record)
+            except Exception as error:
+                warnings.warn("The profiling hook "+repr(hook)+" raised "+repr(error)+" on the record of "+name+".")
+
+#Returns the recording version of the given method (func), whose calls are recorded under the given name (name).
+def _recording(name,func):
+    @functools.wraps(func)
+    def wrapper(self,*args,**kwargs):
+        return _record(name,func,self,args,kwargs)
+    return wrapper
+
+#Registers the public methods defined in the given class (cls) to be recorded as "class.method" while the profiler is enabled. It is used as a class decorator.
+def instrument(cls):
+    for key, value in list(vars(cls).items()):
+        if not key.startswith("_") and callable(value) and not isinstance(value,(staticmethod,classmethod,type)):
+            wrapper = _recording(cls.__name__+"."+key,value)
+            _state.methods.append((cls,key,value,wrapper))
+            if _state.enabled:
+                setattr(cls,key,wrapper)
+    return cls
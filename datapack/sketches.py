@@ -0,0 +1,251 @@
+import numpy as np
+import pandas as pd
+
+#Default size (k) of the quantile sketches built by the attributes.
+KLL_K = 200
+
+#Default number of counters of the frequency sketches built by the attributes.
+FREQUENT_CAPACITY = 1000
+
+#Confidence of the probabilistic error bound reported by the quantile sketches.
+KLL_CONFIDENCE = 0.99
+
+#Number of values of each block of the input that the quantile sketches sort and compact at once, as a multiple of their size (k). It bounds the memory used while adding values.
+KLL_BLOCK = 64
+
+#Returns the binary entropy (in bits) of the given probability (p).
+def _binary_entropy(p):
+    if p <= 0 or p >= 1:
+        return 0.0
+    return float(-p*np.log2(p)-(1-p)*np.log2(1-p))
+
+### KLL SKETCH CLASS. Quantile sketch of a stream of numerical values that uses a fixed amount of memory (about 3k values plus a few per level, and a block of KLL_BLOCK*k values while adding values).
+### The values are kept in levels where each value of level h stands for 2^h values of the stream. When a level gets full, it is sorted and every other value (starting at a random offset) is promoted to the next level.
+### Each compaction of level h moves the rank of any value by at most 2^h, so the sketch tracks the worst-case rank error and a tighter probabilistic bound (Hoeffding, since the offsets are random).
+### The bound requires the offsets of the sketches that are merged to be independent, so the random generator is seeded from the operating system unless a seed (seed) is given.
+### Sketches with the same size can be merged, so the values can be sketched by chunks or by processes and combined afterwards. Missing values (NaN) are skipped.
+class KLLSketch():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,k=KLL_K,seed=None):
+        if type(k) != int or k < 2:
+            raise NameError("The size of the sketch must be an integer equal to or higher than 2.")
+        self.k = k
+        self.levels = [np.empty(0)]
+        self.count = 0
+        self._error = 0
+        self._squared_error = 0
+        self._generator = np.random.default_rng(seed)
+
+    ###################GETTERS####################
+
+    #Returns the number of values added to the sketch.
+    def get_count(self):
+        return self.count
+
+    #Returns the number of values stored in the sketch.
+    def get_size(self):
+        return int(sum(len(level) for level in self.levels))
+
+    #Returns the bound of the error of the ranks returned by the sketch, as a fraction of the number of values.
+    #The bound holds for each query with probability KLL_CONFIDENCE, and it never exceeds the worst-case error.
+    def get_error(self):
+        if self.count == 0:
+            return 0.0
+        bound = np.sqrt(2*self._squared_error*np.log(2/(1-KLL_CONFIDENCE)))
+        return float(min(bound,self._error)/self.count)
+
+    #############################################
+
+    #Returns the number of values that fit in the given level (h) before it is compacted. The lower levels are smaller.
+    def _capacity(self,h):
+        return max(2,int(np.ceil(self.k*(2/3)**(len(self.levels)-1-h))))
+
+    #Adds the given values (values) to the sketch. The values are sorted and compacted in blocks of KLL_BLOCK*k values, so the input is never copied as a whole.
+    def update(self,values):
+        values = np.asarray(values,dtype=float).ravel()
+        size = KLL_BLOCK*self.k
+        for start in range(0,len(values),size):
+            block = values[start:start+size]
+            block = np.sort(block[~np.isnan(block)])
+            self.count += len(block)
+            self._add_sorted(block)
+            self._compress()
+        return self
+
+    #Adds the given sorted values (values) to the sketch, compacting them at once up to the highest level (j) where they still fill the size of the sketch.
+    #Compacting a sorted array j times keeps every 2^j-th value from an offset whose bits are the random offsets of the successive compactions, so it is done with a single slice.
+    #The last values that don't fill a group of 2^j values are added to the lowest level, as the last value of a level with an odd number of values is kept by each compaction.
+    def _add_sorted(self,values):
+        j = int(np.log2(len(values)/self.k)) if len(values) >= 2*self.k else 0
+        if j > 0:
+            step = 2**j
+            end = len(values)-len(values)%step
+            while len(self.levels) <= j:
+                self.levels.append(np.empty(0))
+            offset = int(self._generator.integers(step))
+            self.levels[j] = np.concatenate([self.levels[j],values[offset:end:step]])
+            self._error += step-1
+            self._squared_error += (4**j-1)//3
+            values = values[end:]
+        self.levels[0] = np.concatenate([self.levels[0],values])
+
+    #Adds the values of another sketch with the same size (other) to the sketch.
+    def merge(self,other):
+        if not isinstance(other,KLLSketch) or other.k != self.k:
+            raise NameError("Only quantile sketches with the same size can be merged.")
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for h, level in enumerate(other.levels):
+            self.levels[h] = np.concatenate([self.levels[h],level])
+        self.count += other.count
+        self._error += other._error
+        self._squared_error += other._squared_error
+        self._compress()
+        return self
+
+    #Returns a copy of the sketch. The copy draws its own random offsets, so it can be updated and merged back independently.
+    def copy(self):
+        result = KLLSketch(self.k)
+        result.levels = [level.copy() for level in self.levels]
+        result.count = self.count
+        result._error = self._error
+        result._squared_error = self._squared_error
+        return result
+
+    #Compacts the levels that exceed their capacity, from the lowest to the highest one.
+    def _compress(self):
+        h = 0
+        while h < len(self.levels):
+            if len(self.levels[h]) > self._capacity(h):
+                if h+1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                level = np.sort(self.levels[h])
+                #With an odd number of values, the largest one stays in the level.
+                even = len(level)-len(level)%2
+                offset = int(self._generator.integers(2))
+                self.levels[h+1] = np.concatenate([self.levels[h+1],level[offset:even:2]])
+                self.levels[h] = level[even:]
+                self._error += 2**h
+                self._squared_error += 4**h
+            h += 1
+
+    #Returns the values stored in the sketch, sorted, and the cumulative weight of each of them.
+    def _sorted(self):
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(level),2**h,dtype=np.int64) for h, level in enumerate(self.levels)])
+        order = np.argsort(values,kind="stable")
+        return (values[order],np.cumsum(weights[order]))
+
+    #Returns the approximate values at the given quantiles (quantiles, between 0 and 1) of the values added to the sketch, and the bound of their rank error (see get_error).
+    #The value at the quantile q is the first one whose approximate rank reaches q times the number of values.
+    def quantiles(self,quantiles):
+        quantiles = np.asarray(quantiles,dtype=float)
+        if ((quantiles < 0) | (quantiles > 1)).any():
+            raise NameError("Quantiles must be between 0 and 1.")
+        if self.count == 0:
+            return (np.full(quantiles.shape,np.NaN),0.0)
+        values, ranks = self._sorted()
+        positions = np.minimum(np.searchsorted(ranks,quantiles*ranks[-1],side="left"),len(values)-1)
+        return (values[positions],self.get_error())
+
+    #Returns the approximate value at the given quantile (quantile, between 0 and 1) of the values added to the sketch, and the bound of its rank error (see get_error).
+    def quantile(self,quantile):
+        values, error = self.quantiles([quantile])
+        return (float(values[0]),error)
+
+    #Returns the approximate fraction of the values added to the sketch that are lower than or equal to the given value (value), and the bound of its error.
+    def rank(self,value):
+        if self.count == 0:
+            return (np.NaN,0.0)
+        values, ranks = self._sorted()
+        position = np.searchsorted(values,value,side="right")
+        return ((float(ranks[position-1]) if position > 0 else 0.0)/ranks[-1],self.get_error())
+
+### FREQUENT ITEMS SKETCH CLASS. Frequency sketch of a stream of values that keeps at most a fixed number of counters (capacity), also known as the Misra-Gries summary (the mergeable form of space-saving).
+### When there are more counters than the capacity, the (capacity+1)-th largest count is subtracted from every counter and the counters that reach zero are dropped.
+### The subtracted amounts are accumulated, so the true count of every value is between its counter and its counter plus that error. Values without a counter appear at most that many times.
+### Sketches can be merged, so the values can be sketched by chunks or by processes and combined afterwards. Missing values are skipped.
+class FrequentItemsSketch():
+
+    ###################CONSTRUCTOR FUNCTION####################
+    def __init__(self,capacity=FREQUENT_CAPACITY):
+        if type(capacity) != int or capacity < 1:
+            raise NameError("The capacity of the sketch must be a positive integer.")
+        self.capacity = capacity
+        self.counters = pd.Series(dtype=np.int64)
+        self.count = 0
+        self.error = 0
+
+    ###################GETTERS####################
+
+    #Returns the number of values added to the sketch.
+    def get_count(self):
+        return self.count
+
+    #Returns the maximum number of appearances of a value that may be missing from its counter.
+    def get_error(self):
+        return self.error
+
+    #Returns the counters of the sketch, from the highest to the lowest count, as a pd.Series indexed by the values.
+    def get_counters(self):
+        return self.counters.sort_values(ascending=False,kind="stable")
+
+    #############################################
+
+    #Adds the given values (values) to the sketch. The values are counted at once before being added to the counters.
+    def update(self,values):
+        value_counts = pd.Series(values,dtype=object).value_counts().astype(np.int64)
+        return self._add(value_counts,int(value_counts.sum()),0)
+
+    #Adds the values of another sketch (other) to the sketch.
+    def merge(self,other):
+        if not isinstance(other,FrequentItemsSketch):
+            raise NameError("Only frequency sketches can be merged.")
+        return self._add(other.counters,other.count,other.error)
+
+    #Returns a copy of the sketch.
+    def copy(self):
+        result = FrequentItemsSketch(self.capacity)
+        result.counters = self.counters.copy()
+        result.count = self.count
+        result.error = self.error
+        return result
+
+    #Adds the given counters (counters) of the given number of values (count) and error (error) to the sketch, and reduces the counters to the capacity.
+    def _add(self,counters,count,error):
+        counters = self.counters.add(counters,fill_value=0).astype(np.int64) if len(self.counters) > 0 else counters.astype(np.int64)
+        if len(counters) > self.capacity:
+            threshold = int(np.partition(counters.to_numpy(),len(counters)-self.capacity-1)[len(counters)-self.capacity-1])
+            counters = counters[counters > threshold]-threshold
+            error += threshold
+        self.counters = counters
+        self.count += count
+        self.error += error
+        return self
+
+    #Returns the value with the highest counter (the smallest one, if tied) and the maximum error of its count.
+    #The value is the true mode if its counter exceeds every other counter by more than the error.
+    def mode(self):
+        if len(self.counters) == 0:
+            return (np.NaN,self.error)
+        values = self.counters.index.to_numpy()
+        counts = self.counters.to_numpy()
+        return (min(values[counts == counts.max()]),self.error)
+
+    #Returns the approximate entropy (in bits) of the values added to the sketch and a bound of its error.
+    #The estimate takes the counters as the counts of their values and splits the rest of the values into groups of the size of the error, which is the largest count of a value without a counter.
+    #The estimated distribution differs from the true one in at most the fraction of values that are not in the counters (d), so the error is at most d*log2(n)+h(d) bits, where h is the binary entropy (Fannes inequality).
+    def entropy(self):
+        if self.count == 0:
+            return (0.0,0.0)
+        counts = self.counters.to_numpy().astype(float)
+        rest = self.count-counts.sum()
+        if rest > 0:
+            groups = int(np.ceil(rest/max(self.error,1)))
+            counts = np.concatenate([counts,np.full(groups,rest/groups)])
+        p = counts[counts > 0]/self.count
+        estimate = float(-np.sum(p*np.log2(p)))
+        d = rest/self.count
+        bound = d*np.log2(self.count)+_binary_entropy(d) if d > 0 else 0.0
+        return (estimate,float(min(bound,np.log2(self.count))))
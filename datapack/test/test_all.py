@@ -1,7 +1,18 @@
 from datapack import attributes as att
 from datapack import dataset as dat
 from datapack import plots as pl
+from datapack import sketches as sk
+from datapack import profiling as prof
+from datapack import executors as ex
+from datapack import metrics
 import pandas as pd
+import numpy as np
+import gc
+import os
+import subprocess
+import sys
+import warnings
+import weakref
 
 #Tests the main functionalities of the datapack package.
 def test_all():
@@ -64,3 +75,442 @@ def test_all():
     print("FILTER THE NON-NUMERICAL ATTRIBUTES ACCORDING TO ENTROPY:")
     MyDataset.filter_by("entropy","gt",1.5)
     MyDataset.print_dataset()
+
+#Tests the ROC curve and the AUC score against values computed by hand, with tied scores and a missing value in the predictor (whose instance is discarded).
+def test_roc_curve():
+    data = pd.DataFrame({"A":[0.1,0.4,0.4,0.35,0.8,0.4,np.nan],"F":[False,False,True,True,True,False,True]})
+    MyDataset = dat.Dataset(data,"F")
+    FPR, TPR = MyDataset.fpr_tpr("A")
+    assert np.allclose(FPR,[1,2/3,2/3,0,0]) and np.allclose(TPR,[1,1,2/3,1/3,0])
+    assert abs(MyDataset.roc_auc("A")-2/3) < 1e-12
+    FPR, TPR = metrics.roc_curve([3,1,2,2],[True,False,False,True])
+    assert np.allclose(FPR,[1,1/2,0,0]) and np.allclose(TPR,[1,1,1/2,0]) and abs(metrics.auc(FPR,TPR)-0.875) < 1e-12
+
+#Tests that the batched AUC scores match the ones computed from the ROC curve of each attribute.
+def test_roc_auc_att():
+    data = pd.DataFrame({"A":[1,4,3,5,2,3,3],"B":[4.3,2.1,2.3,9.8,1.5,2.3,0.2],"C":[1,1,1,2,1,2,2],"D":["a","b","b","a","c","a","c"],"F":[True,True,False,False,True,False,True]})
+    MyDataset = dat.Dataset(data,"F")
+    single = {key: MyDataset.roc_auc(key) for key in ["A","B","C"]}
+    for batched in [MyDataset.roc_auc_att(), MyDataset.roc_auc_att(n_jobs=2,max_memory=1)]:
+        for key, value in single.items():
+            assert abs(batched[key]-value) < 1e-12
+        assert pd.isna(batched["D"]) and pd.isna(batched["F"])
+
+#Tests the labels and the possible values of the equal-width and equal-frequency discretizations, with duplicated values (which give an empty interval) and a missing value (which stays missing).
+def test_discretize():
+    data = pd.DataFrame({"A":[1.0,4.0,3.0,5.0,2.0,3.0,3.0,9.0,0.5,3.0,np.nan]})
+    low, high = (0.5+8.5/3,0.5+2*8.5/3)
+    labels = ["(-infinity, "+str(low)+"]","("+str(low)+", "+str(high)+"]","("+str(high)+", infinity)"]
+    MyDataset = dat.Dataset(data.copy())
+    MyDataset.discretize_att(3,"width")
+    assert list(MyDataset.get_attribute("A").get_data()[:-1]) == [labels[i] for i in [0,1,0,1,0,0,0,2,0,0]]
+    assert set(MyDataset.get_attribute("A").values) == set(labels) and pd.isna(MyDataset.get_attribute("A").get_data().iloc[-1])
+    labels = ["(-infinity, 3.0]","(3.0, 3.0]","(3.0, infinity)"]
+    MyDataset = dat.Dataset(data.copy())
+    MyDataset.discretize_att(3,"frequency")
+    assert list(MyDataset.get_attribute("A").get_data()[:-1]) == [labels[i] for i in [0,2,0,2,0,0,0,2,0,0]]
+    assert set(MyDataset.get_attribute("A").values) == set(labels) and pd.isna(MyDataset.get_attribute("A").get_data().iloc[-1])
+    assert att.Numerical(data["A"]).discretizeEF(3)[1] == [3.0,3.0] and att.Numerical(data["A"]).discretizeEW(3)[1] == [low,high]
+
+#Tests that the categorical attributes store codes whose type follows the number of possible values, and give the same statistics and csv files as before they were encoded (values computed with the string-based implementation).
+def test_categorical_codes(tmp_path):
+    values = ["v"+str(i) for i in range(200)]
+    assert att.Categorical(["a","b"],["a","b","c"]).get_codes().dtype == np.int8
+    assert att.Categorical(values[:3],values).get_codes().dtype == np.int16
+    for data, possible in [(["a","q"],["a","b"]),(["a"],["a",1])]:
+        try:
+            att.Categorical(data,possible)
+            assert False
+        except NameError:
+            pass
+    data = pd.DataFrame({"D":["a","b","b","a","c","a"],"E":["x","y","x","x","y","y"],"G":["t","t","f","t","f","f"]})
+    MyDataset = dat.Dataset(data.copy())
+    MyDataset.to_categorical_attribute("D",values=["c","b","a","z"])
+    MyDataset.to_categorical_attribute("G",values=["t","f"])
+    assert list(MyDataset.get_attribute("D").get_codes()) == [2,1,1,2,0,2]
+    assert MyDataset.mode("D") == "a" and abs(MyDataset.entropy("D")-1.4591479170272448) < 1e-12
+    scores = MyDataset.norm_mutual_info_att()
+    assert abs(MyDataset.norm_mutual_info("D","E")-0.16877288934313653) < 1e-12 and abs(scores["E"]["G"]-0.08170416594551044) < 1e-12
+    assert abs(scores["D"]["G"]-0.16877288934313653) < 1e-12 and scores["D"]["D"] == 1.0
+    MyDataset.to_csv(str(tmp_path/"codes.csv"))
+    assert open(tmp_path/"codes.csv").read() == "D,E,G\na,x,t\nb,y,t\nb,x,f\na,x,t\nc,y,f\na,y,f\n"
+
+#Tests the normalized mutual information against a direct computation from the joint and marginal probabilities, discarding the instances where either attribute is missing.
+def test_norm_mutual_info():
+    data = pd.DataFrame({"D":["a","b","b",None,"c","a","c","a"],"E":["x","y","x","x",None,"y","y","x"],"G":["t","t","f","t","f","f","t","t"],"F":[True,None,False,False,True,False,True,False]})
+    MyDataset = dat.Dataset(data.copy())
+    MyDataset.to_categorical_attribute("G",values=["t","f","u"])
+    scores = MyDataset.norm_mutual_info_att()
+    for key_A in ["D","E","G","F"]:
+        for key_B in ["D","E","G","F"]:
+            valid = data[key_A].notna() & data[key_B].notna()
+            joint = pd.crosstab(data[key_A][valid],data[key_B][valid]).to_numpy()/valid.sum()
+            p_A, p_B = (joint.sum(axis=1),joint.sum(axis=0))
+            present = joint > 0
+            information = np.sum(joint[present]*np.log2(joint[present]/np.outer(p_A,p_B)[present]))
+            expected = 2*information/(-np.sum(p_A*np.log2(p_A))-np.sum(p_B*np.log2(p_B)))
+            assert abs(MyDataset.norm_mutual_info(key_A,key_B)-expected) < 1e-12 and abs(scores[key_A][key_B]-expected) < 1e-12
+    assert list(metrics.joint_counts([0,1,1],[1,0,0],2,2)) == [0,1,2,0] and sorted(metrics.joint_counts([0,1,1],[5,2,2],1000,1000)) == [1,2]
+
+#Tests the correlation matrices against pd.DataFrame.corr, with tied values and missing values in different instances of each attribute (discarded pair by pair).
+def test_correlation():
+    data = pd.DataFrame({"A":[1,4,3,5,2,3,3,np.nan],"B":[4.3,2.1,2.3,np.nan,1.5,2.3,0.2,7.0],"C":[1,1,1,2,1,2,2,1],"H":[2.0,1.0,np.nan,0.0,5.0,5.0,np.nan,3.0],"D":["a","b","b","a","c","a","c","a"],"F":[True,True,False,False,True,False,True,False]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    keys = ["A","B","C","H"]
+    for method in ["pearson","spearman","kendall"]:
+        expected = data[keys].corr(method=method)
+        result = MyDataset.correlation_att(method,form="dataframe")
+        assert np.allclose(result.loc[keys,keys],expected,atol=1e-12) and result[["D","F"]].isna().all().all()
+        assert abs(MyDataset.correlation("A","H",method)-expected.loc["A","H"]) < 1e-12
+        assert MyDataset.correlation_att(method)["C"]["B"] == result.loc["C","B"]
+
+#Tests that the fused summary statistics match the statistics computed one by one.
+def test_describe():
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5],"D":["a","b","b","a","c"],"F":[True,True,False,False,True]})
+    MyDataset = dat.Dataset(data,"F")
+    summary = MyDataset.describe()
+    assert list(summary.columns) == ["type","count","mean","median","variance","mode","entropy"]
+    for key in ["A","B"]:
+        assert summary.loc[key,"mean"] == MyDataset.mean(key) and summary.loc[key,"median"] == MyDataset.median(key) and summary.loc[key,"variance"] == MyDataset.variance(key)
+    for key in ["D","F"]:
+        assert summary.loc[key,"mode"] == MyDataset.mode(key) and summary.loc[key,"entropy"] == MyDataset.entropy(key)
+    assert MyDataset.mode("D") == "a" and pd.isna(summary.loc["D","mean"])
+
+#Tests that the cached statistics are reused and kept up to date when the data is modified.
+def test_cache():
+    MyDataset = dat.Dataset(pd.DataFrame({"A":[1.0,4.0,3.0,5.0,2.0],"D":["a","b","b","a","c"]}))
+    MyDataset.mean_att()
+    MyDataset.mean_att()
+    info = MyDataset.get_attribute("A").get_cache_info()
+    assert info["hits"] == 1 and info["misses"] == 1
+    MyDataset.variance("A")
+    MyDataset.update_instance(0,"A",10.0)
+    assert abs(MyDataset.mean("A")-4.8) < 1e-12 and abs(MyDataset.variance("A")-9.7) < 1e-12
+    assert MyDataset.get_attribute("A").get_version() == 1
+    assert MyDataset.mode("D") == "a"
+    MyDataset.update_instance(0,"D","b")
+    assert MyDataset.mode("D") == "b"
+
+#Tests that reading a csv file in chunks gives the same data set as reading it at once.
+def test_from_csv_chunks(tmp_path):
+    data = pd.DataFrame({"A":[1,4,3,5,2,7,1],"B":[4.3,2.1,2.3,9.8,1.5,0.2,3.3],"D":["a","b","b","a","c","c","a"],"F":[True,True,False,False,True,False,True]})
+    data.to_csv(tmp_path / "data.csv",index=False)
+    MyDataset = dat.Dataset()
+    MyDataset.from_csv(tmp_path / "data.csv",c="F")
+    progress = []
+    Chunked = dat.Dataset()
+    Chunked.from_csv(tmp_path / "data.csv",c="F",chunksize=3,callback=lambda rows, speed: progress.append(rows))
+    assert progress == [3,6,7] and Chunked.get_class_name() == "F"
+    assert Chunked.to_dataframe().equals(MyDataset.to_dataframe())
+    summary = dat.describe_csv(tmp_path / "data.csv",chunksize=2)
+    assert abs(summary.loc["B","variance"]-MyDataset.variance("B")) < 1e-12 and summary.loc["D","mode"] == MyDataset.mode("D")
+    Categories = dat.Dataset()
+    Categories.from_csv(tmp_path / "data.csv",chunksize=2,dtype={"D":"category"})
+    assert isinstance(Categories.get_attribute("D"),att.Categorical) and list(Categories.get_attribute("D").get_categories()) == ["a","b","c"]
+    assert Categories.get_attribute("D").get_codes().tolist() == [0,1,1,0,2,2,0]
+
+#Tests that the binary format keeps the data, the attribute types, the categorical values and the class.
+def test_binary(tmp_path):
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5],"D":["a","b","b","a","c"],"E":["x","y","z","x","x"],"F":[True,True,False,False,True],"G":[None,None,None,None,None]})
+    MyDataset = dat.Dataset(data,"F")
+    MyDataset.to_categorical_attribute("E",values=["z","y","x","w"])
+    MyDataset.to_binary(tmp_path / "data")
+    Loaded = dat.Dataset()
+    Loaded.from_binary(tmp_path / "data")
+    assert Loaded.to_dataframe().equals(MyDataset.to_dataframe()) and Loaded.get_class_name() == "F"
+    assert [type(value) for value in Loaded.attributes.values()] == [type(value) for value in MyDataset.attributes.values()]
+    assert list(Loaded.get_attribute("E").get_categories()) == ["z","y","x","w"] and Loaded.get_attribute("G").get_data().isna().all()
+    Loaded.from_binary(tmp_path / "data",attributes=["B","D"])
+    assert list(Loaded.attributes.keys()) == ["B","D"] and Loaded.get_class_name() is None
+
+#Tests that memory-mapped numerical attributes give the same results as in-memory ones, computed block by block, and write back their transformations.
+def test_binary_mmap(tmp_path, monkeypatch):
+    monkeypatch.setattr(att,"BLOCK_SIZE",2)
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5]})
+    MyDataset = dat.Dataset(data)
+    MyDataset.to_binary(tmp_path / "data")
+    Mapped = dat.Dataset()
+    Mapped.from_binary(tmp_path / "data",mmap=True)
+    assert Mapped.get_attribute("B")._memmap() is not None
+    assert Mapped.describe().equals(MyDataset.describe())
+    assert Mapped.get_attribute("B").discretizeEF(2)[1] == MyDataset.get_attribute("B").discretizeEF(2)[1]
+    assert isinstance(ex._to_shared(dat._pack_attribute(Mapped.get_attribute("B")),[])[1],ex.MappedArray)
+    Mapped.set_executor("process",2)
+    Mapped.get_attribute("B")._invalidate()
+    assert Mapped.describe().equals(MyDataset.describe()) and Mapped.get_attribute("B")._memmap() is not None
+    Mapped.get_executor().close()
+    Mapped.standarize("B")
+    Loaded = dat.Dataset()
+    Loaded.from_binary(tmp_path / "data")
+    assert abs(Loaded.get_attribute("B").mean()) < 1e-12 and abs(Loaded.get_attribute("B").variance()-1) < 1e-12
+    dat.Dataset(pd.DataFrame({"A":[2.5]})).to_binary(tmp_path / "single")
+    Mapped = dat.Dataset()
+    Mapped.from_binary(tmp_path / "single",mmap=True)
+    assert Mapped.get_attribute("A")._memmap() is not None and np.isnan(Mapped.variance("A")) and Mapped.mean("A") == 2.5
+
+#Tests that the data set shares the arrays of the input pd.DataFrame and copies them before modifying them in place (copy-on-write).
+def test_copy_on_write():
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5],"D":["a","b","b","a","c"]})
+    original = data.copy()
+    MyDataset = dat.Dataset(data)
+    assert np.shares_memory(MyDataset.get_attribute("B").get_data().values,data["B"].values)
+    MyDataset.normalize("B")
+    MyDataset.update_instance(0,"D","c")
+    assert data.equals(original)
+    Shared = MyDataset.to_dataframe(copy=False)
+    assert np.shares_memory(Shared["B"].values,MyDataset.get_attribute("B").get_data().values)
+    normalized = list(Shared["B"])
+    MyDataset.standarize("B")
+    assert list(Shared["B"]) == normalized and abs(MyDataset.mean("B")) < 1e-12
+
+#Tests the type validation of the attributes and the validate=False fast path.
+def test_validation():
+    assert att.String(["a",None,"b"]).get_number_values() == 3
+    for cls, data in [(att.String,["a",1,"b"]),(att.Attribute,["a",2.5]),(att.Numerical,["a","b"]),(att.Boolean,[1,0])]:
+        try:
+            cls(data)
+            assert False
+        except NameError:
+            pass
+    assert att.String(["a",1],validate=False).get_number_values() == 2
+    data = pd.DataFrame({"A":[1,4,3],"D":["a","b","b"]})
+    assert dat.Dataset(data,validate=False).describe().equals(dat.Dataset(data).describe())
+
+#Tests that the operations applied to every attribute give the same results with every executor.
+def test_executors():
+    data = pd.DataFrame({"A":[1,4,3,5,2,6],"B":[4.3,2.1,2.3,9.8,1.5,0.7],"D":["a","b","b","a","c","a"],"F":[True,True,False,False,True,False]})
+    results = []
+    for executor in ["serial","thread","process"]:
+        MyDataset = dat.Dataset(data,"F")
+        MyDataset.set_executor(executor,2)
+        summary = MyDataset.summary_att()
+        auc = MyDataset.roc_auc_att()
+        MyDataset.standarize_att()
+        Discretized = dat.Dataset(data,"F")
+        Discretized.set_executor(executor,2)
+        Discretized.discretize_att(2,"frequency")
+        results.append((summary,auc,MyDataset.to_dataframe(),Discretized.to_dataframe()))
+        if executor == "process":
+            pool = MyDataset.get_executor()._pool
+            MyDataset.summary_att(["median"])
+            assert pool is not None and MyDataset.get_executor()._pool is pool
+            MyDataset.get_executor().close()
+            Discretized.get_executor().close()
+            assert MyDataset.get_executor()._pool is None
+    for result in results[1:]:
+        assert result[0] == results[0][0] and result[1] == results[0][1]
+        assert result[2].equals(results[0][2]) and result[3].equals(results[0][3])
+
+#Tests that missing values are accepted in every type of attribute and skipped by the statistics.
+def test_missing_values():
+    data = pd.DataFrame({"A":[1.0,None,3.0,5.0,2.0],"B":[4.3,2.1,2.3,None,1.5],"D":["a",None,"b","a","c"],"F":[True,None,False,False,True]})
+    MyDataset = dat.Dataset(data,"F")
+    assert isinstance(MyDataset.get_attribute("F"),att.Boolean)
+    assert MyDataset.null_count_att() == {"A":1,"B":1,"D":1,"F":1}
+    assert MyDataset.mean("A") == data["A"].mean() and MyDataset.variance("A") == data["A"].var() and MyDataset.median("A") == data["A"].median()
+    assert MyDataset.describe().loc["D","count"] == 4 and MyDataset.mode("D") == "a"
+    assert abs(MyDataset.correlation("A","B")-data["A"].corr(data["B"])) < 1e-12
+    assert MyDataset.roc_auc("A") == 0.0
+    MyDataset.to_categorical_attribute("D")
+    assert MyDataset.get_attribute("D").null_count() == 1 and MyDataset.entropy("D") == 1.5
+    MyDataset.discretize("B","width",num_bins=2)
+    assert MyDataset.get_attribute("B").null_count() == 1
+    MyDataset = dat.Dataset(pd.DataFrame({"G":[None,None]}))
+    assert MyDataset.describe().loc["G","count"] == 0 and np.isnan(MyDataset.describe().loc["G","mode"]) and np.isnan(MyDataset.mode_att()["G"])
+    assert np.isnan(att.Categorical([None,None],["a","b"]).mode())
+
+#Tests the selection of rows, which returns data sets whose attributes are views of the original ones.
+def test_select_rows():
+    data = pd.DataFrame({"A":[1,4,3,5,2,6],"B":[4.3,2.1,2.3,9.8,1.5,0.7],"D":["a","b","b","a","c","a"],"F":[True,True,False,False,True,False]})
+    MyDataset = dat.Dataset(data,"F")
+    MyDataset.to_categorical_attribute("D",values=["a","b","c","d"])
+    Selected = MyDataset.select_rows(data["A"] > 2)
+    assert Selected.get_number_instances() == 4 and Selected.get_attribute("A").is_view()
+    assert list(Selected.get_attribute("A").get_data()) == [4,3,5,6] and not Selected.get_attribute("A").is_view()
+    assert list(Selected.get_attribute("D").get_categories()) == ["a","b","c","d"] and Selected.get_class_name() == "F"
+    MyDataset.update_instance(1,"B",0.0)
+    assert list(Selected.get_attribute("B").get_data()) == [2.1,2.3,9.8,0.7]
+    assert list(MyDataset.head(2).slice(1).get_attribute("A").get_data()) == [4]
+    Sample = MyDataset.sample(4,stratify="F",random_state=0)
+    assert Sample.get_number_instances() == 4 and Sample.get_attribute("F").get_data().sum() == 2
+
+#Tests the batch updates, which check every batch before writing it and update the cached mean and variance once.
+def test_update_many():
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5],"D":["a","b","b","a","c"],"F":[True,True,False,False,True]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    MyDataset.to_categorical_attribute("D",values=["a","b","c"])
+    MyDataset.summary_att()
+    MyDataset.update_many("B",[0,3,0],[1.0,2.0,3.0])
+    assert list(MyDataset.get_attribute("B").get_data()) == [3.0,2.1,2.3,2.0,1.5]
+    assert "variance" in MyDataset.get_attribute("B").get_cache_info()["cached"]
+    assert abs(MyDataset.variance("B")-pd.Series([3.0,2.1,2.3,2.0,1.5]).var()) < 1e-12
+    try:
+        MyDataset.update_many_att({"A":([0],[10]),"D":([1],["z"])})
+        assert False
+    except NameError:
+        pass
+    assert MyDataset.get_attribute("A").get_value(0) == 1
+    MyDataset.update_many_att({"A":([0],[10]),"D":([1,2],["c","a"])})
+    assert MyDataset.get_attribute("A").get_value(0) == 10 and list(MyDataset.get_attribute("D").get_data()) == ["a","c","a","a","c"]
+    MyDataset.update_many("F",[1],[None])
+    MyDataset.update_many("F",[2],[np.nan])
+    assert MyDataset.get_attribute("F").null_count() == 2 and list(MyDataset.get_attribute("F").get_data()[[0,3]]) == [True,False]
+    MyDataset.append_rows(pd.DataFrame({"A":[6],"B":[0.5],"D":["a"],"F":[None]}))
+    assert MyDataset.get_attribute("F").null_count() == 3
+
+#Tests that appending rows checks them before writing, updates the cached statistics and extends the categories only when asked.
+def test_append_rows():
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5],"D":["a","b","b","a","c"],"F":[True,True,False,False,True]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    MyDataset.to_categorical_attribute("D",values=["a","b","c"])
+    MyDataset.summary_att()
+    new = pd.DataFrame({"A":[7,8],"B":[0.5,np.nan],"D":["c","c"],"F":[False,True]})
+    MyDataset.append_rows(new)
+    assert MyDataset.get_number_instances() == 7
+    assert "variance" in MyDataset.get_attribute("B").get_cache_info()["cached"]
+    assert abs(MyDataset.variance("B")-pd.Series([4.3,2.1,2.3,9.8,1.5,0.5]).var()) < 1e-12
+    assert MyDataset.mode("D") == "c" and MyDataset.null_count_att()["B"] == 1
+    try:
+        MyDataset.append_rows(pd.DataFrame({"A":[1],"B":[1.0],"D":["z"],"F":[True]}))
+        assert False
+    except NameError:
+        pass
+    assert MyDataset.get_number_instances() == 7 and len(MyDataset.get_attribute("A").get_data()) == 7
+    MyDataset.append_rows(pd.DataFrame({"A":[1],"B":[1.0],"D":["z"],"F":[True]}),extend_categories=True)
+    assert list(MyDataset.get_attribute("D").get_data()) == ["a","b","b","a","c","c","c","z"]
+    assert list(MyDataset.get_attribute("D").get_categories()) == ["a","b","c","z"]
+    assert list(MyDataset.get_attribute("A").get_data()) == [1,4,3,5,2,7,8,1]
+    categories = ["c"+str(i) for i in range(120)]
+    MyDataset = dat.Dataset(pd.DataFrame({"D":categories[:5]}))
+    MyDataset.to_categorical_attribute("D",values=categories)
+    MyDataset.append_rows(pd.DataFrame({"D":["c1"]}))
+    MyDataset.append_rows(pd.DataFrame({"D":["n"+str(i) for i in range(30)]}),extend_categories=True)
+    assert MyDataset.get_attribute("D").get_codes().dtype == np.int16 and list(MyDataset.get_attribute("D").get_data()[-2:]) == ["n28","n29"]
+
+#Tests the statistics of the attributes grouped by the class or by a categorical attribute, skipping the missing values.
+def test_groupby_stats():
+    data = pd.DataFrame({"A":[1,4,3,5,2,np.nan],"D":["a","b","b","a","c","c"],"F":[True,True,False,False,True,False]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    stats = MyDataset.groupby_stats()
+    assert list(stats.index) == [False,True]
+    assert list(stats[("A","count")]) == [2,3]
+    assert list(stats[("A","mean")]) == [4.0,7/3]
+    assert abs(stats.loc[True,("A","variance")]-pd.Series([1,4,2]).var()) < 1e-12
+    assert list(stats[("D","mode")]) == ["a","a"] and abs(stats.loc[False,("D","entropy")]-np.log2(3)) < 1e-12
+    stats = MyDataset.groupby_stats("D")
+    assert list(stats.index) == ["a","b","c"] and list(stats[("F","count")]) == [2,2,2]
+    try:
+        MyDataset.groupby_stats("A")
+        assert False
+    except NameError:
+        pass
+
+#Tests the scores of the attributes against the class, their cache invalidation and the selection of attributes by score.
+def test_score_att():
+    data = pd.DataFrame({"A":[1.0,4.0,3.0,5.0,2.0,6.0],"B":[2.0,2.0,2.0,2.0,2.0,2.0],"D":["a","b","a","b","a","b"],"F":[False,True,False,True,False,True]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    assert MyDataset.score_att("auc")["A"] == 1.0 and np.isnan(MyDataset.score_att("auc")["D"])
+    assert abs(MyDataset.score_att("info_gain")["D"]-1.0) < 1e-12 and abs(MyDataset.score_att("nmi")["D"]-1.0) < 1e-12
+    assert abs(MyDataset.score_att("point_biserial")["A"]-np.corrcoef(data["A"],data["F"])[0,1]) < 1e-12
+    assert np.isnan(MyDataset.score_att("anova_f")["B"])
+    assert MyDataset.top_k(1,"point_biserial") == ["A"]
+    MyDataset.update_instance(0,"A",10.0)
+    assert MyDataset.score_att("auc")["A"] == 2/3
+    MyDataset.filter_by("auc","gt",0.9)
+    assert "A" not in MyDataset.attributes and "D" in MyDataset.attributes
+    MyDataset = dat.Dataset(data.copy(),"F")
+    MyDataset.score_att("auc")
+    replaced = weakref.ref(MyDataset.get_attribute("A"))
+    MyDataset.discretize_att(2,"width")
+    gc.collect()
+    assert replaced() is None and np.isnan(MyDataset.score_att("auc")["A"])
+
+#Tests that the quantile, frequent items and entropy sketches give estimates within their error bounds, merged or built from the attributes.
+def test_sketches():
+    values = np.random.default_rng(0).permutation(10000).astype(float)
+    sketch = sk.KLLSketch(k=100,seed=1).update(values[:5000])
+    sketch.merge(sk.KLLSketch(k=100,seed=2).update(values[5000:]))
+    median, error = sketch.quantile(0.5)
+    assert sketch.get_count() == 10000 and sketch.get_size() < 1000
+    assert abs((median+1)/10000-0.5) <= error
+    frequent = sk.FrequentItemsSketch(2).update(["a","a","a","b","c","b","a","d"])
+    mode, error = frequent.mode()
+    assert mode == "a" and error <= 2 and frequent.get_count() == 8
+    data = pd.DataFrame({"A":values,"D":["a"]*6000+["b"]*4000})
+    MyDataset = dat.Dataset(data.copy())
+    median, error = MyDataset.median("A",approx=True)
+    assert abs((median+1)/10000-0.5) <= error
+    assert MyDataset.mode("D",approx=True) == ("a",0)
+    entropy, error = MyDataset.entropy("D",approx=True)
+    assert abs(entropy-MyDataset.entropy("D")) <= error+1e-12
+    MyDataset.append_rows(pd.DataFrame({"A":[np.nan],"D":["b"]}))
+    assert MyDataset.get_attribute("A").sketch().get_count() == 10000 and MyDataset.get_attribute("D").sketch().get_count() == 10001
+
+#Tests that the profiler records the instrumented calls only while it is enabled, with their cache hits, rows and memory (without the peak where it can't be reset), and that failing hooks don't change the results.
+def test_profiling(monkeypatch):
+    data = pd.DataFrame({"A":[1,4,3,5,2],"B":[4.3,2.1,2.3,9.8,1.5],"D":["a","b","b","a","c"],"F":[True,True,False,False,True]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    records = []
+    prof.reset()
+    prof.add_hook(records.append)
+    MyDataset.mean_att()
+    assert len(records) == 0 and not prof.is_enabled()
+    with prof.profile(memory=True):
+        MyDataset.mean_att()
+        MyDataset.mean_att()
+    prof.remove_hook(records.append)
+    MyDataset.variance_att()
+    report = MyDataset.profile_report()
+    assert report.loc["Dataset.mean_att","calls"] == 2 and report.loc["Dataset.summary_att","calls"] == 2
+    assert report.loc["Dataset.summary_att","misses"] == 0 and report.loc["Dataset.summary_att","hits"] == 4
+    assert report.loc["Dataset.mean_att","rows"] == 10 and report.loc["Dataset.mean_att","peak_bytes"] > 0
+    assert [record["depth"] for record in records] == [1,0,1,0]
+    assert "Dataset.variance_att" not in report.index
+    def failing(record):
+        raise ValueError(record["method"])
+    prof.add_hook(failing)
+    with prof.profile(), warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        assert MyDataset.mean_att()["A"] == 3.0
+    prof.remove_hook(failing)
+    assert any("Dataset.mean_att" in str(warning.message) for warning in caught)
+    monkeypatch.setattr(prof,"_RESET_PEAK",False)
+    prof.reset()
+    with prof.profile(memory=True):
+        MyDataset.mean_att()
+    assert all(record["peak_bytes"] is None and record["bytes"] is not None for record in prof.get_records())
+    prof.reset()
+
+#Tests that the lazy plans give the same data sets as the eager transformations, without modifying the source data set.
+def test_lazy():
+    data = pd.DataFrame({"A":[1,4,3,5,2,7],"B":[4.3,2.1,2.3,9.8,1.5,np.nan],"C":[1.0,1.0,1.0,1.0,1.0,1.0],"D":["a","b","b","a","c","a"],"E":["x","y","z","x","x","y"],"F":[True,True,False,False,True,False]})
+    MyDataset = dat.Dataset(data.copy(),"F")
+    lazy = MyDataset.lazy().normalize_att().standarize_att().remove_attribute("E").filter_by("variance","gt",0.5).to_categorical_attribute("D")
+    assert [step[0] for step in lazy.optimize()] == ["prune","normalize_att","standarize_att","remove_attribute","filter_by","to_categorical_attribute"]
+    result = lazy.collect()
+    assert MyDataset.to_dataframe().equals(data)
+    Eager = dat.Dataset(data.copy(),"F")
+    Eager.normalize_att()
+    Eager.standarize_att()
+    Eager.remove_attribute("E")
+    Eager.filter_by("variance","gt",0.5)
+    Eager.to_categorical_attribute("D")
+    assert list(result.attributes.keys()) == list(Eager.attributes.keys()) == ["A","B","C","D","F"]
+    assert np.allclose(result.to_dataframe()[["A","B","C"]],Eager.to_dataframe()[["A","B","C"]],equal_nan=True)
+    assert isinstance(result.get_attribute("D"),att.Categorical)
+    assert abs(result.variance("A")-1) < 1e-12 and result.get_attribute("A")._hits == 1
+    result = MyDataset.lazy().standarize("A").discretize("A","custom",cut_points=[0]).filter_by("entropy","ge",1.0).collect()
+    assert list(result.attributes.keys()) == ["A","B","C","D","E","F"] and result.get_attribute("A").get_codes().tolist() == [0,1,0,1,0,1]
+    try:
+        MyDataset.lazy().normalize("D").collect()
+        assert False
+    except NameError:
+        pass
+
+#Tests that the core modules can be imported in a new interpreter without loading the plotting libraries and IPython, which are imported when they are first used.
+def test_import_time():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(att.__file__)))
+    code = "import sys, datapack.dataset, datapack.lazy; print(' '.join(sorted({name.split('.')[0] for name in sys.modules} & {'matplotlib','seaborn','IPython'})))"
+    result = subprocess.run([sys.executable,"-X","importtime","-c",code],capture_output=True,text=True,cwd=root,check=True)
+    assert result.stdout.strip() == ""
+    assert any(line.endswith("| datapack.dataset") for line in result.stderr.splitlines())
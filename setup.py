@@ -13,10 +13,12 @@ setup(
    python_requires='>=3.7.0',
    tests_require=['pytest'],
    install_requires=[
-      "seaborn >= 0.11.0",
       "pandas >= 1.3.2",
-      "matplotlib >= 3.4.3",
-      "numpy >= 1.19.0",
-      "ipython >= 7.31.0"
+      "numpy >= 1.19.0"
    ],
+   extras_require={
+      "plots": ["seaborn >= 0.11.0", "matplotlib >= 3.4.3"],
+      "notebook": ["ipython >= 7.31.0"],
+      "all": ["seaborn >= 0.11.0", "matplotlib >= 3.4.3", "ipython >= 7.31.0"]
+   },
 )